@@ -0,0 +1,6 @@
+"""
+코딩 테스트 도우미 성능 측정 스크립트 모음
+
+네트워크 없이 로컬 대체 서버(fake_anthropic_server)를 사용해 측정한다.
+프로젝트 루트에서 `python -m benchmarks.<스크립트>` 형태로 실행한다.
+"""
@@ -0,0 +1,119 @@
+"""
+Agent 실행 방식 비교 (ReAct vs 구조화된 도구 호출)
+
+로컬 대체 서버가 각 방식에 맞는 응답(Thought/Action 텍스트 또는 tool_use 블록)을
+돌려주도록 하고, 요청당 모델 왕복 횟수, 입력/출력 토큰, 전체 소요 시간을 비교한다.
+
+실행:
+    python -m benchmarks.agent_modes --runs 5 --latency 0.2
+"""
+
+import os
+import json
+import time
+import argparse
+from typing import Any, Dict, List
+
+from .fake_anthropic_server import FakeAnthropicServer, DEFAULT_RESPONSE_TEXT
+
+
+PROBLEM = "두 정수 배열 nums1과 nums2의 교집합을 중복 없이 반환하세요."
+FINAL_ANSWER = "문제의 핵심은 중복 없는 교집합입니다. 어떤 자료구조가 중복을 자연스럽게 제거할까요?"
+
+
+def _last_user_text(body: Dict[str, Any]) -> str:
+    content = body["messages"][-1]["content"]
+    if isinstance(content, str):
+        return content
+    return json.dumps(content, ensure_ascii=False)
+
+
+def scripted_responder(body: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """요청 형태에 따라 도구 응답 / ReAct 텍스트 / tool_use 블록을 반환"""
+    system = body.get("system") or ""
+    if isinstance(system, list):
+        system = "".join(block.get("text", "") for block in system)
+
+    # 도구 내부 LLM 호출
+    if system.startswith("당신은 코딩 테스트 학습 도우미입니다."):
+        return [{"type": "text", "text": DEFAULT_RESPONSE_TEXT}]
+
+    last = _last_user_text(body)
+
+    # 구조화된 도구 호출 Agent
+    if body.get("tools"):
+        if "tool_result" in last:
+            return [{"type": "text", "text": FINAL_ANSWER}]
+        return [{
+            "type": "tool_use",
+            "id": f"toolu_{int(time.time() * 1e6)}",
+            "name": "analyze_problem",
+            "input": {"problem_description": PROBLEM},
+        }]
+
+    # ReAct Agent
+    if "Observation:" in last:
+        return [{"type": "text", "text": f"Thought: Do I need to use a tool? No\nFinal Answer: {FINAL_ANSWER}"}]
+    return [{
+        "type": "text",
+        "text": f"Thought: Do I need to use a tool? Yes\nAction: analyze_problem\nAction Input: {PROBLEM}",
+    }]
+
+
+def run_mode(server: FakeAnthropicServer, agent_mode: str, runs: int) -> Dict[str, Any]:
+    from coding_test_helper.agents import CodingTestAgent
+
+    agent = CodingTestAgent(agent_mode=agent_mode)
+    agent.agent_executor.verbose = False
+
+    server.reset_stats()
+    started = time.perf_counter()
+    for _ in range(runs):
+        agent.clear_memory()
+        agent.agent_executor.invoke({"input": f"이 문제를 봐주세요: {PROBLEM}"})
+    elapsed = time.perf_counter() - started
+
+    totals = server.token_totals()
+    return {
+        "mode": agent_mode,
+        "round_trips_per_request": server.request_count / runs,
+        "input_tokens_per_request": totals["input_tokens"] / runs,
+        "output_tokens_per_request": totals["output_tokens"] / runs,
+        "wall_time_per_request_s": elapsed / runs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ReAct / tool calling Agent 비교")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.2, help="요청당 첫 토큰 지연(초)")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    os.environ["CODING_TEST_HELPER_CACHE_DISABLED"] = "1"
+    os.environ.setdefault("ANTHROPIC_API_KEY", "fake-key")
+
+    with FakeAnthropicServer(
+        latency=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        responder=scripted_responder
+    ) as server:
+        os.environ["ANTHROPIC_BASE_URL"] = server.base_url
+        results = [run_mode(server, mode, args.runs) for mode in ("react", "tool_calling")]
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+
+    print(f"{'mode':<14}{'round trips':>12}{'input tok':>11}{'output tok':>11}{'wall s':>9}")
+    for result in results:
+        print(
+            f"{result['mode']:<14}{result['round_trips_per_request']:>12.1f}"
+            f"{result['input_tokens_per_request']:>11.0f}{result['output_tokens_per_request']:>11.0f}"
+            f"{result['wall_time_per_request_s']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
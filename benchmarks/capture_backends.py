@@ -0,0 +1,130 @@
+"""
+화면 캡처 백엔드 비교
+
+사용 가능한 백엔드(mss, pil, pyautogui)별로 전체 화면과 일부 영역을 반복 캡처해
+초당 프레임 수와 캡처당 지연(p50/p95)을 출력한다.
+디스플레이가 없는 환경에서는 --xvfb로 가상 X 서버(Xvfb)를 띄워 측정한다.
+
+실행:
+    python -m benchmarks.capture_backends --frames 30
+    python -m benchmarks.capture_backends --xvfb --screen 1920x1080 --json
+"""
+
+import os
+import json
+import time
+import shutil
+import argparse
+import subprocess
+from contextlib import contextmanager
+from typing import Optional
+
+from coding_test_helper.capture_backends import BACKENDS, available_backends
+
+
+@contextmanager
+def virtual_display(screen: str, display: str = ":99"):
+    """Xvfb를 띄우고 DISPLAY를 설정 (종료 시 정리)"""
+    if not shutil.which("Xvfb"):
+        raise RuntimeError("Xvfb가 설치되어 있지 않습니다. (예: apt install xvfb)")
+
+    process = subprocess.Popen(
+        ["Xvfb", display, "-screen", "0", f"{screen}x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    previous = os.environ.get("DISPLAY")
+    os.environ["DISPLAY"] = display
+    try:
+        # X 서버 소켓이 생길 때까지 대기
+        socket_path = f"/tmp/.X11-unix/X{display.lstrip(':')}"
+        deadline = time.perf_counter() + 5.0
+        while not os.path.exists(socket_path) and time.perf_counter() < deadline:
+            time.sleep(0.05)
+        yield display
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+        if previous is None:
+            os.environ.pop("DISPLAY", None)
+        else:
+            os.environ["DISPLAY"] = previous
+
+
+def percentile(values, ratio: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(backend, frames: int, region: Optional[tuple]) -> dict:
+    """한 백엔드/범위의 캡처 지연 측정 (첫 캡처는 준비 과정이므로 제외)"""
+    image = backend.grab(region)
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(frames):
+        frame_started = time.perf_counter()
+        backend.grab(region)
+        latencies.append((time.perf_counter() - frame_started) * 1000)
+    elapsed = time.perf_counter() - started
+    return {
+        "size": f"{image.width}x{image.height}",
+        "fps": frames / elapsed,
+        "p50_ms": percentile(latencies, 0.5),
+        "p95_ms": percentile(latencies, 0.95),
+    }
+
+
+def run(frames: int, region: tuple) -> dict:
+    results = {}
+    for name in available_backends():
+        backend = BACKENDS[name]()
+        try:
+            results[name] = {
+                "full": measure(backend, frames, None),
+                "region": measure(backend, frames, region),
+            }
+        except Exception as e:
+            results[name] = {"error": str(e)}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="화면 캡처 백엔드 비교")
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--region", default="0,0,800,600", help="left,top,width,height")
+    parser.add_argument("--xvfb", action="store_true", help="Xvfb 가상 디스플레이에서 측정")
+    parser.add_argument("--screen", default="1920x1080", help="Xvfb 화면 크기")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    region = tuple(int(value) for value in args.region.split(","))
+
+    if args.xvfb:
+        with virtual_display(args.screen):
+            results = run(args.frames, region)
+    else:
+        results = run(args.frames, region)
+
+    if args.json:
+        print(json.dumps({"frames": args.frames, "region": region, "backends": results}, indent=2))
+        return
+
+    if not results:
+        print("사용 가능한 캡처 백엔드가 없습니다. 'pip install mss'를 실행하세요.")
+        return
+
+    print(f"{'백엔드':<11}{'범위':<8}{'크기':>11}{'fps':>8}{'p50 ms':>9}{'p95 ms':>9}")
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name:<11}오류: {result['error']}")
+            continue
+        for scope, stats in result.items():
+            print(
+                f"{name:<11}{scope:<8}{stats['size']:>11}{stats['fps']:>8.1f}"
+                f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+LLM 클라이언트 연결 재사용 측정
+
+공유 레지스트리(get_llm)와 호출마다 새 ChatAnthropic을 만드는 방식을 비교하여
+요청 수 대비 새로 맺은 TCP 연결 수와 평균 지연을 출력한다.
+
+실행:
+    python -m benchmarks.connection_reuse --requests 20
+"""
+
+import os
+import time
+import argparse
+
+from .fake_anthropic_server import FakeAnthropicServer
+
+
+def _measure(server: FakeAnthropicServer, make_llm, requests: int) -> dict:
+    server.reset_stats()
+    started = time.perf_counter()
+    for _ in range(requests):
+        make_llm().invoke([{"role": "user", "content": "ping"}])
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": server.request_count,
+        "connections": server.connections,
+        "avg_latency_ms": elapsed / requests * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 클라이언트 연결 재사용 측정")
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with FakeAnthropicServer(latency=args.latency) as server:
+        os.environ["ANTHROPIC_BASE_URL"] = server.base_url
+        os.environ.setdefault("ANTHROPIC_API_KEY", "fake-key")
+
+        from langchain_anthropic import ChatAnthropic
+        from coding_test_helper.llm_registry import DEFAULT_MODEL, get_llm, warm_up
+
+        def fresh_llm():
+            return ChatAnthropic(
+                model=DEFAULT_MODEL,
+                api_key=os.environ["ANTHROPIC_API_KEY"],
+                base_url=server.base_url
+            )
+
+        fresh = _measure(server, fresh_llm, args.requests)
+
+        warm_up(background=False)
+        shared = _measure(server, get_llm, args.requests)
+
+    print(f"{'mode':<10}{'requests':>10}{'connections':>14}{'avg ms':>10}")
+    for name, result in (("fresh", fresh), ("shared", shared)):
+        print(f"{name:<10}{result['requests']:>10}{result['connections']:>14}{result['avg_latency_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+"""
+로컬 Anthropic 호환 대체 서버
+
+네트워크 없이 LLM 호출 경로를 측정하기 위한 /v1/messages 대체 서버.
+응답 지연(첫 토큰까지 시간)과 토큰 생성 속도를 조절할 수 있고,
+스트리밍(SSE)과 일반 응답을 모두 지원한다.
+
+사용 예:
+    with FakeAnthropicServer(latency=0.3, tokens_per_second=100) as server:
+        os.environ["ANTHROPIC_BASE_URL"] = server.base_url
+        ...
+"""
+
+import sys
+import json
+import time
+import uuid
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+
+DEFAULT_RESPONSE_TEXT = """## 📋 문제 요약
+로컬 대체 서버의 응답입니다.
+
+## 💡 힌트
+- 입력 크기와 제약 조건을 먼저 확인해보세요.
+- 중복 계산을 줄일 수 있는 자료구조가 있을까요?"""
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (4글자당 1토큰)"""
+    return max(1, len(text) // 4)
+
+
+def estimate_input_tokens(text: str) -> int:
+    """입력 토큰 수 (클라이언트의 memory.estimate_tokens와 같은 UTF-8 4바이트당 1토큰)"""
+    return max(1, len(text.encode("utf-8")) // 4)
+
+
+def _split_tokens(text: str) -> List[str]:
+    """스트리밍용 토큰 조각 (약 4글자 단위)"""
+    return [text[i:i + 4] for i in range(0, len(text), 4)] or [""]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 나눠 쓸 때 Nagle + 지연 ACK로 생기는 약 40ms 지연 방지
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        server: "FakeAnthropicServer" = self.server.owner
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        status, error = server.next_error()
+        if status is not None:
+            server.record_request(body, dict(self.headers))
+            payload = json.dumps({"type": "error", "error": {"type": "api_error", "message": error}}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+
+        started = time.perf_counter()
+        blocks = server.respond(body)
+        usage = server.usage_for(body, blocks)
+        server.record_request(body, dict(self.headers), usage)
+        if usage.get("cache_read_input_tokens") and server.cache_hit_latency is not None:
+            time.sleep(server.cache_hit_latency)
+        else:
+            time.sleep(server.current_latency())
+
+        if body.get("stream"):
+            self._write_stream(server, body, blocks, usage)
+        else:
+            self._write_message(server, body, blocks, usage)
+        server.record_service_time(started, time.perf_counter())
+
+    def _message(self, body: Dict[str, Any], blocks: List[Dict[str, Any]], usage: Dict[str, int]) -> Dict[str, Any]:
+        has_tool_use = any(block.get("type") == "tool_use" for block in blocks)
+        return {
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "fake-model"),
+            "content": blocks,
+            "stop_reason": "tool_use" if has_tool_use else "end_turn",
+            "stop_sequence": None,
+            "usage": usage,
+        }
+
+    def _write_message(self, server, body, blocks, usage):
+        output_text = "".join(block.get("text", "") for block in blocks)
+        time.sleep(server.generation_time(output_text))
+
+        payload = json.dumps(self._message(body, blocks, usage), ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _write_event(self, event: str, data: Dict[str, Any]):
+        line = f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+        self._write_chunk(line.encode("utf-8"))
+
+    def _write_stream(self, server, body, blocks, usage):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        message = self._message(body, [], dict(usage, output_tokens=1))
+        message["stop_reason"] = None
+        self._write_event("message_start", {"type": "message_start", "message": message})
+
+        for index, block in enumerate(blocks):
+            if block.get("type") == "tool_use":
+                start = dict(block, input={})
+                self._write_event("content_block_start", {"type": "content_block_start", "index": index, "content_block": start})
+                self._write_event("content_block_delta", {
+                    "type": "content_block_delta",
+                    "index": index,
+                    "delta": {"type": "input_json_delta", "partial_json": json.dumps(block.get("input", {}), ensure_ascii=False)},
+                })
+            else:
+                self._write_event("content_block_start", {"type": "content_block_start", "index": index, "content_block": {"type": "text", "text": ""}})
+                delay = 1.0 / server.tokens_per_second if server.tokens_per_second > 0 else 0.0
+                for piece in _split_tokens(block.get("text", "")):
+                    if delay:
+                        time.sleep(delay)
+                    self._write_event("content_block_delta", {
+                        "type": "content_block_delta",
+                        "index": index,
+                        "delta": {"type": "text_delta", "text": piece},
+                    })
+            self._write_event("content_block_stop", {"type": "content_block_stop", "index": index})
+
+        has_tool_use = any(block.get("type") == "tool_use" for block in blocks)
+        self._write_event("message_delta", {
+            "type": "message_delta",
+            "delta": {"stop_reason": "tool_use" if has_tool_use else "end_turn", "stop_sequence": None},
+            "usage": {"output_tokens": usage["output_tokens"]},
+        })
+        self._write_event("message_stop", {"type": "message_stop"})
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request = super().get_request()
+        self.owner.record_connection()
+        return request
+
+    def handle_error(self, request, client_address):
+        # 클라이언트가 응답 도중 연결을 끊는 경우(헤지 요청 취소 등)는 정상 동작
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class FakeAnthropicServer:
+    """로컬 Anthropic 호환 대체 서버
+
+    Args:
+        latency: 요청 수신 후 첫 토큰까지 지연(초) 또는 지연을 반환하는 함수
+        tokens_per_second: 출력 토큰 생성 속도 (0이면 즉시)
+        response_text: 기본 응답 텍스트
+        responder: 요청 본문을 받아 content 블록 리스트를 반환하는 함수
+        min_cacheable_tokens: 프롬프트 캐시를 적용할 최소 접두부 토큰 수
+        tool_use_system_tokens: tools 필드가 있을 때 API가 덧붙이는 도구 사용 안내 토큰 수
+        cache_hit_latency: 프롬프트 캐시 적중 시 첫 토큰 지연(초, None이면 latency와 동일)
+        host: 바인딩 주소
+        port: 포트 (0이면 자동 할당)
+    """
+
+    def __init__(
+        self,
+        latency: Any = 0.0,
+        tokens_per_second: float = 0.0,
+        response_text: str = DEFAULT_RESPONSE_TEXT,
+        responder: Optional[Callable[[Dict[str, Any]], List[Dict[str, Any]]]] = None,
+        min_cacheable_tokens: int = 0,
+        tool_use_system_tokens: int = 0,
+        cache_hit_latency: Optional[float] = None,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.response_text = response_text
+        self.responder = responder
+        self.min_cacheable_tokens = min_cacheable_tokens
+        self.tool_use_system_tokens = tool_use_system_tokens
+        self.cache_hit_latency = cache_hit_latency
+        self._prompt_cache = set()
+
+        self._lock = threading.Lock()
+        self._errors: List[tuple] = []
+        self.requests: List[Dict[str, Any]] = []
+        self.connections = 0
+        self._service_intervals: List[tuple] = []
+
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.owner = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeAnthropicServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeAnthropicServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def record_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    def record_request(self, body: Dict[str, Any], headers: Dict[str, str],
+                       usage: Optional[Dict[str, int]] = None):
+        with self._lock:
+            self.requests.append({
+                "body": body,
+                "headers": headers,
+                "usage": usage,
+                "received_at": time.time(),
+            })
+
+    def record_service_time(self, started: float, finished: float):
+        """응답 처리 구간(지연 + 생성) 기록 (클라이언트 측 오버헤드 계산용)"""
+        with self._lock:
+            self._service_intervals.append((started, finished))
+
+    @property
+    def service_seconds(self) -> float:
+        """서버가 하나 이상의 요청을 처리 중이던 시간 합계 (겹치는 구간은 한 번만 계산)"""
+        with self._lock:
+            intervals = sorted(self._service_intervals)
+        total = 0.0
+        current_start = current_end = None
+        for start, end in intervals:
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    total += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            total += current_end - current_start
+        return total
+
+    def inject_errors(self, status: int, count: int = 1, message: str = "injected error"):
+        """다음 count개 요청에 오류 응답 (재시도 테스트용)"""
+        with self._lock:
+            self._errors.extend([(status, message)] * count)
+
+    def next_error(self):
+        with self._lock:
+            if self._errors:
+                return self._errors.pop(0)
+        return None, None
+
+    def current_latency(self) -> float:
+        return self.latency() if callable(self.latency) else float(self.latency)
+
+    def generation_time(self, text: str) -> float:
+        if self.tokens_per_second <= 0:
+            return 0.0
+        return estimate_tokens(text) / self.tokens_per_second
+
+    def respond(self, body: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if self.responder is not None:
+            return self.responder(body)
+        return [{"type": "text", "text": self.response_text}]
+
+    def _cacheable_prefix(self, body: Dict[str, Any]) -> Optional[str]:
+        """tools → system → messages 순서에서 마지막 cache_control 지점까지의 접두부"""
+        parts: List[Any] = []
+        prefix_end = None
+
+        system = body.get("system")
+        if isinstance(system, str):
+            system = [{"type": "text", "text": system}]
+        sections = [body.get("tools") or [], system or []]
+        for message in body.get("messages", []):
+            content = message.get("content")
+            sections.append(content if isinstance(content, list) else [{"type": "text", "text": content}])
+
+        for section in sections:
+            for block in section:
+                parts.append(block)
+                if isinstance(block, dict) and block.get("cache_control"):
+                    prefix_end = len(parts)
+
+        if prefix_end is None:
+            return None
+        return json.dumps(parts[:prefix_end], ensure_ascii=False, sort_keys=True)
+
+    def usage_for(self, body: Dict[str, Any], blocks: List[Dict[str, Any]]) -> Dict[str, int]:
+        request_text = json.dumps(
+            {key: body.get(key) for key in ("system", "messages", "tools")},
+            ensure_ascii=False
+        )
+        output_text = json.dumps(blocks, ensure_ascii=False)
+        tool_use_tokens = self.tool_use_system_tokens if body.get("tools") else 0
+        usage = {
+            "input_tokens": estimate_input_tokens(request_text) + tool_use_tokens,
+            "output_tokens": estimate_tokens(output_text),
+            "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 0,
+        }
+
+        prefix = self._cacheable_prefix(body)
+        if prefix is not None:
+            prefix_tokens = estimate_input_tokens(prefix) + tool_use_tokens
+            if prefix_tokens >= self.min_cacheable_tokens:
+                digest = hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+                with self._lock:
+                    hit = digest in self._prompt_cache
+                    self._prompt_cache.add(digest)
+                field = "cache_read_input_tokens" if hit else "cache_creation_input_tokens"
+                usage[field] = prefix_tokens
+                usage["input_tokens"] = max(1, usage["input_tokens"] - prefix_tokens)
+        return usage
+
+    @property
+    def request_count(self) -> int:
+        with self._lock:
+            return len(self.requests)
+
+    def token_totals(self) -> Dict[str, int]:
+        """받은 요청들의 입력/출력 토큰 합계"""
+        totals = {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 0,
+        }
+        with self._lock:
+            for request in self.requests:
+                for key, value in (request["usage"] or {}).items():
+                    totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def reset_stats(self):
+        with self._lock:
+            self.requests.clear()
+            self.connections = 0
+            self._service_intervals.clear()
@@ -0,0 +1,125 @@
+"""
+헤지 요청 꼬리 지연 측정
+
+로컬 가짜 서버에 일부 요청만 느리게 응답하는 지연 분포를 주고,
+헤지 없이 / 헤지 적용 시 첫 토큰 지연(TTFT)의 p50/p95/p99와 추가 요청 수를 비교한다.
+
+실행:
+    python -m benchmarks.hedging --requests 200 --slow-ratio 0.05
+    python -m benchmarks.hedging --json
+"""
+
+import os
+import time
+import json
+import random
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from .fake_anthropic_server import FakeAnthropicServer
+
+
+def percentile(values, ratio: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def tail_latency(base: float, slow: float, slow_ratio: float, seed: int):
+    """대부분 base초, slow_ratio 비율만 slow초 걸리는 지연 함수"""
+    rng = random.Random(seed)
+
+    def latency() -> float:
+        return slow if rng.random() < slow_ratio else base * rng.uniform(0.8, 1.2)
+
+    return latency
+
+
+def _measure(server, llm, requests: int, concurrency: int, policy=None) -> dict:
+    from coding_test_helper.hedging import hedged_stream
+
+    messages = [{"role": "user", "content": "ping"}]
+
+    def one_call(_):
+        started = time.perf_counter()
+        chunks = llm.stream(messages) if policy is None else hedged_stream(lambda: llm.stream(messages), policy)
+        ttft = None
+        for _chunk in chunks:
+            if ttft is None:
+                ttft = time.perf_counter() - started
+        return ttft * 1000
+
+    server.reset_stats()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        ttfts = list(pool.map(one_call, range(requests)))
+
+    result = {
+        "requests": requests,
+        "server_requests": server.request_count,
+        "p50_ms": percentile(ttfts, 0.5),
+        "p95_ms": percentile(ttfts, 0.95),
+        "p99_ms": percentile(ttfts, 0.99),
+        "max_ms": max(ttfts),
+    }
+    if policy is not None:
+        result["hedge"] = policy.get_stats()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="헤지 요청 꼬리 지연 측정")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--base", type=float, default=0.05, help="보통 요청 지연(초)")
+    parser.add_argument("--slow", type=float, default=1.0, help="느린 요청 지연(초)")
+    parser.add_argument("--slow-ratio", type=float, default=0.05)
+    parser.add_argument("--max-hedge-ratio", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    latency = tail_latency(args.base, args.slow, args.slow_ratio, args.seed)
+    with FakeAnthropicServer(latency=latency) as server:
+        os.environ["ANTHROPIC_BASE_URL"] = server.base_url
+        os.environ.setdefault("ANTHROPIC_API_KEY", "fake-key")
+        # 스케줄러의 분당 요청 제한이 지연을 지배하지 않도록 한도를 넉넉히 설정
+        os.environ.setdefault("CODING_TEST_HELPER_RPM", "100000")
+        os.environ.setdefault("CODING_TEST_HELPER_TPM", "100000000")
+        os.environ.setdefault("CODING_TEST_HELPER_MAX_CONCURRENCY", str(args.concurrency * 2))
+
+        from coding_test_helper.llm_registry import get_llm
+        from coding_test_helper.hedging import HedgingPolicy
+
+        llm = get_llm()
+        baseline = _measure(server, llm, args.requests, args.concurrency)
+
+        policy = HedgingPolicy(
+            enabled=True,
+            min_delay=args.base,
+            initial_delay=args.base * 4,
+            max_hedge_ratio=args.max_hedge_ratio,
+            max_concurrent_hedges=args.concurrency
+        )
+        # 기준 시간(p95) 산정용 표본을 먼저 채움
+        _measure(server, llm, 30, args.concurrency, policy)
+        hedged = _measure(server, llm, args.requests, args.concurrency, policy)
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "baseline": baseline, "hedged": hedged}, indent=2))
+        return
+
+    print(f"{'mode':<10}{'server req':>12}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for name, result in (("baseline", baseline), ("hedged", hedged)):
+        print(
+            f"{name:<10}{result['server_requests']:>12}{result['p50_ms']:>9.1f}"
+            f"{result['p95_ms']:>9.1f}{result['p99_ms']:>9.1f}{result['max_ms']:>9.1f}"
+        )
+    stats = hedged["hedge"]
+    print(
+        f"\n헤지 {stats['hedged']}회 (승리 {stats['hedge_wins']}회, 예산 초과로 생략 {stats['skipped_by_budget']}회), "
+        f"기준 시간 {stats['hedge_delay'] * 1000:.0f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+스크린샷 인코딩 비교
+
+screenshots/의 캡처 이미지를 여러 방식으로 인코딩해
+파일 크기, 인코딩 시간, 이미지 토큰 추정치를 비교한다.
+(기존 방식인 원본 해상도 PNG 저장이 기준)
+
+실행:
+    python -m benchmarks.image_encoding --token-budget 1600
+    python -m benchmarks.image_encoding --json
+"""
+
+import io
+import json
+import time
+import argparse
+from pathlib import Path
+
+from PIL import Image
+
+from coding_test_helper.image_pipeline import (
+    DEFAULT_TOKEN_BUDGET,
+    estimate_image_tokens,
+    prepare_image,
+)
+
+
+def encode_original_png(image: Image.Image) -> dict:
+    """기존 캡처 경로: 원본 해상도 PNG"""
+    started_at = time.perf_counter()
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return {
+        "bytes": buffer.tell(),
+        "encode_ms": (time.perf_counter() - started_at) * 1000,
+        "size": f"{image.width}x{image.height}",
+        "tokens": estimate_image_tokens(image.width, image.height),
+    }
+
+
+def encode_with_pipeline(image: Image.Image, **options) -> dict:
+    encoded = prepare_image(image, **options)
+    return {
+        "bytes": encoded.size_bytes,
+        "encode_ms": encoded.encode_seconds * 1000,
+        "size": f"{encoded.width}x{encoded.height}",
+        "tokens": encoded.estimated_tokens,
+        "format": encoded.format,
+        "grayscale": encoded.grayscale,
+    }
+
+
+def benchmark_image(path: Path, token_budget: int) -> dict:
+    image = Image.open(path)
+    image.load()
+    variants = {
+        "original_png": encode_original_png(image),
+        "resized_png": encode_with_pipeline(image, max_tokens=token_budget, grayscale=False, image_format="PNG"),
+        "resized_jpeg": encode_with_pipeline(image, max_tokens=token_budget, grayscale=False, image_format="JPEG"),
+        "resized_webp": encode_with_pipeline(image, max_tokens=token_budget, grayscale=False, image_format="WEBP"),
+        "adaptive": encode_with_pipeline(image, max_tokens=token_budget),
+    }
+    return {"file": path.name, "variants": variants}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스크린샷 인코딩 비교")
+    parser.add_argument("--dir", default="screenshots")
+    parser.add_argument("--token-budget", type=int, default=DEFAULT_TOKEN_BUDGET)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    paths = sorted(Path(args.dir).glob("*.png"))
+    if not paths:
+        print(f"{args.dir}에 PNG 스크린샷이 없습니다.")
+        return
+
+    results = [benchmark_image(path, args.token_budget) for path in paths]
+
+    # 방식별 합계
+    totals = {}
+    for result in results:
+        for name, variant in result["variants"].items():
+            total = totals.setdefault(name, {"bytes": 0, "encode_ms": 0.0, "tokens": 0})
+            for field in total:
+                total[field] += variant[field]
+
+    if args.json:
+        print(json.dumps({"token_budget": args.token_budget, "images": results, "totals": totals}, indent=2))
+        return
+
+    for result in results:
+        print(f"\n📸 {result['file']}")
+        print(f"  {'방식':<14}{'크기':>11}{'KB':>9}{'인코딩 ms':>11}{'토큰':>7}")
+        for name, variant in result["variants"].items():
+            print(
+                f"  {name:<14}{variant['size']:>11}{variant['bytes'] / 1024:>9.0f}"
+                f"{variant['encode_ms']:>11.1f}{variant['tokens']:>7}"
+            )
+
+    baseline = totals["original_png"]
+    print(f"\n합계 ({len(results)}장, 기준: original_png)")
+    for name, total in totals.items():
+        print(
+            f"  {name:<14}{total['bytes'] / 1024:>9.0f}KB ({total['bytes'] / baseline['bytes']:>5.1%})"
+            f"{total['encode_ms']:>9.0f}ms{total['tokens']:>8} 토큰"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+프롬프트 캐싱 확인
+
+응답 캐시를 끈 상태에서 서로 다른 문제로 Agent를 여러 번 실행하고,
+요청마다 모델 호출들의 캐시 적중(읽기)/생성/미캐시 입력 토큰과 지연을 출력한다.
+캐시 지점은 Agent의 고정 접두부(도구 스키마 + 시스템 프롬프트) 끝에 있으며,
+대체 서버는 실제 API처럼 MIN_CACHEABLE_TOKENS보다 짧은 접두부는 캐시하지 않는다.
+클라이언트도 그보다 짧은 접두부는 캐시 표시를 하지 않으므로, 캐시 적중이 나오는 것은
+tool_calling Agent의 접두부뿐이다 (ReAct 접두부와 도구 내부 호출의 시스템 프롬프트는 짧아 적중 0이 정상).
+
+실행:
+    python -m benchmarks.prompt_cache --requests 3 --latency 0.4 --cache-hit-latency 0.2
+"""
+
+import os
+import time
+import argparse
+
+from .agent_modes import scripted_responder
+from .fake_anthropic_server import FakeAnthropicServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프롬프트 캐싱 확인")
+    parser.add_argument("--requests", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.4)
+    parser.add_argument("--cache-hit-latency", type=float, default=None)
+    parser.add_argument("--agent-mode", choices=("tool_calling", "react"), default="tool_calling")
+    args = parser.parse_args()
+
+    os.environ["CODING_TEST_HELPER_CACHE_DISABLED"] = "1"
+    os.environ.setdefault("ANTHROPIC_API_KEY", "fake-key")
+
+    from coding_test_helper.prompt_cache import MIN_CACHEABLE_TOKENS, TOOL_USE_SYSTEM_TOKENS
+
+    with FakeAnthropicServer(
+        latency=args.latency,
+        cache_hit_latency=args.cache_hit_latency,
+        responder=scripted_responder,
+        min_cacheable_tokens=MIN_CACHEABLE_TOKENS,
+        tool_use_system_tokens=TOOL_USE_SYSTEM_TOKENS
+    ) as server:
+        os.environ["ANTHROPIC_BASE_URL"] = server.base_url
+
+        from coding_test_helper.agents import CodingTestAgent
+
+        agent = CodingTestAgent(agent_mode=args.agent_mode)
+        agent.agent_executor.verbose = False
+        server.reset_stats()
+
+        print(f"{'#':<3}{'calls':>6}{'cache read':>11}{'cache write':>12}{'uncached':>10}{'latency ms':>12}")
+        for index in range(args.requests):
+            agent.clear_memory()
+            calls_before = server.request_count
+            started = time.perf_counter()
+            agent.agent_executor.invoke({"input": f"문제 {index}: 배열의 최댓값을 구하세요."})
+            elapsed = (time.perf_counter() - started) * 1000
+            calls = [request["usage"] for request in server.requests[calls_before:]]
+            print(
+                f"{index + 1:<3}{len(calls):>6}"
+                f"{sum(usage['cache_read_input_tokens'] for usage in calls):>11}"
+                f"{sum(usage['cache_creation_input_tokens'] for usage in calls):>12}"
+                f"{sum(usage['input_tokens'] for usage in calls):>10}{elapsed:>12.0f}"
+            )
+
+        totals = server.token_totals()
+        cached = totals["cache_read_input_tokens"]
+        prompt_tokens = totals["input_tokens"] + cached + totals["cache_creation_input_tokens"]
+        print(f"\n캐시된 입력 비율: {cached / max(prompt_tokens, 1):.0%} (최소 캐시 접두부 {MIN_CACHEABLE_TOKENS} 토큰)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""
+코딩 테스트 도우미 종합 성능 측정
+
+로컬 대체 서버(지연, 토큰 생성 속도 설정 가능)를 띄우고 주요 진입점을 끝까지 실행해
+시나리오별로 다음 항목을 측정한다.
+
+- 프레임워크 오버헤드: 순차 실행 시 (클라이언트 소요 시간 - 서버 처리 시간 - 예제 채점 시간) / 호출 수
+  (Chain, AgentExecutor, @tool 래퍼, 프롬프트 구성 등 네트워크 밖의 비용)
+- 로컬 코드 실행 시간: 예제 채점(judge)과 실행 시간 실측(profiler) 하위 프로세스 시간 / 호출 수
+  (실측은 모델 호출과 동시에 진행되므로 오버헤드에서 빼지 않고 따로만 보고)
+- 호출당 모델 왕복 횟수, 입력/출력 토큰
+- 지연 p50/p95/p99
+- 동시 실행 처리량(호출/초)
+
+결과는 JSON으로 저장하며, --baseline으로 이전 결과와 비교해 기준 이상 느려지면 실패 코드로 종료한다.
+--record로 요청/응답을 카세트에 기록해 두면 --replay로 대체 서버 없이 같은 응답을 재생해 측정한다.
+
+실행:
+    python -m benchmarks.suite --runs 10 --concurrency 4 --output bench.json
+    python -m benchmarks.suite --baseline bench.json --tolerance 0.2
+    python -m benchmarks.suite --record suite.cassette.jsonl.gz
+    python -m benchmarks.suite --replay suite.cassette.jsonl.gz --time-scale 1.0
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .agent_modes import scripted_responder
+from .fake_anthropic_server import FakeAnthropicServer, DEFAULT_RESPONSE_TEXT
+
+
+PROBLEM = """두 정수 배열 nums1과 nums2가 주어질 때 두 배열의 교집합을 중복 없이 반환하세요.
+
+입력: nums1 = [1,2,2,1], nums2 = [2,2]
+출력: [2]
+
+제약: 1 <= nums1.length, nums2.length <= 1000"""
+
+CODE = """def intersection(nums1, nums2):
+    result = []
+    for x in nums1:
+        if x in nums2 and x not in result:
+            result.append(x)
+    return result"""
+
+DEBUG_REQUEST = f"""다음 코드가 시간 초과가 납니다. 어디를 봐야 할까요?
+
+{CODE}"""
+
+# 라우터가 특정 도구로 보내지 않는 자유 형식 요청 (ReAct 루프 실행)
+AGENT_REQUEST = "요즘 공부 방향이 고민인데 같이 생각해줄 수 있어?"
+
+# 진입점이 예외 대신 반환하는 오류 문자열
+ERROR_MARKER = "오류가 발생했습니다"
+
+
+def suite_responder(body: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """ReAct/도구 호출 Agent 요청은 형식에 맞는 응답, 나머지는 기본 응답"""
+    request_text = json.dumps([body.get("system"), body.get("messages")], ensure_ascii=False)
+    if body.get("tools") or "Action Input" in request_text:
+        return scripted_responder(body)
+    return [{"type": "text", "text": DEFAULT_RESPONSE_TEXT}]
+
+
+def percentile(values: List[float], ratio: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class CassetteStats:
+    """재생 모드에서 대체 서버 대신 요청 수, 토큰, 처리 시간을 제공"""
+
+    def __init__(self, cassette):
+        self.cassette = cassette
+
+    def reset_stats(self):
+        self.cassette.reset_log()
+
+    @property
+    def request_count(self) -> int:
+        return len(self.cassette.log)
+
+    def token_totals(self) -> Dict[str, int]:
+        from coding_test_helper.cassette import summarize
+        return summarize(self.cassette.log)
+
+    @property
+    def service_seconds(self) -> float:
+        return self.cassette.service_seconds
+
+
+class LocalExecutionTimer:
+    """모델 호출이 아닌 로컬 코드 실행(예제 채점, 실행 시간 실측) 시간 집계
+
+    chains 모듈이 호출하는 judge_submission/profile_submission을 감싸 누적 시간을 잰다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seconds = {"judge": 0.0, "profiler": 0.0}
+
+    def install(self):
+        from coding_test_helper import chains
+        chains.judge_submission = self._wrap("judge", chains.judge_submission)
+        chains.profile_submission = self._wrap("profiler", chains.profile_submission)
+
+    def _wrap(self, name: str, func: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self.seconds[name] += elapsed
+        return timed
+
+    def reset(self):
+        with self._lock:
+            self.seconds = dict.fromkeys(self.seconds, 0.0)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self.seconds)
+
+
+def build_scenarios() -> Dict[str, Callable[[], str]]:
+    """시나리오 이름 → 한 번 실행하는 함수"""
+    from coding_test_helper.agents import CodingTestAgent
+    from coding_test_helper.chains import analyze_new_problem, review_code_submission, provide_debugging_guidance
+
+    # Agent는 대화 메모리를 가지므로 스레드마다 따로 생성
+    local = threading.local()
+
+    def agent_request() -> str:
+        agent = getattr(local, "agent", None)
+        if agent is None:
+            agent = local.agent = CodingTestAgent()
+            agent.agent_executor.verbose = False
+        agent.clear_memory()
+        return agent.process_request(AGENT_REQUEST)
+
+    return {
+        "analyze_new_problem": lambda: analyze_new_problem(PROBLEM),
+        "review_code_submission": lambda: review_code_submission(CODE, PROBLEM),
+        "provide_debugging_guidance": lambda: provide_debugging_guidance(DEBUG_REQUEST),
+        "agent_process_request": agent_request,
+    }
+
+
+def _timed(func: Callable[[], str]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    output = func()
+    return {"seconds": time.perf_counter() - started, "error": ERROR_MARKER in str(output)}
+
+
+def run_scenario(server, func: Callable[[], str], runs: int, concurrency: int,
+                 timer: Optional[LocalExecutionTimer] = None) -> Dict[str, Any]:
+    """한 시나리오 측정 (순차 실행 후 동시 실행)"""
+    # 준비 (import, 클라이언트 생성, 연결 수립)
+    func()
+
+    server.reset_stats()
+    timer = timer or LocalExecutionTimer()
+    timer.reset()
+    sequential = [_timed(func) for _ in range(runs)]
+    client_seconds = sum(result["seconds"] for result in sequential)
+    totals = server.token_totals()
+    round_trips = server.request_count
+    service_seconds = server.service_seconds
+    local_seconds = timer.snapshot()
+
+    server.reset_stats()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        concurrent = list(pool.map(lambda _: _timed(func), range(runs * concurrency)))
+    concurrent_elapsed = time.perf_counter() - started
+
+    latencies = [result["seconds"] * 1000 for result in sequential]
+    concurrent_latencies = [result["seconds"] * 1000 for result in concurrent]
+    return {
+        "runs": runs,
+        "errors": sum(result["error"] for result in sequential + concurrent),
+        "round_trips_per_call": round_trips / runs,
+        "input_tokens_per_call": totals["input_tokens"] / runs,
+        "output_tokens_per_call": totals["output_tokens"] / runs,
+        "cached_tokens_per_call": totals.get("cache_read_input_tokens", 0) / runs,
+        "overhead_ms_per_call": (client_seconds - service_seconds - local_seconds["judge"]) / runs * 1000,
+        "judge_ms_per_call": local_seconds["judge"] / runs * 1000,
+        "profiler_ms_per_call": local_seconds["profiler"] / runs * 1000,
+        "p50_ms": percentile(latencies, 0.5),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "concurrency": concurrency,
+        "concurrent_p95_ms": percentile(concurrent_latencies, 0.95),
+        "throughput_per_s": len(concurrent) / concurrent_elapsed,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """baseline 대비 tolerance 비율 이상 나빠진 항목 목록"""
+    regressions = []
+    for name, result in current["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        for key in ("round_trips_per_call", "input_tokens_per_call", "overhead_ms_per_call", "p95_ms"):
+            if previous[key] > 0 and result[key] > previous[key] * (1 + tolerance):
+                regressions.append(f"{name}.{key}: {previous[key]:.1f} → {result[key]:.1f}")
+        if result["throughput_per_s"] < previous["throughput_per_s"] * (1 - tolerance):
+            regressions.append(
+                f"{name}.throughput_per_s: {previous['throughput_per_s']:.1f} → {result['throughput_per_s']:.1f}"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="코딩 테스트 도우미 종합 성능 측정")
+    parser.add_argument("--runs", type=int, default=10, help="시나리오별 순차 실행 횟수")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.05, help="요청당 첫 토큰 지연(초)")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--scenario", action="append", help="실행할 시나리오 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: 표준 출력)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 악화 비율")
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument("--record", metavar="CASSETTE", help="요청/응답을 카세트에 기록")
+    cassette_group.add_argument("--replay", metavar="CASSETTE", help="대체 서버 없이 카세트 재생")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="재생 시간 배율 (0: 즉시)")
+    args = parser.parse_args()
+
+    # 응답 캐시와 스케줄러 속도 제한이 측정을 가리지 않도록 설정
+    os.environ["CODING_TEST_HELPER_CACHE_DISABLED"] = "1"
+    os.environ.setdefault("ANTHROPIC_API_KEY", "fake-key")
+    os.environ.setdefault("CODING_TEST_HELPER_RPM", "100000")
+    os.environ.setdefault("CODING_TEST_HELPER_TPM", "100000000")
+    os.environ.setdefault("CODING_TEST_HELPER_MAX_CONCURRENCY", str(args.concurrency * 4))
+
+    if args.record or args.replay:
+        os.environ["CODING_TEST_HELPER_CASSETTE"] = args.record or args.replay
+        os.environ["CODING_TEST_HELPER_CASSETTE_MODE"] = "record" if args.record else "replay"
+        os.environ["CODING_TEST_HELPER_CASSETTE_TIME_SCALE"] = str(args.time_scale)
+
+    if args.replay:
+        server_context = nullcontext()
+    else:
+        server_context = FakeAnthropicServer(
+            latency=args.latency,
+            tokens_per_second=args.tokens_per_second,
+            responder=suite_responder
+        )
+
+    with server_context as server:
+        if server is None:
+            from coding_test_helper.cassette import get_cassette
+            os.environ.setdefault("ANTHROPIC_BASE_URL", "http://cassette.invalid")
+            cassette = get_cassette()
+            server = CassetteStats(cassette)
+        else:
+            os.environ["ANTHROPIC_BASE_URL"] = server.base_url
+        scenarios = build_scenarios()
+        timer = LocalExecutionTimer()
+        timer.install()
+        selected = args.scenario or list(scenarios)
+        results = {
+            name: run_scenario(server, scenarios[name], args.runs, args.concurrency, timer)
+            for name in selected
+        }
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "config": {
+            "runs": args.runs,
+            "concurrency": args.concurrency,
+            "latency": args.latency,
+            "tokens_per_second": args.tokens_per_second,
+            "record": args.record,
+            "replay": args.replay,
+            "time_scale": args.time_scale,
+        },
+        "scenarios": results,
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"⚠️ 성능 저하: {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
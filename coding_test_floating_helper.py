@@ -11,10 +11,14 @@ import sys
 import json
 import tkinter as tk
 from tkinter import messagebox, ttk
+import time
 import threading
 from pathlib import Path
 from datetime import datetime
 
+# 시작 시간 측정 기준점
+_PROCESS_START = time.perf_counter()
+
 # 환경변수 로드 (선택적)
 try:
     from dotenv import load_dotenv
@@ -43,45 +47,91 @@ except ImportError:
     print("Pillow 패키지가 설치되지 않았습니다. 'pip install Pillow'를 실행하세요.")
     PIL_AVAILABLE = False
 
-# 코딩 테스트 도우미 모듈 import
+# 코딩 테스트 도우미 모듈 (LangChain 포함)은 창을 먼저 띄운 뒤 백그라운드에서 불러온다
 LANGCHAIN_AVAILABLE = False
-try:
-    from coding_test_helper.agents import get_coding_test_agent
-    from coding_test_helper.chains import (
-        analyze_new_problem,
-        review_code_submission,
-        provide_debugging_guidance
-    )
-    from coding_test_helper.ui_components import (
-        ProgressiveHintDialog,
-        ProblemInputDialog,
-        LearningProgressTracker
-    )
-    LANGCHAIN_AVAILABLE = True
-    print("✅ LangChain 모듈 로드 완료")
-except ImportError as e:
-    print(f"⚠️ LangChain 모듈을 불러올 수 없습니다: {e}")
-    print("📦 다음 명령어로 의존성을 설치하세요:")
-    print("   pip install -r requirements.txt")
-    print("🔄 기본 모드로 실행됩니다 (화면 캡처만 가능)")
-
-    # 기본 클래스들 정의 (LangChain 없이도 실행 가능하도록)
-    class ProgressiveHintDialog:
-        def __init__(self, *args, **kwargs):
-            messagebox.showwarning("기능 제한", "LangChain이 설치되지 않아 힌트 기능을 사용할 수 없습니다.")
-
-    class ProblemInputDialog:
-        def __init__(self, *args, **kwargs):
-            self.result = None
-            messagebox.showwarning("기능 제한", "LangChain이 설치되지 않아 문제 분석 기능을 사용할 수 없습니다.")
-
-    class LearningProgressTracker:
-        def __init__(self, *args, **kwargs):
-            pass
-        def get_tracker_frame(self):
-            return tk.Frame()
-        def update_progress(self, *args, **kwargs):
-            pass
+analyze_screen = None
+analyze_new_problem = None
+review_code_submission = None
+provide_debugging_guidance = None
+run_streaming = None
+provide_hint = None
+warm_up = None
+record_action = None
+
+
+# 기본 클래스들 정의 (LangChain 없이도 실행 가능하도록, 모듈 로드 성공 시 교체됨)
+class ProgressiveHintDialog:
+    def __init__(self, *args, **kwargs):
+        messagebox.showwarning("기능 제한", "LangChain이 설치되지 않아 힌트 기능을 사용할 수 없습니다.")
+
+
+class ProblemInputDialog:
+    def __init__(self, *args, **kwargs):
+        self.result = None
+        messagebox.showwarning("기능 제한", "LangChain이 설치되지 않아 문제 분석 기능을 사용할 수 없습니다.")
+
+
+class LearningProgressTracker:
+    def __init__(self, *args, **kwargs):
+        pass
+    def get_tracker_frame(self):
+        return tk.Frame()
+    def update_progress(self, *args, **kwargs):
+        pass
+
+
+class PerformanceHUD:
+    def __init__(self, *args, **kwargs):
+        pass
+    def get_hud_frame(self):
+        return tk.Frame()
+
+
+def load_coding_test_modules() -> bool:
+    """코딩 테스트 도우미 모듈 import
+
+    LangChain 등 무거운 의존성을 불러오므로 GUI를 띄운 뒤 백그라운드 스레드에서 호출한다.
+
+    Returns:
+        모듈 로드 성공 여부
+    """
+    global LANGCHAIN_AVAILABLE, analyze_screen, analyze_new_problem, review_code_submission
+    global provide_debugging_guidance, ProgressiveHintDialog, ProblemInputDialog, LearningProgressTracker
+    global PerformanceHUD, run_streaming, provide_hint, warm_up, record_action
+
+    try:
+        from coding_test_helper.vision import analyze_screen
+        from coding_test_helper.chains import (
+            analyze_new_problem,
+            review_code_submission,
+            provide_debugging_guidance
+        )
+        from coding_test_helper.ui_components import (
+            ProgressiveHintDialog,
+            ProblemInputDialog,
+            LearningProgressTracker,
+            PerformanceHUD
+        )
+        from coding_test_helper.session_metrics import record_action
+        from coding_test_helper.streaming import run_streaming
+        from coding_test_helper.tools import provide_hint
+        from coding_test_helper.llm_registry import warm_up
+        LANGCHAIN_AVAILABLE = True
+        print("✅ LangChain 모듈 로드 완료")
+    except ImportError as e:
+        print(f"⚠️ LangChain 모듈을 불러올 수 없습니다: {e}")
+        print("📦 다음 명령어로 의존성을 설치하세요:")
+        print("   pip install -r requirements.txt")
+        print("🔄 기본 모드로 실행됩니다 (화면 캡처만 가능)")
+        LANGCHAIN_AVAILABLE = False
+    return LANGCHAIN_AVAILABLE
+
+
+# 스트리밍 결과 창 갱신 주기 (ms)
+STREAM_POLL_INTERVAL_MS = 50
+
+# 화면 캡처 범위: 전체 화면 / 마지막으로 선택한 영역 / 활성 창
+CAPTURE_MODES = ["full", "region", "window"]
 
 
 class CodingTestFloatingHelper:
@@ -92,32 +142,213 @@ class CodingTestFloatingHelper:
         self.screenshots_dir = Path("screenshots")
         self.screenshots_dir.mkdir(exist_ok=True)
         
-        # LangChain Agent 초기화
-        if LANGCHAIN_AVAILABLE:
-            try:
-                self.agent = get_coding_test_agent()
-                self.console.print("[green]✅ 코딩 테스트 Agent 초기화 완료[/green]")
-            except Exception as e:
-                self.console.print(f"[red]❌ Agent 초기화 실패: {e}[/red]")
-                self.agent = None
-        else:
-            self.agent = None
-        
+        # LangChain 모듈은 창을 띄운 뒤 준비
+        self._modules_ready = threading.Event()
+
+        # 반복 캡처 비교용 직전 프레임 기록 (첫 캡처 시 생성)
+        self.capture_history = None
+        self._last_capture_input = None
+
+        # 캡처 이미지 백그라운드 저장기 (첫 캡처 시 생성)와 마지막 캡처→요청 지연(ms)
+        self.screenshot_writer = None
+        self.capture_latency_ms = None
+
+        # 화면 캡처 백엔드("auto", "mss", "pil", "pyautogui")와 캡처 범위 (설정 파일에 저장)
+        self.capture_backend_name = "auto"
+        self.capture_backend = None
+        self.capture_mode = "full"
+        self.capture_region = None
+
         # 현재 모드 (일반/코딩테스트)
         self.current_mode = "coding_test"
 
-        # 학습 진행 상황 추적기 초기화
-        if LANGCHAIN_AVAILABLE:
-            self.progress_tracker = None  # GUI 설정 후 초기화
-        else:
-            self.progress_tracker = None
+        # 힌트 다이얼로그에서 미리 생성할 다음 힌트 단계 수
+        self.hint_prefetch_depth = 1
+
+        # 마지막으로 분석한 문제 (코드 리뷰 시 예제 채점에 사용)
+        self.last_problem_description = ""
+
+        # 학습 진행 상황 추적기와 성능 패널 (모듈 로드 후 초기화)
+        self.progress_tracker = None
+        self.performance_hud = None
 
         # GUI 설정
         self.setup_gui()
 
         # 설정 로드
         self.load_settings()
-    
+
+        # 첫 화면이 그려진 뒤 모듈 로드 시작
+        self.root.after_idle(self._start_module_loading)
+
+    def _start_module_loading(self):
+        """창 표시 후 백그라운드에서 LangChain 모듈 로드"""
+        self.console.print(f"[cyan]🕒 창 표시까지 {time.perf_counter() - _PROCESS_START:.2f}초[/cyan]")
+        self.status_label.config(text="⏳ AI 모듈 로딩 중...", fg="#f39c12")
+
+        def load_thread():
+            started_at = time.perf_counter()
+            loaded = load_coding_test_modules()
+            if loaded:
+                # API 연결을 미리 맺어 첫 요청의 TCP/TLS 지연 제거
+                warm_up()
+            elapsed = time.perf_counter() - started_at
+            self.root.after(0, lambda: self._on_modules_loaded(loaded, elapsed))
+
+        threading.Thread(target=load_thread, name="module-loader", daemon=True).start()
+
+    def _on_modules_loaded(self, loaded: bool, elapsed: float):
+        """모듈 로드 완료 처리 (GUI 스레드)"""
+        self._modules_ready.set()
+        self.console.print(f"[cyan]🕒 모듈 로드 {elapsed:.2f}초[/cyan]")
+
+        if not loaded:
+            self.status_label.config(text="🟡 기본 모드 (화면 캡처만 가능)", fg="#f1c40f")
+            return
+
+        # 학습 진행 상황 추적기 추가
+        try:
+            self.progress_tracker = LearningProgressTracker(self.main_frame)
+            tracker_frame = self.progress_tracker.get_tracker_frame()
+            tracker_frame.pack(fill=tk.X, pady=5)
+        except:
+            self.progress_tracker = None
+
+        # 성능 패널 (응답 시간, 토큰/비용, 캐시, 대기열, UI 지연)
+        try:
+            self.performance_hud = PerformanceHUD(self.main_frame)
+            self.performance_hud.get_hud_frame().pack(fill=tk.X, pady=(0, 5))
+        except Exception as e:
+            self.console.print(f"[yellow]⚠️ 성능 패널을 만들 수 없습니다: {e}[/yellow]")
+            self.performance_hud = None
+
+        self.status_label.config(text="🟢 준비됨", fg="#2ecc71")
+
+    def _ensure_modules(self) -> bool:
+        """AI 기능 사용 가능 여부 확인 (불가능하면 안내 메시지 표시)"""
+        if not self._modules_ready.is_set():
+            messagebox.showinfo("잠시만요", "AI 모듈을 불러오는 중입니다. 잠시 후 다시 시도해주세요.")
+            return False
+        if not LANGCHAIN_AVAILABLE:
+            messagebox.showerror("오류", "LangChain이 설치되지 않았습니다.")
+            return False
+        return True
+
+    def _analyze_capture(self, user_input: str, screenshot, diff, capture_started: float) -> str:
+        """캡처한 화면을 한 번의 멀티모달 호출로 분석 (백그라운드 스레드)
+
+        캡처와 비교는 결과 창을 열기 전에 capture_and_analyze에서 끝내므로 여기서는
+        인코딩과 API 호출만 한다.
+        직전 캡처와 화면/요청이 같으면 호출하지 않고 이전 분석을 재사용하고,
+        일부만 바뀌었으면 바뀐 영역 이미지와 이전 분석 요약만 보낸다.
+        분석이 실패하면 예외가 그대로 전달되어 캡처 기록은 갱신되지 않는다.
+        """
+        if diff is not None and diff.should_skip and self._last_capture_input == user_input:
+            return f"🔁 직전 캡처와 화면이 같아 이전 분석 결과를 표시합니다.\n\n{diff.previous_analysis}"
+
+        _, frames = self._encode_capture(screenshot, diff)
+        self._report_capture_latency(capture_started)
+        result = analyze_screen(
+            frames,
+            user_input,
+            context=diff.describe() if diff is not None else ""
+        )
+        self._remember_capture(screenshot, user_input, result)
+        return result
+
+    def _grab_screen(self):
+        """설정된 백엔드와 캡처 범위로 화면 캡처"""
+        from coding_test_helper.capture_backends import get_active_window_region, get_capture_backend
+
+        if self.capture_backend is None:
+            self.capture_backend = get_capture_backend(self.capture_backend_name)
+            if self.capture_backend is None:
+                raise RuntimeError("사용 가능한 화면 캡처 백엔드가 없습니다. 'pip install mss'를 실행하세요.")
+
+        region = None
+        if self.capture_mode == "region":
+            region = self.capture_region
+        elif self.capture_mode == "window":
+            region = get_active_window_region()
+            if region is None:
+                self.console.print("[yellow]⚠️ 활성 창을 찾지 못해 전체 화면을 캡처합니다.[/yellow]")
+        return self.capture_backend.grab(region)
+
+    def _capture_with_history(self):
+        """화면을 캡처하고 직전 캡처와 비교
+
+        Returns:
+            (캡처 이미지, FrameDiff) - numpy가 없으면 FrameDiff는 None
+        """
+        screenshot = self._grab_screen()
+        try:
+            from coding_test_helper.capture_history import CaptureHistory
+        except ImportError:
+            return screenshot, None
+
+        if self.capture_history is None:
+            self.capture_history = CaptureHistory()
+        return screenshot, self.capture_history.compare(screenshot)
+
+    def on_capture_mode_change(self, event=None):
+        """캡처 범위 변경 처리"""
+        self.capture_mode = self.capture_mode_var.get()
+        if self.capture_mode == "region" and self.capture_region is None:
+            self.select_capture_region()
+
+    def select_capture_region(self):
+        """드래그로 캡처 영역 선택 (선택한 영역은 설정에 저장되어 다음 실행에도 사용)"""
+        from coding_test_helper.ui_components import RegionSelectDialog
+
+        dialog = RegionSelectDialog(self.root)
+        if dialog.result:
+            self.capture_region = dialog.result
+            self.capture_mode = "region"
+            self.status_label.config(text=f"✂️ 캡처 영역: {dialog.result[2]}x{dialog.result[3]}", fg="#2ecc71")
+        elif self.capture_region is None:
+            self.capture_mode = "full"
+        self.capture_mode_var.set(self.capture_mode)
+
+    def _encode_capture(self, screenshot, diff=None):
+        """캡처(또는 바뀐 영역)를 메모리에서 바로 인코딩
+
+        요청에는 토큰 예산에 맞춘 축소본을 쓰고, 디스크에는 원본 프레임을 저장한다.
+        원본의 PNG 인코딩과 파일 쓰기는 백그라운드 저장기가 맡으므로 요청 경로에서 빠진다.
+
+        Returns:
+            (원본이 저장될 경로, [EncodedImage])
+        """
+        from coding_test_helper.image_pipeline import prepare_image
+        from coding_test_helper.screenshot_store import get_screenshot_writer
+
+        if self.screenshot_writer is None:
+            self.screenshot_writer = get_screenshot_writer(self.screenshots_dir)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = self.screenshot_writer.save_image(f"screen_{timestamp}.png", screenshot)
+        images = diff.crops() if diff is not None else [screenshot]
+        return path, [prepare_image(image) for image in images]
+
+    def _report_capture_latency(self, capture_started: float) -> float:
+        """캡처 시작부터 요청 전송 직전까지 걸린 시간을 상태 표시줄에 표시
+
+        Returns:
+            소요 시간 (ms)
+        """
+        elapsed_ms = (time.perf_counter() - capture_started) * 1000
+        self.capture_latency_ms = elapsed_ms
+        self.root.after(0, lambda: self.status_label.config(
+            text=f"🔄 분석 중... (캡처→요청 {elapsed_ms:.0f}ms)", fg="#f39c12"
+        ))
+        return elapsed_ms
+
+    def _remember_capture(self, screenshot, user_input: str, analysis: str):
+        """분석을 마친 캡처를 다음 비교 기준으로 저장"""
+        if screenshot is None or self.capture_history is None:
+            return
+        self.capture_history.remember(screenshot, analysis)
+        self._last_capture_input = user_input
+
     def setup_gui(self):
         """GUI 설정"""
         self.root = tk.Tk()
@@ -133,6 +364,7 @@ class CodingTestFloatingHelper:
         # 메인 프레임
         main_frame = tk.Frame(self.root, bg='#2c3e50', padx=10, pady=10)
         main_frame.pack(fill=tk.BOTH, expand=True)
+        self.main_frame = main_frame
         
         # 제목
         title_label = tk.Label(
@@ -233,7 +465,35 @@ class CodingTestFloatingHelper:
             padx=15,
             pady=8
         )
-        capture_btn.pack(fill=tk.X, pady=10)
+        capture_btn.pack(fill=tk.X, pady=(10, 2))
+
+        # 캡처 범위 선택 (전체 화면 / 선택 영역 / 활성 창)
+        capture_mode_frame = tk.Frame(main_frame, bg="#2c3e50")
+        capture_mode_frame.pack(fill=tk.X, pady=(0, 10))
+
+        tk.Label(capture_mode_frame, text="범위:", fg="#ecf0f1", bg="#2c3e50").pack(side=tk.LEFT)
+
+        self.capture_mode_var = tk.StringVar(value=self.capture_mode)
+        capture_mode_combo = ttk.Combobox(
+            capture_mode_frame,
+            textvariable=self.capture_mode_var,
+            values=CAPTURE_MODES,
+            state="readonly",
+            width=8
+        )
+        capture_mode_combo.pack(side=tk.LEFT, padx=(5, 0))
+        capture_mode_combo.bind('<<ComboboxSelected>>', self.on_capture_mode_change)
+
+        tk.Button(
+            capture_mode_frame,
+            text="✂️ 영역 선택",
+            command=self.select_capture_region,
+            bg="#16a085",
+            fg="white",
+            font=("Arial", 9),
+            relief=tk.FLAT,
+            padx=5
+        ).pack(side=tk.RIGHT)
         
         # 상태 표시
         self.status_label = tk.Label(
@@ -267,15 +527,6 @@ class CodingTestFloatingHelper:
         
         # 기본 프롬프트 설정
         self.prompt_text.insert("1.0", "이 문제를 어떻게 접근해야 할까요?")
-
-        # 학습 진행 상황 추적기 추가
-        if LANGCHAIN_AVAILABLE and self.progress_tracker is None:
-            try:
-                self.progress_tracker = LearningProgressTracker(main_frame)
-                tracker_frame = self.progress_tracker.get_tracker_frame()
-                tracker_frame.pack(fill=tk.X, pady=5)
-            except:
-                self.progress_tracker = None
     
     def on_mode_change(self, event=None):
         """모드 변경 처리"""
@@ -312,6 +563,19 @@ class CodingTestFloatingHelper:
                 if 'position' in config:
                     x, y = config['position']
                     self.root.geometry(f"+{x}+{y}")
+
+                # 힌트 prefetch 단계 수
+                self.hint_prefetch_depth = int(config.get('hint_prefetch_depth', self.hint_prefetch_depth))
+
+                # 화면 캡처 백엔드와 범위 (마지막으로 선택한 영역 포함)
+                self.capture_backend_name = config.get('capture_backend', self.capture_backend_name)
+                if config.get('capture_region'):
+                    self.capture_region = tuple(config['capture_region'])
+                if config.get('capture_mode') in CAPTURE_MODES:
+                    self.capture_mode = config['capture_mode']
+                    if self.capture_mode == "region" and self.capture_region is None:
+                        self.capture_mode = "full"
+                    self.capture_mode_var.set(self.capture_mode)
                     
             except Exception as e:
                 self.console.print(f"[yellow]⚠️ 설정 로드 실패: {e}[/yellow]")
@@ -321,7 +585,11 @@ class CodingTestFloatingHelper:
         try:
             config = {
                 'position': [self.root.winfo_x(), self.root.winfo_y()],
-                'mode': self.current_mode
+                'mode': self.current_mode,
+                'hint_prefetch_depth': self.hint_prefetch_depth,
+                'capture_backend': self.capture_backend_name,
+                'capture_mode': self.capture_mode,
+                'capture_region': list(self.capture_region) if self.capture_region else None
             }
             
             with open("coding_test_helper_config.json", 'w', encoding='utf-8') as f:
@@ -332,8 +600,7 @@ class CodingTestFloatingHelper:
 
     def analyze_problem(self):
         """문제 분석 실행"""
-        if not LANGCHAIN_AVAILABLE or not self.agent:
-            messagebox.showerror("오류", "LangChain이 설치되지 않았습니다.")
+        if not self._ensure_modules():
             return
 
         # 문제 입력 다이얼로그 사용
@@ -342,63 +609,45 @@ class CodingTestFloatingHelper:
             return
 
         problem_description = problem_dialog.result
+        self.last_problem_description = problem_description
 
         self.status_label.config(text="🔄 문제 분석 중...", fg="#f39c12")
-        self.root.update()
-
-        def analyze_thread():
-            try:
-                result = analyze_new_problem(problem_description)
-                self.root.after(0, lambda: self.show_result("문제 분석 결과", result))
-                self.root.after(0, lambda: self.status_label.config(text="✅ 분석 완료", fg="#2ecc71"))
-
-                # 진행 상황 업데이트
-                if self.progress_tracker:
-                    self.progress_tracker.update_progress("problems_analyzed")
-
-            except Exception as e:
-                error_msg = f"문제 분석 중 오류 발생: {e}"
-                self.root.after(0, lambda: messagebox.showerror("오류", error_msg))
-                self.root.after(0, lambda: self.status_label.config(text="❌ 오류", fg="#e74c3c"))
-
-        threading.Thread(target=analyze_thread, daemon=True).start()
+        self.show_streaming_result(
+            "문제 분석 결과",
+            analyze_new_problem,
+            problem_description,
+            done_text="✅ 분석 완료",
+            error_prefix="문제 분석 중 오류 발생",
+            progress_action="problems_analyzed"
+        )
 
     def review_code(self):
         """코드 리뷰 실행"""
-        if not LANGCHAIN_AVAILABLE or not self.agent:
-            messagebox.showerror("오류", "LangChain이 설치되지 않았습니다.")
+        if not self._ensure_modules():
             return
 
-        # 코드 입력 다이얼로그
-        code_dialog = CodeInputDialog(self.root)
+        # 코드 입력 다이얼로그 (분석한 문제가 있으면 예제 채점을 위해 미리 채움)
+        code_dialog = CodeInputDialog(self.root, self.last_problem_description)
         if code_dialog.result:
             code = code_dialog.result['code']
             problem = code_dialog.result['problem']
+            profile = code_dialog.result.get('profile', False)
 
             self.status_label.config(text="🔄 코드 리뷰 중...", fg="#f39c12")
-            self.root.update()
-
-            def review_thread():
-                try:
-                    result = review_code_submission(code, problem)
-                    self.root.after(0, lambda: self.show_result("코드 리뷰 결과", result))
-                    self.root.after(0, lambda: self.status_label.config(text="✅ 리뷰 완료", fg="#2ecc71"))
-
-                    # 진행 상황 업데이트
-                    if self.progress_tracker:
-                        self.progress_tracker.update_progress("codes_reviewed")
-
-                except Exception as e:
-                    error_msg = f"코드 리뷰 중 오류 발생: {e}"
-                    self.root.after(0, lambda: messagebox.showerror("오류", error_msg))
-                    self.root.after(0, lambda: self.status_label.config(text="❌ 오류", fg="#e74c3c"))
-
-            threading.Thread(target=review_thread, daemon=True).start()
+            self.show_streaming_result(
+                "코드 리뷰 결과",
+                review_code_submission,
+                code,
+                problem,
+                profile,
+                done_text="✅ 리뷰 완료",
+                error_prefix="코드 리뷰 중 오류 발생",
+                progress_action="codes_reviewed"
+            )
 
     def request_hint(self):
         """힌트 요청 실행"""
-        if not LANGCHAIN_AVAILABLE or not self.agent:
-            messagebox.showerror("오류", "LangChain이 설치되지 않았습니다.")
+        if not self._ensure_modules():
             return
 
         # 문제 설명 가져오기
@@ -413,12 +662,19 @@ class CodingTestFloatingHelper:
         # 단계별 힌트 다이얼로그 열기
         def hint_provider_func(problem_desc, current_progress, hint_type):
             """힌트 제공 함수"""
-            from coding_test_helper.tools import HintProviderTool
-            hint_tool = HintProviderTool()
-            return hint_tool._run(problem_desc, current_progress, hint_type)
+            return provide_hint.invoke({
+                "problem_description": problem_desc,
+                "current_progress": current_progress,
+                "hint_type": hint_type
+            })
 
         # 단계별 힌트 다이얼로그 실행
-        ProgressiveHintDialog(self.root, problem_description, hint_provider_func)
+        ProgressiveHintDialog(
+            self.root,
+            problem_description,
+            hint_provider_func,
+            prefetch_depth=self.hint_prefetch_depth
+        )
 
         # 진행 상황 업데이트
         if self.progress_tracker:
@@ -426,8 +682,7 @@ class CodingTestFloatingHelper:
 
     def debug_help(self):
         """디버깅 도움 실행"""
-        if not LANGCHAIN_AVAILABLE or not self.agent:
-            messagebox.showerror("오류", "LangChain이 설치되지 않았습니다.")
+        if not self._ensure_modules():
             return
 
         user_input = self.prompt_text.get("1.0", tk.END).strip()
@@ -435,24 +690,14 @@ class CodingTestFloatingHelper:
             user_input = "화면의 에러를 분석하고 디버깅 도움을 주세요."
 
         self.status_label.config(text="🔄 디버깅 분석 중...", fg="#f39c12")
-        self.root.update()
-
-        def debug_thread():
-            try:
-                result = provide_debugging_guidance(user_input)
-                self.root.after(0, lambda: self.show_result("디버깅 가이드", result))
-                self.root.after(0, lambda: self.status_label.config(text="✅ 분석 완료", fg="#2ecc71"))
-
-                # 진행 상황 업데이트
-                if self.progress_tracker:
-                    self.progress_tracker.update_progress("debugging_sessions")
-
-            except Exception as e:
-                error_msg = f"디버깅 분석 중 오류 발생: {e}"
-                self.root.after(0, lambda: messagebox.showerror("오류", error_msg))
-                self.root.after(0, lambda: self.status_label.config(text="❌ 오류", fg="#e74c3c"))
-
-        threading.Thread(target=debug_thread, daemon=True).start()
+        self.show_streaming_result(
+            "디버깅 가이드",
+            provide_debugging_guidance,
+            user_input,
+            done_text="✅ 분석 완료",
+            error_prefix="디버깅 분석 중 오류 발생",
+            progress_action="debugging_sessions"
+        )
 
     def capture_and_analyze(self):
         """화면 캡처 및 분석"""
@@ -461,17 +706,36 @@ class CodingTestFloatingHelper:
             user_input = "이 화면을 분석해주세요."
 
         self.status_label.config(text="🔄 캡처 및 분석 중...", fg="#f39c12")
+
+        if self._modules_ready.is_set() and LANGCHAIN_AVAILABLE:
+            # 결과 창이 찍히지 않도록 창을 열기 전에 캡처하고 직전 프레임과 비교
+            capture_started = time.perf_counter()
+            try:
+                screenshot, diff = self._capture_with_history()
+            except Exception as e:
+                messagebox.showerror("오류", f"화면 캡처 실패: {e}")
+                self.status_label.config(text="❌ 오류", fg="#e74c3c")
+                return
+
+            # 캡처 이미지를 직접 비전 모델로 분석 (Agent를 거치지 않음)
+            self.show_streaming_result(
+                "화면 분석 결과",
+                self._analyze_capture,
+                user_input,
+                screenshot,
+                diff,
+                capture_started,
+                done_text="✅ 분석 완료",
+                error_prefix="화면 분석 중 오류 발생"
+            )
+            return
+
         self.root.update()
 
         def capture_thread():
             try:
-                if LANGCHAIN_AVAILABLE and self.agent:
-                    # LangChain Agent 사용
-                    request = f"화면을 캡처하고 분석해주세요. 요청사항: {user_input}"
-                    result = self.agent.process_request(request)
-                else:
-                    # 기본 화면 캡처 (fallback)
-                    result = self.basic_screen_capture(user_input)
+                # 기본 화면 캡처 (fallback)
+                result = self.basic_screen_capture(user_input)
 
                 self.root.after(0, lambda: self.show_result("화면 분석 결과", result))
                 self.root.after(0, lambda: self.status_label.config(text="✅ 분석 완료", fg="#2ecc71"))
@@ -485,26 +749,95 @@ class CodingTestFloatingHelper:
     def basic_screen_capture(self, user_input: str) -> str:
         """기본 화면 캡처 (LangChain 없을 때 fallback)"""
         try:
-            # pyautogui 동적 import
-            try:
-                import pyautogui
-            except ImportError:
-                return "❌ pyautogui 패키지가 설치되지 않았습니다.\n'pip install pyautogui'를 실행하세요."
+            capture_started = time.perf_counter()
+            screenshot, diff = self._capture_with_history()
+            if diff is not None and diff.should_skip:
+                return f"🔁 직전 캡처와 화면이 같아 새로 저장하지 않았습니다.\n\n{diff.previous_analysis}"
 
-            # 화면 캡처
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            image_path = self.screenshots_dir / f"screen_{timestamp}.png"
+            # 요청용은 토큰 예산에 맞게 축소/압축 (일부만 바뀌었으면 바뀐 영역만), 원본 저장은 백그라운드
+            path, frames = self._encode_capture(screenshot, diff)
+            elapsed_ms = self._report_capture_latency(capture_started)
 
-            screenshot = pyautogui.screenshot()
-            screenshot.save(image_path)
+            lines = [f"📸 화면이 캡처되었습니다: {path}"]
+            lines.extend(f"🖼️ {encoded.summary()}" for encoded in frames)
+            if diff is not None and diff.describe():
+                lines.append(diff.describe())
+            lines.append(f"⏱️ 캡처→요청 준비 {elapsed_ms:.0f}ms")
 
-            return f"📸 화면이 캡처되었습니다: {image_path}\n\n💡 LangChain을 설치하면 AI 분석 기능을 사용할 수 있습니다.\n\n📦 설치 명령어:\npip install -r requirements.txt"
+            result = "\n".join(lines) + "\n\n💡 LangChain을 설치하면 AI 분석 기능을 사용할 수 있습니다.\n\n📦 설치 명령어:\npip install -r requirements.txt"
+            self._remember_capture(screenshot, user_input, result)
+            return result
 
         except Exception as e:
             return f"화면 캡처 실패: {e}\n\n💡 macOS에서는 시스템 환경설정 > 보안 및 개인정보보호 > 개인정보보호 > 화면 기록에서 Python 또는 터미널 권한을 허용해야 합니다."
 
+    def show_streaming_result(self, title: str, func, *args, done_text: str = "✅ 분석 완료",
+                              error_prefix: str = "분석 중 오류 발생", progress_action: str = None):
+        """결과 창을 먼저 열고 응답 토큰을 스트리밍으로 표시
+
+        func은 백그라운드 스레드에서 실행되고, 토큰은 root.after 주기마다 모아서 추가된다.
+        완료되면 창 내용을 최종 결과로 교체한다.
+
+        Args:
+            title: 결과 창 제목
+            func: 결과 문자열을 반환하는 함수
+            *args: func 인자
+            done_text: 완료 시 상태 표시 문구
+            error_prefix: 오류 메시지 접두어
+            progress_action: 완료 시 갱신할 학습 진행 항목
+        """
+        stream = run_streaming(func, *args)
+        text_widget = self.show_result(title, "")
+        first_token_shown = [False]
+
+        def set_text(content: str, replace: bool = False):
+            if not text_widget.winfo_exists():
+                return
+            text_widget.config(state=tk.NORMAL)
+            if replace:
+                text_widget.delete("1.0", tk.END)
+            text_widget.insert(tk.END, content)
+            text_widget.see(tk.END)
+            text_widget.config(state=tk.DISABLED)
+
+        def poll():
+            tokens, done = stream.drain()
+            if tokens:
+                set_text("".join(tokens))
+                if not first_token_shown[0] and stream.time_to_first_token is not None:
+                    first_token_shown[0] = True
+                    self.status_label.config(
+                        text=f"🔄 응답 수신 중... (첫 토큰 {stream.time_to_first_token:.1f}초)",
+                        fg="#f39c12"
+                    )
+
+            if not done:
+                self.root.after(STREAM_POLL_INTERVAL_MS, poll)
+                return
+
+            if stream.error is not None:
+                error_msg = f"{error_prefix}: {stream.error}"
+                messagebox.showerror("오류", error_msg)
+                self.status_label.config(text="❌ 오류", fg="#e74c3c")
+                return
+
+            if stream.result is not None:
+                set_text(stream.result, replace=True)
+            self.status_label.config(text=f"{done_text} ({stream.total_time:.1f}초)", fg="#2ecc71")
+            record_action(title, stream.total_time)
+
+            # 진행 상황 업데이트
+            if progress_action and self.progress_tracker:
+                self.progress_tracker.update_progress(progress_action)
+
+        poll()
+
     def show_result(self, title: str, content: str):
-        """결과 표시"""
+        """결과 표시
+
+        Returns:
+            결과 텍스트 위젯
+        """
         result_window = tk.Toplevel(self.root)
         result_window.title(f"🤖 {title}")
         result_window.geometry("700x600")
@@ -540,7 +873,7 @@ class CodingTestFloatingHelper:
         copy_btn = tk.Button(
             button_frame,
             text="📋 복사",
-            command=lambda: self.copy_to_clipboard(content),
+            command=lambda: self.copy_to_clipboard(text_widget.get("1.0", "end-1c")),
             bg="#3498db",
             fg="white",
             font=("Arial", 10),
@@ -564,6 +897,8 @@ class CodingTestFloatingHelper:
         )
         close_btn.pack(side=tk.RIGHT)
 
+        return text_widget
+
     def copy_to_clipboard(self, text: str):
         """클립보드에 복사"""
         self.root.clipboard_clear()
@@ -584,13 +919,16 @@ class CodingTestFloatingHelper:
     def on_closing(self):
         """종료 처리"""
         self.save_settings()
+        if self.screenshot_writer is not None:
+            # 아직 저장되지 않은 캡처 마무리
+            self.screenshot_writer.close()
         self.root.destroy()
 
 
 class CodeInputDialog:
     """코드 입력 다이얼로그"""
 
-    def __init__(self, parent):
+    def __init__(self, parent, problem: str = ""):
         self.result = None
 
         # 다이얼로그 창 생성
@@ -608,12 +946,23 @@ class CodeInputDialog:
         tk.Label(main_frame, text="문제 설명:", font=("Arial", 10, "bold")).pack(anchor=tk.W)
         self.problem_text = tk.Text(main_frame, height=4, font=("Consolas", 9))
         self.problem_text.pack(fill=tk.X, pady=(5, 10))
+        if problem:
+            self.problem_text.insert("1.0", problem)
 
         # 코드 입력
         tk.Label(main_frame, text="코드:", font=("Arial", 10, "bold")).pack(anchor=tk.W)
         self.code_text = tk.Text(main_frame, height=15, font=("Consolas", 9))
         self.code_text.pack(fill=tk.BOTH, expand=True, pady=(5, 10))
 
+        # 실행 시간 실측 여부 (입력 크기를 늘려 가며 로컬에서 실행)
+        self.profile_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            main_frame,
+            text="⏱ 실행 시간 실측 (입력 크기별 측정, 최대 N 예상 시간)",
+            variable=self.profile_var,
+            font=("Arial", 9)
+        ).pack(anchor=tk.W, pady=(0, 10))
+
         # 버튼 프레임
         button_frame = tk.Frame(main_frame)
         button_frame.pack(fill=tk.X)
@@ -646,8 +995,8 @@ class CodeInputDialog:
         )
         cancel_btn.pack(side=tk.RIGHT)
 
-        # 포커스 설정
-        self.problem_text.focus_set()
+        # 포커스 설정 (문제가 채워져 있으면 코드 입력부터)
+        (self.code_text if problem else self.problem_text).focus_set()
 
         # 대화상자가 닫힐 때까지 대기
         self.dialog.wait_window()
@@ -663,7 +1012,8 @@ class CodeInputDialog:
 
         self.result = {
             'problem': problem,
-            'code': code
+            'code': code,
+            'profile': self.profile_var.get()
         }
         self.dialog.destroy()
 
@@ -674,6 +1024,12 @@ class CodeInputDialog:
 
 def main():
     """메인 실행 함수"""
+    if "--profile-imports" in sys.argv[1:]:
+        # 창을 띄우지 않고 모듈별 import 시간만 출력
+        from coding_test_helper.startup_profile import profile_imports, format_report
+        print(format_report(profile_imports(cwd=str(project_root))))
+        return
+
     try:
         helper = CodingTestFloatingHelper()
         helper.run()
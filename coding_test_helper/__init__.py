@@ -3,23 +3,25 @@
 
 LangChain을 활용한 학습 중심 코딩 테스트 도우미
 정답 코드를 직접 제공하지 않고 단계별 힌트와 학습 가이드를 제공
+
+LangChain 등 무거운 의존성은 각 이름에 처음 접근할 때 불러온다.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "AI Coding Assistant"
 
-from .tools import (
-    analyze_problem,
-    review_code,
-    provide_hint
-)
-
-from .agents import CodingTestAgent
-from .chains import (
-    ProblemOnboardingChain,
-    CodeSubmissionReviewChain,
-    DebuggingGuidanceChain
-)
+# 공개 이름 → 정의된 하위 모듈
+_LAZY_ATTRIBUTES = {
+    "analyze_problem": ".tools",
+    "review_code": ".tools",
+    "provide_hint": ".tools",
+    "CodingTestAgent": ".agents",
+    "ProblemOnboardingChain": ".chains",
+    "CodeSubmissionReviewChain": ".chains",
+    "DebuggingGuidanceChain": ".chains",
+}
 
 __all__ = [
     "analyze_problem",
@@ -30,3 +32,16 @@ __all__ = [
     "CodeSubmissionReviewChain",
     "DebuggingGuidanceChain"
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -4,13 +4,12 @@
 LangChain Agent를 활용하여 사용자의 요청에 따라 적절한 Tool을 선택하고 실행
 """
 
-import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
-from langchain.agents import AgentExecutor, create_react_agent
-from langchain_core.prompts import ChatPromptTemplate
+from langchain.agents import AgentExecutor, create_react_agent, create_tool_calling_agent
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.tools import Tool
-from langchain_anthropic import ChatAnthropic
+from langchain.tools.render import render_text_description
 from langchain.memory import ConversationBufferWindowMemory
 
 from .tools import (
@@ -18,55 +17,21 @@ from .tools import (
     review_code,
     provide_hint
 )
+from .llm_registry import DEFAULT_MODEL, get_llm
+from .memory import PromptSizeTracker, TokenBudgetMemory, content_text
+from .prompt_cache import cacheable_system_message
+from .router import INTENT_AGENT, route_request
+from .streaming import iter_streaming
+from .usage import UsageCallbackHandler
 
 
-class CodingTestAgent:
-    """코딩 테스트 도우미 Agent
-    
-    사용자의 요청을 분석하여 적절한 도구를 선택하고 실행하는 중앙 제어 시스템
-    학습 중심 접근 방식으로 정답 코드를 직접 제공하지 않고 힌트와 가이드 제공
-    """
-    
-    def __init__(self, memory_window: int = 5):
-        """Agent 초기화
-        
-        Args:
-            memory_window: 기억할 대화 수 (기본값: 5)
-        """
-        self.llm = ChatAnthropic(
-            model="claude-3-5-sonnet-20241022",
-            api_key=os.getenv("ANTHROPIC_API_KEY"),
-            temperature=0.1
-        )
-        
-        # Tools 초기화
-        self.tools = self._initialize_tools()
-        
-        # Memory 설정
-        self.memory = ConversationBufferWindowMemory(
-            memory_key="chat_history",
-            return_messages=True,
-            k=memory_window
-        )
-        
-        # Agent 생성
-        self.agent_executor = self._create_agent()
-    
-    def _initialize_tools(self) -> List[Tool]:
-        """도구들 초기화"""
-        # 함수 기반 도구들 사용
-        tools = [
-            analyze_problem,
-            review_code,
-            provide_hint
-        ]
+# Agent 실행 방식
+AGENT_MODE_REACT = "react"
+AGENT_MODE_TOOL_CALLING = "tool_calling"
+AGENT_MODES = (AGENT_MODE_REACT, AGENT_MODE_TOOL_CALLING)
 
-        return tools
-    
-    def _create_agent(self) -> AgentExecutor:
-        """Agent 생성"""
-        # 시스템 프롬프트 정의
-        system_prompt = """
+# 시스템 프롬프트 정의
+AGENT_SYSTEM_PROMPT = """
 당신은 코딩 테스트 학습 도우미 AI입니다. 다음 원칙을 반드시 지켜주세요:
 
 🎯 **핵심 원칙**
@@ -91,9 +56,9 @@ class CodingTestAgent:
 
 사용자의 요청에 따라 적절한 도구를 사용하여 도움을 제공하세요.
 """
-        
-        # React Agent용 프롬프트 템플릿
-        prompt = ChatPromptTemplate.from_template("""
+
+# React Agent용 프롬프트 (고정 접두부 / 요청마다 바뀌는 부분)
+REACT_PROMPT_PREFIX = """
 {system_prompt}
 
 TOOLS:
@@ -119,13 +84,121 @@ Final Answer: [your response here]
 ```
 
 Begin!
+"""
 
+REACT_PROMPT_SUFFIX = """
 Previous conversation history:
 {chat_history}
 
 New input: {input}
 {agent_scratchpad}
-""").partial(system_prompt=system_prompt)
+"""
+
+
+class CodingTestAgent:
+    """코딩 테스트 도우미 Agent
+    
+    사용자의 요청을 분석하여 적절한 도구를 선택하고 실행하는 중앙 제어 시스템
+    학습 중심 접근 방식으로 정답 코드를 직접 제공하지 않고 힌트와 가이드 제공
+    """
+    
+    def __init__(self, memory_window: int = 5, agent_mode: str = AGENT_MODE_REACT,
+                 memory_token_budget: Optional[int] = 2000):
+        """Agent 초기화
+        
+        Args:
+            memory_window: 원문으로 기억할 최근 대화 수 (기본값: 5)
+            agent_mode: Agent 실행 방식
+                - "react": 텍스트 Thought/Action 파싱 기반 ReAct
+                - "tool_calling": 모델의 구조화된 도구 호출 인터페이스 사용
+            memory_token_budget: 대화 메모리 최대 토큰 수 (None이면 최근 대화 원문 그대로 유지)
+        """
+        if agent_mode not in AGENT_MODES:
+            raise ValueError(f"지원하지 않는 agent_mode입니다: {agent_mode} (가능: {', '.join(AGENT_MODES)})")
+        self.agent_mode = agent_mode
+
+        self.llm = get_llm(DEFAULT_MODEL, temperature=0.1)
+        
+        # Tools 초기화
+        self.tools = self._initialize_tools()
+        
+        # Memory 설정
+        if memory_token_budget is None:
+            self.memory = ConversationBufferWindowMemory(
+                memory_key="chat_history",
+                return_messages=True,
+                k=memory_window
+            )
+        else:
+            self.memory = TokenBudgetMemory(
+                memory_key="chat_history",
+                return_messages=True,
+                max_token_limit=memory_token_budget,
+                max_recent_turns=memory_window
+            )
+
+        # 요청별 프롬프트 크기 측정
+        self.prompt_tracker = PromptSizeTracker()
+        self.prompt_size_history: List[Dict[str, int]] = []
+        
+        # Agent 생성
+        self.agent_executor = self._create_agent()
+
+        # 라우팅 통계 (의도별 처리 횟수)
+        self.route_stats: Dict[str, int] = {}
+    
+    def _initialize_tools(self) -> List[Tool]:
+        """도구들 초기화"""
+        # 함수 기반 도구들 사용
+        tools = [
+            analyze_problem,
+            review_code,
+            provide_hint
+        ]
+
+        return tools
+    
+    def _create_agent(self) -> AgentExecutor:
+        """Agent 생성"""
+        if self.agent_mode == AGENT_MODE_TOOL_CALLING:
+            return self._create_tool_calling_agent()
+        return self._create_react_agent()
+
+    def _create_tool_calling_agent(self) -> AgentExecutor:
+        """구조화된 도구 호출 Agent 생성
+
+        도구 스키마는 API의 tools 필드로 전달되므로 텍스트 형식 안내와 파싱이 필요 없다.
+        """
+        prompt = ChatPromptTemplate.from_messages([
+            cacheable_system_message(AGENT_SYSTEM_PROMPT, tools=self.tools),
+            MessagesPlaceholder("chat_history", optional=True),
+            ("human", "{input}"),
+            MessagesPlaceholder("agent_scratchpad")
+        ])
+
+        agent = create_tool_calling_agent(self.llm, self.tools, prompt)
+
+        return AgentExecutor(
+            agent=agent,
+            tools=self.tools,
+            verbose=True,
+            memory=self.memory,
+            max_iterations=3,
+            early_stopping_method="force"
+        )
+
+    def _create_react_agent(self) -> AgentExecutor:
+        """텍스트 파싱 기반 ReAct Agent 생성"""
+        # 도구 설명까지 포함한 고정 접두부는 캐시 대상 시스템 메시지로 분리
+        static_prefix = REACT_PROMPT_PREFIX.format(
+            system_prompt=AGENT_SYSTEM_PROMPT,
+            tools=render_text_description(self.tools),
+            tool_names=", ".join(tool.name for tool in self.tools)
+        )
+        prompt = ChatPromptTemplate.from_messages([
+            cacheable_system_message(static_prefix),
+            ("human", REACT_PROMPT_SUFFIX)
+        ]).partial(tools="", tool_names="")
         
         # React Agent 생성
         agent = create_react_agent(self.llm, self.tools, prompt)
@@ -145,6 +218,9 @@ New input: {input}
     
     def process_request(self, user_input: str) -> str:
         """사용자 요청 처리
+
+        의도가 키워드로 명확한 요청은 ReAct 루프 없이 도구를 바로 호출하고,
+        애매한 자유 형식 요청만 Agent가 처리한다.
         
         Args:
             user_input: 사용자 입력
@@ -152,12 +228,68 @@ New input: {input}
         Returns:
             Agent의 응답
         """
+        self.prompt_tracker.start_turn()
+        config = {"callbacks": [self.prompt_tracker, UsageCallbackHandler("agent")]}
+
         try:
-            response = self.agent_executor.invoke({"input": user_input})
-            return response.get("output", "죄송합니다. 응답을 생성할 수 없습니다.")
+            decision = route_request(user_input)
+            self.route_stats[decision.intent] = self.route_stats.get(decision.intent, 0) + 1
+
+            if decision.intent != INTENT_AGENT:
+                tool = self._get_tool(decision.intent)
+                if tool is not None:
+                    output = tool.invoke(decision.tool_input, config=config)
+                    # Agent를 거치지 않아도 대화 맥락은 유지
+                    self.memory.save_context({"input": user_input}, {"output": output})
+                    return output
+
+            response = self.agent_executor.invoke({"input": user_input}, config=config)
+            return content_text(response.get("output", "죄송합니다. 응답을 생성할 수 없습니다."))
             
         except Exception as e:
             return f"요청 처리 중 오류가 발생했습니다: {e}"
+
+        finally:
+            self._record_prompt_size()
+
+    def _record_prompt_size(self):
+        """이번 요청의 프롬프트 크기 기록"""
+        self.prompt_size_history.append({
+            "turn": len(self.prompt_size_history) + 1,
+            "llm_calls": self.prompt_tracker.turn_calls,
+            "estimated_input_tokens": self.prompt_tracker.turn_estimated_tokens,
+            "input_tokens": self.prompt_tracker.turn_input_tokens,
+            "memory_tokens": getattr(self.memory, "last_memory_tokens", 0),
+        })
+
+    def get_prompt_size_history(self) -> List[Dict[str, int]]:
+        """요청별 프롬프트 크기 기록 반환
+
+        Returns:
+            turn, llm_calls, estimated_input_tokens, input_tokens(API 보고값), memory_tokens 항목 리스트
+        """
+        return list(self.prompt_size_history)
+
+    def _get_tool(self, name: str) -> Optional[Tool]:
+        """이름으로 도구 조회"""
+        for tool in self.tools:
+            if tool.name == name:
+                return tool
+        return None
+
+    def stream_request(self, user_input: str) -> Iterator[str]:
+        """사용자 요청 처리 (스트리밍)
+
+        도구 내부 LLM 응답을 토큰 단위로 반환한다. Agent의 최종 답변은 도구 출력과
+        다를 수 있으므로 최종 답변이 필요하면 run_streaming의 TokenStream.result를 사용한다.
+
+        Args:
+            user_input: 사용자 입력
+
+        Returns:
+            응답 토큰 제너레이터
+        """
+        return iter_streaming(self.process_request, user_input)
     
     def get_conversation_history(self) -> List[Dict[str, Any]]:
         """대화 기록 조회
@@ -188,9 +320,13 @@ New input: {input}
 # 편의를 위한 전역 인스턴스
 _global_agent = None
 
-def get_coding_test_agent() -> CodingTestAgent:
-    """전역 코딩 테스트 Agent 인스턴스 반환"""
+def get_coding_test_agent(agent_mode: str = AGENT_MODE_REACT) -> CodingTestAgent:
+    """전역 코딩 테스트 Agent 인스턴스 반환
+
+    Args:
+        agent_mode: 처음 생성할 때 사용할 Agent 실행 방식
+    """
     global _global_agent
     if _global_agent is None:
-        _global_agent = CodingTestAgent()
+        _global_agent = CodingTestAgent(agent_mode=agent_mode)
     return _global_agent
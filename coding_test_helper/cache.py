@@ -0,0 +1,247 @@
+"""
+코딩 테스트 도우미 응답 캐시
+
+동일한 문제/코드/힌트 요청에 대해 LLM을 다시 호출하지 않도록
+메모리 LRU + SQLite 디스크 2단계 캐시를 제공
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# 실행 위치와 관계없이 재시작 후에도 같은 캐시를 쓰도록 사용자 캐시 디렉토리에 둠
+DEFAULT_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "coding_test_helper"
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MEMORY_ENTRIES = 256
+DEFAULT_DISK_MAX_BYTES = 50 * 1024 * 1024
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화
+
+    줄바꿈 형식과 줄 끝 공백, 앞뒤 빈 줄 차이로 캐시가 빗나가지 않도록 정리한다.
+    들여쓰기는 코드 의미에 영향을 주므로 유지한다.
+    """
+    if not text:
+        return ""
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+def make_cache_key(model: str, system_prompt: str, **inputs: Any) -> str:
+    """모델, 시스템 프롬프트, 정규화된 입력으로 캐시 키 생성"""
+    payload = {
+        "model": model,
+        "system_prompt": system_prompt,
+        "inputs": {
+            name: normalize_text(value) if isinstance(value, str) else value
+            for name, value in sorted(inputs.items())
+        },
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """메모리 LRU + SQLite 2단계 응답 캐시
+
+    - 1단계: 프로세스 내 OrderedDict LRU (밀리초 이하 조회)
+    - 2단계: SQLite 파일 (도우미 재시작 후에도 유지)
+    - TTL이 지난 항목은 조회 시 무시되고 정리 시 삭제됨
+    - 디스크 용량이 max_disk_bytes를 넘으면 오래 사용되지 않은 항목부터 삭제
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_disk_bytes: int = DEFAULT_DISK_MAX_BYTES
+    ):
+        """캐시 초기화
+
+        Args:
+            db_path: SQLite 파일 경로 (None이면 디스크 캐시 미사용)
+            ttl_seconds: 항목 유효 시간(초)
+            max_memory_entries: 메모리 LRU 최대 항목 수
+            max_disk_bytes: 디스크 캐시 최대 크기(바이트)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn = None
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+        if db_path is not None:
+            try:
+                self._conn = self._open_db(Path(db_path))
+            except Exception as e:
+                print(f"디스크 캐시 초기화 실패 (메모리 캐시만 사용): {e}")
+                self._conn = None
+
+    def _open_db(self, db_path: Path) -> sqlite3.Connection:
+        """SQLite 연결 및 테이블 생성"""
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON responses(last_access)")
+        conn.commit()
+        return conn
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시 조회 (없거나 만료되었으면 None)"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created_at = entry
+                if not self._is_expired(created_at, now):
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT value, created_at FROM responses WHERE key = ?",
+                        (key,)
+                    ).fetchone()
+                    if row is not None:
+                        value, created_at = row
+                        if not self._is_expired(created_at, now):
+                            self._conn.execute(
+                                "UPDATE responses SET last_access = ? WHERE key = ?",
+                                (now, key)
+                            )
+                            self._conn.commit()
+                            self._remember(key, value, created_at)
+                            self.stats["disk_hits"] += 1
+                            return value
+                        self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                        self._conn.commit()
+                except sqlite3.Error as e:
+                    print(f"디스크 캐시 조회 실패: {e}")
+
+            self.stats["misses"] += 1
+            return None
+
+    def set(self, key: str, value: str):
+        """캐시 저장"""
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        """
+                        INSERT OR REPLACE INTO responses (key, value, created_at, last_access, size)
+                        VALUES (?, ?, ?, ?, ?)
+                        """,
+                        (key, value, now, now, len(value.encode("utf-8")))
+                    )
+                    self._conn.commit()
+                    self._evict_disk(now)
+                except sqlite3.Error as e:
+                    print(f"디스크 캐시 저장 실패: {e}")
+
+    def _remember(self, key: str, value: str, created_at: float):
+        """메모리 LRU에 저장하고 초과분 제거"""
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self, now: float):
+        """만료 항목 삭제 후 용량 초과 시 LRU 순으로 삭제"""
+        if self.ttl_seconds > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (now - self.ttl_seconds,)
+            )
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total > self.max_disk_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access ASC"
+            ).fetchall()
+            stale_keys = []
+            for key, size in rows:
+                if total <= self.max_disk_bytes:
+                    break
+                stale_keys.append((key,))
+                total -= size
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+        self._conn.commit()
+
+    def clear(self):
+        """모든 캐시 항목 삭제"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                try:
+                    self._conn.execute("DELETE FROM responses")
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    print(f"디스크 캐시 삭제 실패: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중 통계 반환"""
+        with self._lock:
+            hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+            total = hits + self.stats["misses"]
+            return {
+                **self.stats,
+                "memory_entries": len(self._memory),
+                "hit_rate": hits / total if total else 0.0,
+            }
+
+
+# 전역 캐시 인스턴스
+_response_cache = None
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """전역 응답 캐시 인스턴스 반환
+
+    환경변수:
+        CODING_TEST_HELPER_CACHE_DISABLED: "1"이면 캐시 미사용
+        CODING_TEST_HELPER_CACHE_DIR: SQLite 파일 디렉토리 (기본값: ~/.cache/coding_test_helper)
+        CODING_TEST_HELPER_CACHE_TTL: 항목 유효 시간(초)
+    """
+    global _response_cache
+    if os.getenv("CODING_TEST_HELPER_CACHE_DISABLED") == "1":
+        return None
+    if _response_cache is None:
+        cache_dir = Path(os.getenv("CODING_TEST_HELPER_CACHE_DIR", str(DEFAULT_CACHE_DIR)))
+        ttl = float(os.getenv("CODING_TEST_HELPER_CACHE_TTL", DEFAULT_TTL_SECONDS))
+        _response_cache = ResponseCache(
+            db_path=cache_dir / "llm_responses.sqlite3",
+            ttl_seconds=ttl
+        )
+    return _response_cache
@@ -0,0 +1,233 @@
+"""
+코딩 테스트 도우미 화면 캡처 백엔드
+
+캡처 방식을 교체할 수 있도록 공통 인터페이스를 두고,
+- mss: X11 MIT-SHM/XGetImage, Windows BitBlt, macOS CoreGraphics를 직접 사용 (가장 빠름)
+- pil: PIL.ImageGrab
+- pyautogui: 기존 방식 (내부적으로 scrot/screencapture 등 외부 도구 사용)
+순서로 사용 가능한 백엔드를 고른다.
+
+영역은 pyautogui와 같은 (left, top, width, height) 튜플로 표현한다.
+"""
+
+import os
+import sys
+import shutil
+import threading
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image
+
+
+Region = Tuple[int, int, int, int]
+
+# 자동 선택 우선순위
+BACKEND_PRIORITY = ["mss", "pil", "pyautogui"]
+
+
+class CaptureBackend:
+    """화면 캡처 백엔드 공통 인터페이스"""
+
+    name = "base"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """필요한 패키지가 설치되어 있는지"""
+        return False
+
+    def grab(self, region: Optional[Region] = None) -> Image.Image:
+        """화면(또는 region 영역) 캡처
+
+        Args:
+            region: (left, top, width, height), None이면 전체 화면
+
+        Returns:
+            RGB 이미지
+        """
+        raise NotImplementedError
+
+
+class MssBackend(CaptureBackend):
+    """mss 기반 캡처
+
+    mss 인스턴스는 생성한 스레드에서만 사용할 수 있으므로 스레드별로 하나씩 둔다.
+    """
+
+    name = "mss"
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import mss  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def _instance(self):
+        instance = getattr(self._local, "instance", None)
+        if instance is None:
+            import mss
+            instance = self._local.instance = mss.mss()
+        return instance
+
+    def grab(self, region: Optional[Region] = None) -> Image.Image:
+        instance = self._instance()
+        if region is None:
+            # monitors[0]은 모든 모니터를 합친 가상 화면
+            monitor = instance.monitors[0]
+        else:
+            left, top, width, height = region
+            monitor = {"left": left, "top": top, "width": width, "height": height}
+        shot = instance.grab(monitor)
+        return Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+
+
+class PILBackend(CaptureBackend):
+    """PIL.ImageGrab 기반 캡처"""
+
+    name = "pil"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            from PIL import ImageGrab  # noqa: F401
+        except ImportError:
+            return False
+        # Linux에서는 X 디스플레이가 있어야 동작
+        return not sys.platform.startswith("linux") or bool(os.environ.get("DISPLAY"))
+
+    def grab(self, region: Optional[Region] = None) -> Image.Image:
+        from PIL import ImageGrab
+
+        bbox = None
+        if region is not None:
+            left, top, width, height = region
+            bbox = (left, top, left + width, top + height)
+        return ImageGrab.grab(bbox=bbox, all_screens=True).convert("RGB")
+
+
+class PyAutoGUIBackend(CaptureBackend):
+    """pyautogui 기반 캡처 (기존 방식)"""
+
+    name = "pyautogui"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import pyautogui  # noqa: F401
+            return True
+        except Exception:
+            # DISPLAY가 없으면 ImportError 외의 예외가 발생할 수 있음
+            return False
+
+    def grab(self, region: Optional[Region] = None) -> Image.Image:
+        import pyautogui
+
+        return pyautogui.screenshot(region=region).convert("RGB")
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (MssBackend, PILBackend, PyAutoGUIBackend)
+}
+
+
+def available_backends() -> List[str]:
+    """사용 가능한 백엔드 이름 (우선순위 순)"""
+    return [name for name in BACKEND_PRIORITY if BACKENDS[name].is_available()]
+
+
+def get_capture_backend(name: str = "auto") -> Optional[CaptureBackend]:
+    """이름으로 캡처 백엔드 생성
+
+    Args:
+        name: "auto", "mss", "pil", "pyautogui"
+
+    Returns:
+        백엔드 인스턴스 (사용 가능한 백엔드가 없으면 None)
+    """
+    if name != "auto":
+        backend_class = BACKENDS.get(name)
+        if backend_class is not None and backend_class.is_available():
+            return backend_class()
+        print(f"캡처 백엔드 '{name}'를 사용할 수 없어 자동 선택합니다.")
+
+    names = available_backends()
+    return BACKENDS[names[0]]() if names else None
+
+
+def _run(command: List[str]) -> Optional[str]:
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=2)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _x11_window_pid(window_id: str) -> Optional[int]:
+    output = _run(["xdotool", "getwindowpid", window_id])
+    return int(output.strip()) if output and output.strip().isdigit() else None
+
+
+def _x11_window_region(window_id: str) -> Optional[Region]:
+    output = _run(["xdotool", "getwindowgeometry", "--shell", window_id])
+    if not output:
+        return None
+    values: Dict[str, int] = {}
+    for line in output.splitlines():
+        key, _, value = line.partition("=")
+        if value.strip().lstrip("-").isdigit():
+            values[key.strip()] = int(value)
+    try:
+        return values["X"], values["Y"], values["WIDTH"], values["HEIGHT"]
+    except KeyError:
+        return None
+
+
+def get_active_window_region(exclude_pid: Optional[int] = None) -> Optional[Region]:
+    """활성 창 영역 반환
+
+    도우미 버튼을 누르면 도우미 창이 활성 창이 되므로, exclude_pid 프로세스의 창은 건너뛰고
+    쌓임 순서상 바로 아래의 창을 사용한다.
+    Linux(X11)는 xdotool/xprop, Windows는 pygetwindow를 사용하며, 알 수 없으면 None.
+    """
+    exclude_pid = exclude_pid if exclude_pid is not None else os.getpid()
+
+    if sys.platform.startswith("linux") and shutil.which("xdotool"):
+        candidates = []
+        active = _run(["xdotool", "getactivewindow"])
+        if active and active.strip():
+            candidates.append(active.strip())
+        if shutil.which("xprop"):
+            # _NET_CLIENT_LIST_STACKING: 아래→위 순서의 창 ID 목록
+            stacking = _run(["xprop", "-root", "_NET_CLIENT_LIST_STACKING"])
+            if stacking and "#" in stacking:
+                ids = [item.strip() for item in stacking.split("#", 1)[1].split(",")]
+                candidates.extend(str(int(item, 16)) for item in reversed(ids) if item)
+        for window_id in candidates:
+            if _x11_window_pid(window_id) == exclude_pid:
+                continue
+            region = _x11_window_region(window_id)
+            if region is not None:
+                return region
+        return None
+
+    try:
+        import pygetwindow
+    except ImportError:
+        return None
+    try:
+        windows = [pygetwindow.getActiveWindow()] + list(pygetwindow.getAllWindows())
+    except Exception:
+        return None
+    for window in windows:
+        # 도우미 창은 제목으로 구분
+        if window is None or not window.title or window.title.endswith(("코딩 테스트 도우미", "일반 코딩 도우미")):
+            continue
+        if window.width > 0 and window.height > 0:
+            return window.left, window.top, window.width, window.height
+    return None
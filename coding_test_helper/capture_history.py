@@ -0,0 +1,257 @@
+"""
+코딩 테스트 도우미 화면 캡처 기록
+
+디버깅 중 거의 같은 화면을 반복해서 캡처하는 경우를 위해 직전 프레임을 보관하고
+- 지각 해시(dHash)가 같으면 요청을 생략하고 이전 분석을 재사용
+- 일부 영역만 바뀌었으면 바뀐 영역의 잘라낸 이미지만 전송
+하도록 블록 단위 차이를 계산한다.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+
+# 차이 판정 기준
+BLOCK_SIZE = 32
+PIXEL_DIFF_THRESHOLD = 24
+MIN_CHANGED_PIXELS = 8
+HASH_DISTANCE_THRESHOLD = 0
+FULL_CHANGE_RATIO = 0.4
+MAX_REGIONS = 4
+REGION_PADDING = 16
+
+# 캡처 결과 종류
+FRAME_FIRST = "first"
+FRAME_UNCHANGED = "unchanged"
+FRAME_PARTIAL = "partial"
+FRAME_FULL = "full"
+
+Box = Tuple[int, int, int, int]
+
+
+def perceptual_hash(image: Image.Image, hash_size: int = 8) -> int:
+    """difference hash (dHash)
+
+    (hash_size+1)×hash_size 흑백 축소본에서 가로로 이웃한 픽셀의 밝기 대소를 비트로 만든다.
+    """
+    small = image.convert("L").resize((hash_size + 1, hash_size), Image.BILINEAR)
+    pixels = np.asarray(small, dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+    return int("".join("1" if bit else "0" for bit in bits), 2)
+
+
+def hash_distance(first: int, second: int) -> int:
+    """두 해시의 해밍 거리"""
+    return bin(first ^ second).count("1")
+
+
+def changed_block_mask(previous: np.ndarray, current: np.ndarray,
+                       block_size: int = BLOCK_SIZE,
+                       pixel_threshold: int = PIXEL_DIFF_THRESHOLD,
+                       min_pixels: int = MIN_CHANGED_PIXELS) -> np.ndarray:
+    """밝기가 pixel_threshold 넘게 바뀐 픽셀이 min_pixels개 이상인 블록 표시
+
+    평균 대신 픽셀 수를 세므로 글자 몇 개만 바뀐 블록도 잡고, 미세한 노이즈는 무시한다.
+
+    Args:
+        previous, current: 같은 크기의 흑백(uint8) 배열
+
+    Returns:
+        (행 블록 수, 열 블록 수) bool 배열
+    """
+    height, width = current.shape
+    rows = -(-height // block_size)
+    cols = -(-width // block_size)
+
+    changed = np.abs(current.astype(np.int16) - previous.astype(np.int16)) > pixel_threshold
+    # 가장자리 블록도 같은 크기가 되도록 채운 뒤 블록별 개수 계산
+    padded = np.zeros((rows * block_size, cols * block_size), dtype=np.uint16)
+    padded[:height, :width] = changed
+    counts = padded.reshape(rows, block_size, cols, block_size).sum(axis=(1, 3))
+    return counts >= min_pixels
+
+
+def group_blocks(mask: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    """인접한 변경 블록을 묶어 (행 시작, 열 시작, 행 끝, 열 끝) 범위 목록 반환 (끝은 포함하지 않음)"""
+    visited = np.zeros_like(mask, dtype=bool)
+    rows, cols = mask.shape
+    groups = []
+
+    for start_row, start_col in zip(*np.nonzero(mask)):
+        if visited[start_row, start_col]:
+            continue
+        stack = [(start_row, start_col)]
+        visited[start_row, start_col] = True
+        top, left, bottom, right = start_row, start_col, start_row, start_col
+        while stack:
+            row, col = stack.pop()
+            top, left = min(top, row), min(left, col)
+            bottom, right = max(bottom, row), max(right, col)
+            # 대각선 포함 8방향 이웃
+            for next_row in range(max(row - 1, 0), min(row + 2, rows)):
+                for next_col in range(max(col - 1, 0), min(col + 2, cols)):
+                    if mask[next_row, next_col] and not visited[next_row, next_col]:
+                        visited[next_row, next_col] = True
+                        stack.append((next_row, next_col))
+        groups.append((int(top), int(left), int(bottom) + 1, int(right) + 1))
+    return groups
+
+
+def _merge_boxes(boxes: List[Box], max_regions: int) -> List[Box]:
+    """영역이 너무 많으면 가장 가까운 두 영역을 합쳐 max_regions개 이하로 줄임"""
+    boxes = list(boxes)
+    while len(boxes) > max_regions:
+        best = None
+        for i in range(len(boxes)):
+            for j in range(i + 1, len(boxes)):
+                merged = (
+                    min(boxes[i][0], boxes[j][0]), min(boxes[i][1], boxes[j][1]),
+                    max(boxes[i][2], boxes[j][2]), max(boxes[i][3], boxes[j][3])
+                )
+                # 합친 영역 넓이가 가장 적게 늘어나는 쌍 선택
+                area = (merged[2] - merged[0]) * (merged[3] - merged[1])
+                if best is None or area < best[0]:
+                    best = (area, i, j, merged)
+        _, i, j, merged = best
+        boxes = [box for index, box in enumerate(boxes) if index not in (i, j)] + [merged]
+    return boxes
+
+
+@dataclass
+class FrameDiff:
+    """직전 캡처와 비교한 결과"""
+    kind: str
+    image: Image.Image
+    hash: int
+    hash_distance: Optional[int] = None
+    changed_ratio: float = 1.0
+    regions: List[Box] = field(default_factory=list)  # (left, top, right, bottom) 픽셀 좌표
+    previous_analysis: Optional[str] = None
+
+    @property
+    def should_skip(self) -> bool:
+        """요청을 생략하고 이전 분석을 재사용할 수 있는지"""
+        return self.kind == FRAME_UNCHANGED and self.previous_analysis is not None
+
+    def crops(self) -> List[Image.Image]:
+        """변경 영역 잘라낸 이미지 (partial이 아니면 전체 화면 한 장)"""
+        if self.kind != FRAME_PARTIAL:
+            return [self.image]
+        return [self.image.crop(box) for box in self.regions]
+
+    def describe(self) -> str:
+        """요청에 덧붙일 변경 내용 설명"""
+        if self.kind == FRAME_UNCHANGED:
+            return "직전 캡처와 화면이 같습니다."
+        if self.kind != FRAME_PARTIAL:
+            return ""
+
+        lines = [f"직전 캡처 이후 화면의 {self.changed_ratio:.0%}가 바뀌었습니다. 바뀐 영역:"]
+        for left, top, right, bottom in self.regions:
+            lines.append(f"- ({left}, {top}) ~ ({right}, {bottom})")
+        if self.previous_analysis:
+            reference = self.previous_analysis.strip().splitlines()
+            lines.append("이전 분석 요약:")
+            lines.extend(f"  {line}" for line in reference[:5] if line.strip())
+        return "\n".join(lines)
+
+
+class CaptureHistory:
+    """직전 캡처 프레임과 분석 결과 보관
+
+    지각 해시만으로는 작은 에러 문구 변화를 놓칠 수 있으므로,
+    해시가 같고 블록 차이도 없을 때만 "변화 없음"으로 판정한다.
+    compare()로 새 프레임을 비교하고, 분석이 끝나면 remember()로 결과를 저장한다.
+    """
+
+    def __init__(self, block_size: int = BLOCK_SIZE, pixel_threshold: int = PIXEL_DIFF_THRESHOLD,
+                 min_changed_pixels: int = MIN_CHANGED_PIXELS, hash_threshold: int = HASH_DISTANCE_THRESHOLD,
+                 full_change_ratio: float = FULL_CHANGE_RATIO, max_regions: int = MAX_REGIONS, padding: int = REGION_PADDING):
+        self.block_size = block_size
+        self.pixel_threshold = pixel_threshold
+        self.min_changed_pixels = min_changed_pixels
+        self.hash_threshold = hash_threshold
+        self.full_change_ratio = full_change_ratio
+        self.max_regions = max_regions
+        self.padding = padding
+
+        self._lock = threading.Lock()
+        self._previous_pixels: Optional[np.ndarray] = None
+        self._previous_hash: Optional[int] = None
+        self.previous_analysis: Optional[str] = None
+        self.stats = {"first": 0, "unchanged": 0, "partial": 0, "full": 0}
+
+    def compare(self, image: Image.Image) -> FrameDiff:
+        """직전 프레임과 비교"""
+        image_hash = perceptual_hash(image)
+        pixels = np.asarray(image.convert("L"))
+
+        with self._lock:
+            previous_pixels = self._previous_pixels
+            previous_hash = self._previous_hash
+            previous_analysis = self.previous_analysis
+
+        if previous_pixels is None or previous_pixels.shape != pixels.shape:
+            diff = FrameDiff(FRAME_FIRST, image, image_hash)
+            self.stats[diff.kind] += 1
+            return diff
+
+        distance = hash_distance(image_hash, previous_hash)
+        mask = changed_block_mask(
+            previous_pixels, pixels, self.block_size, self.pixel_threshold, self.min_changed_pixels
+        )
+        changed_ratio = float(mask.mean())
+
+        if distance <= self.hash_threshold and not mask.any():
+            kind = FRAME_UNCHANGED
+            regions = []
+        elif changed_ratio >= self.full_change_ratio:
+            kind = FRAME_FULL
+            regions = []
+        else:
+            kind = FRAME_PARTIAL
+            regions = self._regions(mask, image.size)
+            if not regions:
+                kind = FRAME_UNCHANGED
+
+        diff = FrameDiff(
+            kind, image, image_hash,
+            hash_distance=distance,
+            changed_ratio=changed_ratio,
+            regions=regions,
+            previous_analysis=previous_analysis
+        )
+        self.stats[diff.kind] += 1
+        return diff
+
+    def _regions(self, mask: np.ndarray, image_size: Tuple[int, int]) -> List[Box]:
+        """변경 블록 묶음을 여백을 더한 픽셀 좌표로 변환"""
+        width, height = image_size
+        boxes = []
+        for top, left, bottom, right in group_blocks(mask):
+            boxes.append((
+                max(left * self.block_size - self.padding, 0),
+                max(top * self.block_size - self.padding, 0),
+                min(right * self.block_size + self.padding, width),
+                min(bottom * self.block_size + self.padding, height)
+            ))
+        return _merge_boxes(boxes, self.max_regions)
+
+    def remember(self, image: Image.Image, analysis: Optional[str] = None):
+        """분석을 마친 프레임을 다음 비교 기준으로 저장"""
+        pixels = np.asarray(image.convert("L"))
+        image_hash = perceptual_hash(image)
+        with self._lock:
+            self._previous_pixels = pixels
+            self._previous_hash = image_hash
+            self.previous_analysis = analysis
+
+    def reset(self):
+        with self._lock:
+            self._previous_pixels = None
+            self._previous_hash = None
+            self.previous_analysis = None
@@ -0,0 +1,480 @@
+"""
+코딩 테스트 도우미 요청 녹화/재생 (cassette)
+
+record 모드는 모든 LLM API 요청/응답을 응답 시간, 토큰 사용량과 함께 카세트 파일(JSONL, .gz 가능)에 기록하고,
+replay 모드는 네트워크 없이 기록된 응답을 기록 당시 시간(또는 배율을 적용한 시간)에 맞춰 돌려준다.
+프롬프트, Chain, Agent를 바꾼 뒤 재생하면 모델 왕복 횟수와 요청 토큰 변화를 같은 응답으로 비교할 수 있다.
+
+공유 HTTP 클라이언트의 전송 계층(llm_registry)에 연결되며, 환경변수로 켠다.
+    CODING_TEST_HELPER_CASSETTE: 카세트 파일 경로
+    CODING_TEST_HELPER_CASSETTE_MODE: "record" 또는 "replay" (기본 replay)
+    CODING_TEST_HELPER_CASSETTE_TIME_SCALE: 재생 시간 배율 (1.0: 기록된 시간, 0: 즉시)
+    CODING_TEST_HELPER_CASSETTE_STRICT: "1"이면 요청이 정확히 일치하지 않을 때 오류
+
+비교:
+    python -m coding_test_helper.cassette summary before.jsonl
+    python -m coding_test_helper.cassette diff before.jsonl after.jsonl
+"""
+
+import os
+import sys
+import json
+import gzip
+import time
+import codecs
+import asyncio
+import hashlib
+import argparse
+import threading
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+from .scheduler import estimate_request_tokens
+
+
+CASSETTE_VERSION = 1
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+# 재생 시 돌려줄 응답 헤더
+KEPT_HEADERS = ("content-type", "request-id", "retry-after")
+
+USAGE_KEYS = ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+
+
+class CassetteMissError(Exception):
+    """재생할 기록이 없는 요청 (스케줄러가 재시도하지 않도록 전송 오류로 취급하지 않음)"""
+
+
+def request_key(request: httpx.Request) -> str:
+    """요청 식별 키 (메서드, 경로, 정규화한 JSON 본문의 해시)"""
+    body = request.content
+    try:
+        body = json.dumps(json.loads(body), sort_keys=True, ensure_ascii=False).encode("utf-8")
+    except ValueError:
+        pass
+    digest = hashlib.sha256(f"{request.method} {request.url.path}\n".encode() + body).hexdigest()
+    return digest[:32]
+
+
+def _is_streaming(request: httpx.Request) -> bool:
+    try:
+        return bool(json.loads(request.content).get("stream"))
+    except (ValueError, AttributeError):
+        return False
+
+
+def parse_usage(body: str) -> Dict[str, int]:
+    """응답 본문(JSON 또는 SSE)에서 토큰 사용량 추출"""
+    usage = {key: 0 for key in USAGE_KEYS}
+
+    def merge(raw: Optional[Dict[str, Any]]):
+        for key in USAGE_KEYS:
+            if raw and raw.get(key):
+                usage[key] = int(raw[key])
+
+    stripped = body.lstrip()
+    if stripped.startswith("{"):
+        try:
+            merge(json.loads(stripped).get("usage"))
+        except ValueError:
+            pass
+        return usage
+
+    for line in body.splitlines():
+        if not line.startswith("data:"):
+            continue
+        try:
+            event = json.loads(line[5:])
+        except ValueError:
+            continue
+        if event.get("type") == "message_start":
+            merge(event.get("message", {}).get("usage"))
+        elif event.get("type") == "message_delta":
+            merge(event.get("usage"))
+    return usage
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def load_interactions(path: str) -> List[Dict[str, Any]]:
+    """카세트 파일의 기록 목록"""
+    interactions = []
+    with _open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if "cassette" not in entry:
+                interactions.append(entry)
+    return interactions
+
+
+class Cassette:
+    """카세트 파일 하나 (기록 추가, 재생할 기록 선택, 통계)"""
+
+    def __init__(self, path: str, mode: str = MODE_REPLAY, time_scale: float = 1.0, strict: bool = False):
+        if mode not in (MODE_RECORD, MODE_REPLAY):
+            raise ValueError(f"알 수 없는 카세트 모드: {mode}")
+        self.path = path
+        self.mode = mode
+        self.time_scale = time_scale
+        self.strict = strict
+        self._lock = threading.Lock()
+
+        # 이번 실행에서 기록/재생한 요청 요약 (summary/diff 용)
+        self.log: List[Dict[str, Any]] = []
+        # 재생한 응답의 (시작, 종료) 시각
+        self.served: List[tuple] = []
+        self.stats = {"requests": 0, "matched": 0, "fallback": 0, "misses": 0}
+
+        if mode == MODE_RECORD:
+            with _open(path, "w") as f:
+                f.write(json.dumps({"cassette": CASSETTE_VERSION, "created_at": time.time()}) + "\n")
+            self._interactions: List[Dict[str, Any]] = []
+        else:
+            self._interactions = load_interactions(path)
+        self._by_key: Dict[str, deque] = defaultdict(deque)
+        for interaction in self._interactions:
+            self._by_key[interaction["key"]].append(interaction)
+        self._used = set()
+
+    def append(self, interaction: Dict[str, Any]):
+        """기록 추가 (요청이 끝날 때마다 파일에 바로 씀)"""
+        with self._lock:
+            self._interactions.append(interaction)
+            self._log(interaction, interaction["request_tokens"], "recorded")
+            with _open(self.path, "a") as f:
+                f.write(json.dumps(interaction, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def match(self, request: httpx.Request) -> Dict[str, Any]:
+        """요청에 돌려줄 기록 선택
+
+        같은 키의 기록을 기록 순서대로 사용하고, 없으면(프롬프트가 바뀐 경우 등)
+        아직 사용하지 않은 기록 중 같은 경로/스트리밍 여부인 첫 기록을 사용한다.
+        """
+        key = request_key(request)
+        streaming = _is_streaming(request)
+        with self._lock:
+            self.stats["requests"] += 1
+            candidates = self._by_key.get(key)
+            while candidates:
+                interaction = candidates.popleft()
+                if id(interaction) not in self._used:
+                    kind = "matched"
+                    break
+            else:
+                interaction = None
+                if not self.strict:
+                    for candidate in self._interactions:
+                        if (id(candidate) not in self._used and candidate["path"] == request.url.path
+                                and candidate["stream"] == streaming):
+                            interaction, kind = candidate, "fallback"
+                            break
+            if interaction is None:
+                self.stats["misses"] += 1
+                raise CassetteMissError(f"카세트에 기록되지 않은 요청입니다: {request.method} {request.url.path} ({key})")
+
+            self._used.add(id(interaction))
+            self.stats[kind] += 1
+            self._log(interaction, estimate_request_tokens(request), kind)
+            return interaction
+
+    def _log(self, interaction: Dict[str, Any], request_tokens: int, kind: str):
+        self.log.append({
+            "key": interaction["key"],
+            "kind": kind,
+            "status": interaction["status"],
+            "request_tokens": request_tokens,
+            "duration": interaction["duration"],
+            **interaction["usage"],
+        })
+
+    def record_served(self, started: float, finished: float):
+        with self._lock:
+            self.served.append((started, finished))
+
+    @property
+    def service_seconds(self) -> float:
+        """재생 응답을 하나 이상 돌려주던 시간 합계 (겹치는 구간은 한 번만 계산)"""
+        with self._lock:
+            intervals = sorted(self.served)
+        total = 0.0
+        current_start = current_end = None
+        for start, end in intervals:
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    total += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            total += current_end - current_start
+        return total
+
+    def save_log(self, path: str):
+        """이번 실행의 요청 기록을 JSONL로 저장 (재생 결과를 diff로 비교할 때 사용)"""
+        with self._lock:
+            entries = list(self.log)
+        with _open(path, "w") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def reset_log(self):
+        with self._lock:
+            self.log.clear()
+            self.served.clear()
+            self.stats = dict.fromkeys(self.stats, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, mode=self.mode, recorded=len(self._interactions), **summarize(self.log))
+
+
+def summarize(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """요청 기록 목록의 왕복 횟수, 토큰, 응답 시간 합계"""
+    totals = {"round_trips": len(entries), "request_tokens": 0, "duration": 0.0}
+    totals.update({key: 0 for key in USAGE_KEYS})
+    for entry in entries:
+        totals["request_tokens"] += entry.get("request_tokens", 0)
+        totals["duration"] += entry.get("duration", 0.0)
+        for key in USAGE_KEYS:
+            totals[key] += entry.get(key, 0) or entry.get("usage", {}).get(key, 0)
+    return totals
+
+
+def diff(before: List[Dict[str, Any]], after: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """두 요청 기록 목록의 항목별 변화"""
+    old, new = summarize(before), summarize(after)
+    return {key: {"before": old[key], "after": new[key], "change": new[key] - old[key]} for key in old}
+
+
+class _RecordingStream(httpx.SyncByteStream):
+    """응답을 그대로 전달하면서 청크와 도착 시각을 기록"""
+
+    def __init__(self, stream, recorder: "_Recorder"):
+        self._stream = stream
+        self._recorder = recorder
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._recorder.add(chunk)
+            yield chunk
+
+    def close(self):
+        try:
+            self._stream.close()
+        finally:
+            self._recorder.finish()
+
+
+class _AsyncRecordingStream(httpx.AsyncByteStream):
+    def __init__(self, stream, recorder: "_Recorder"):
+        self._stream = stream
+        self._recorder = recorder
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            self._recorder.add(chunk)
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            self._recorder.finish()
+
+
+class _Recorder:
+    """요청 하나의 기록 작성 (청크는 [요청 시작 후 ms, 텍스트] 형태)"""
+
+    def __init__(self, cassette: Cassette, request: httpx.Request, started: float):
+        self._cassette = cassette
+        self._started = started
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._chunks: List[list] = []
+        self._finished = False
+        self.interaction = {
+            "key": request_key(request),
+            "method": request.method,
+            "path": request.url.path,
+            "stream": _is_streaming(request),
+            "request_tokens": estimate_request_tokens(request),
+        }
+
+    def start(self, response: httpx.Response):
+        self.interaction["status"] = response.status_code
+        self.interaction["headers"] = {
+            name: response.headers[name] for name in KEPT_HEADERS if name in response.headers
+        }
+        self.interaction["ttfb"] = round(time.perf_counter() - self._started, 4)
+
+    def add(self, chunk: bytes):
+        elapsed_ms = int((time.perf_counter() - self._started) * 1000)
+        text = self._decoder.decode(chunk)
+        # 같은 ms에 도착한 청크는 합쳐서 파일 크기를 줄임
+        if self._chunks and self._chunks[-1][0] == elapsed_ms:
+            self._chunks[-1][1] += text
+        else:
+            self._chunks.append([elapsed_ms, text])
+
+    def finish(self):
+        if self._finished:
+            return
+        self._finished = True
+        body = "".join(text for _, text in self._chunks) + self._decoder.decode(b"", final=True)
+        self.interaction["duration"] = round(time.perf_counter() - self._started, 4)
+        self.interaction["usage"] = parse_usage(body)
+        self.interaction["chunks"] = self._chunks
+        self._cassette.append(self.interaction)
+
+
+def _replay_response(interaction: Dict[str, Any], stream) -> httpx.Response:
+    return httpx.Response(interaction["status"], headers=interaction.get("headers", {}), stream=stream)
+
+
+class _ReplayStream(httpx.SyncByteStream):
+    """기록된 청크를 기록 시각 x time_scale에 맞춰 반환"""
+
+    def __init__(self, cassette: Cassette, interaction: Dict[str, Any], started: float):
+        self._cassette = cassette
+        self._interaction = interaction
+        self._started = started
+
+    def __iter__(self) -> Iterator[bytes]:
+        for offset_ms, text in self._interaction["chunks"]:
+            delay = self._started + offset_ms / 1000 * self._cassette.time_scale - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            yield text.encode("utf-8")
+        self._cassette.record_served(self._started, time.perf_counter())
+
+
+class _AsyncReplayStream(httpx.AsyncByteStream):
+    def __init__(self, cassette: Cassette, interaction: Dict[str, Any], started: float):
+        self._cassette = cassette
+        self._interaction = interaction
+        self._started = started
+
+    async def __aiter__(self):
+        for offset_ms, text in self._interaction["chunks"]:
+            delay = self._started + offset_ms / 1000 * self._cassette.time_scale - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield text.encode("utf-8")
+        self._cassette.record_served(self._started, time.perf_counter())
+
+
+class CassetteTransport(httpx.BaseTransport):
+    """카세트 녹화/재생 전송 계층 (record 모드에서만 실제 전송 계층 사용)"""
+
+    def __init__(self, cassette: Cassette, transport: Optional[httpx.BaseTransport] = None):
+        self.cassette = cassette
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        if request.method != "POST":
+            # 연결 예열(HEAD) 등은 기록하지 않음
+            if self.cassette.mode == MODE_REPLAY:
+                return httpx.Response(200)
+            return self._transport.handle_request(request)
+
+        if self.cassette.mode == MODE_REPLAY:
+            interaction = self.cassette.match(request)
+            delay = interaction.get("ttfb", 0.0) * self.cassette.time_scale
+            if delay > 0:
+                time.sleep(delay)
+            return _replay_response(interaction, _ReplayStream(self.cassette, interaction, started))
+
+        recorder = _Recorder(self.cassette, request, started)
+        response = self._transport.handle_request(request)
+        recorder.start(response)
+        response.stream = _RecordingStream(response.stream, recorder)
+        return response
+
+    def close(self):
+        if self._transport is not None:
+            self._transport.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """비동기 클라이언트용 CassetteTransport"""
+
+    def __init__(self, cassette: Cassette, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.cassette = cassette
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        if request.method != "POST":
+            if self.cassette.mode == MODE_REPLAY:
+                return httpx.Response(200)
+            return await self._transport.handle_async_request(request)
+
+        if self.cassette.mode == MODE_REPLAY:
+            interaction = self.cassette.match(request)
+            delay = interaction.get("ttfb", 0.0) * self.cassette.time_scale
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return _replay_response(interaction, _AsyncReplayStream(self.cassette, interaction, started))
+
+        recorder = _Recorder(self.cassette, request, started)
+        response = await self._transport.handle_async_request(request)
+        recorder.start(response)
+        response.stream = _AsyncRecordingStream(response.stream, recorder)
+        return response
+
+    async def aclose(self):
+        if self._transport is not None:
+            await self._transport.aclose()
+
+
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """환경변수로 설정된 전역 카세트 반환 (설정되지 않았으면 None)"""
+    global _cassette
+    path = os.getenv("CODING_TEST_HELPER_CASSETTE")
+    if not path:
+        return None
+    with _cassette_lock:
+        if _cassette is None or _cassette.path != path:
+            _cassette = Cassette(
+                path,
+                mode=os.getenv("CODING_TEST_HELPER_CASSETTE_MODE", MODE_REPLAY),
+                time_scale=float(os.getenv("CODING_TEST_HELPER_CASSETTE_TIME_SCALE", "1.0")),
+                strict=os.getenv("CODING_TEST_HELPER_CASSETTE_STRICT", "0") == "1"
+            )
+        return _cassette
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카세트 요약/비교")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    summary_parser = subparsers.add_parser("summary", help="왕복 횟수, 토큰, 응답 시간 합계")
+    summary_parser.add_argument("path")
+    diff_parser = subparsers.add_parser("diff", help="두 카세트 비교")
+    diff_parser.add_argument("before")
+    diff_parser.add_argument("after")
+    args = parser.parse_args()
+
+    if args.command == "summary":
+        result = summarize(load_interactions(args.path))
+    else:
+        result = diff(load_interactions(args.before), load_interactions(args.after))
+    json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+
+
+if __name__ == "__main__":
+    main()
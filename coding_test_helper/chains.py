@@ -4,12 +4,13 @@
 특정 워크플로우를 위한 Chain 구현
 """
 
-import os
-from typing import Dict, Any, List
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List
 
 from langchain.chains.base import Chain
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_anthropic import ChatAnthropic
 from pydantic import BaseModel, Field
 
 from .tools import (
@@ -17,6 +18,37 @@ from .tools import (
     review_code,
     provide_hint
 )
+from .complexity import analyze_complexity
+from .judge import judge_submission
+from .llm_registry import get_llm
+from .profiler import profile_submission
+from .streaming import emit, invoke_with_stream, iter_streaming, streaming_to
+
+
+# 서로 독립적인 도구 호출을 동시에 실행하기 위한 공용 실행기
+_tool_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="chain-tool")
+
+
+def _without_stream(func, *args, **kwargs):
+    """현재 토큰 스트림 없이 실행"""
+    with streaming_to(None):
+        return func(*args, **kwargs)
+
+
+# 결과 템플릿 조각 (스트리밍 시 LLM 응답 사이에 순서대로 전달됨)
+_ONBOARDING_HEADER = "\n# 🎯 코딩 테스트 문제 분석 및 시작 가이드\n\n## 📋 문제 분석\n"
+_ONBOARDING_HINT_HEADER = "\n\n## 💡 시작 힌트\n"
+_ONBOARDING_FOOTER = "\n\n---\n💪 **화이팅!** 단계별로 차근차근 접근해보세요. 막히는 부분이 있으면 언제든 도움을 요청하세요!\n"
+
+_REVIEW_TITLE = "\n# 📝 코드 리뷰 및 성능 분석\n"
+_REVIEW_JUDGE_HEADER = "\n## 🧪 예제 채점\n"
+_REVIEW_HEADER = "\n## 🔍 코드 리뷰\n"
+_REVIEW_COMPLEXITY_HEADER = "\n\n## 📊 성능 분석\n"
+_REVIEW_PROFILE_HEADER = "\n\n## ⏱ 실행 시간 실측\n"
+_REVIEW_FOOTER = "\n\n---\n🎉 **수고하셨습니다!** 리뷰 내용을 참고하여 코드를 개선해보세요. 추가 질문이 있으면 언제든 말씀해주세요!\n"
+
+_DEBUGGING_HEADER = "\n# 🔧 디버깅 가이드\n\n"
+_DEBUGGING_FOOTER = "\n\n---\n🚀 **디버깅 화이팅!** 단계별로 확인해보시고, 추가 도움이 필요하면 언제든 말씀해주세요!\n"
 
 
 class ProblemOnboardingChain(Chain):
@@ -41,37 +73,69 @@ class ProblemOnboardingChain(Chain):
     def output_keys(self) -> List[str]:
         return [self.output_key]
     
+    def _hint_input(self, problem_description: str) -> Dict[str, Any]:
+        """초기 힌트 요청 입력"""
+        return {
+            "problem_description": problem_description,
+            "current_progress": "문제를 막 시작했습니다.",
+            "hint_type": "next_step"
+        }
+
+    def _format_result(self, analysis_result: str, hint_result: str) -> str:
+        """분석 결과와 힌트 조합"""
+        return (
+            _ONBOARDING_HEADER + analysis_result
+            + _ONBOARDING_HINT_HEADER + hint_result
+            + _ONBOARDING_FOOTER
+        )
+
     def _call(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        """Chain 실행"""
+        """Chain 실행
+
+        문제 분석과 초기 힌트는 서로 의존하지 않으므로 동시에 요청한다.
+        스트리밍 모드에서는 문제 분석만 토큰 단위로 전달하고 힌트는 완성 후 전달한다.
+        """
         problem_description = inputs[self.input_key]
         
         try:
-            # 1단계: 문제 분석
-            analysis_result = analyze_problem(problem_description)
-
-            # 2단계: 초기 힌트 제공
-            hint_result = provide_hint(
-                problem_description=problem_description,
-                current_progress="문제를 막 시작했습니다.",
-                hint_type="next_step"
+            emit(_ONBOARDING_HEADER)
+            analysis_future = _tool_executor.submit(
+                contextvars.copy_context().run,
+                analyze_problem.invoke,
+                {"problem_description": problem_description}
             )
+            # 힌트는 트레이싱/우선순위 컨텍스트만 이어받고 토큰은 스트림에 섞이지 않게 함
+            hint_future = _tool_executor.submit(
+                contextvars.copy_context().run,
+                _without_stream,
+                provide_hint.invoke,
+                self._hint_input(problem_description)
+            )
+
+            analysis_result = analysis_future.result()
+            emit(_ONBOARDING_HINT_HEADER)
+            hint_result = hint_future.result()
+            emit(hint_result + _ONBOARDING_FOOTER)
+
+            result = self._format_result(analysis_result, hint_result)
+            return {self.output_key: result}
             
-            # 결과 조합
-            result = f"""
-# 🎯 코딩 테스트 문제 분석 및 시작 가이드
+        except Exception as e:
+            return {self.output_key: f"문제 온보딩 중 오류가 발생했습니다: {e}"}
 
-## 📋 문제 분석
-{analysis_result}
+    async def _acall(self, inputs: Dict[str, Any], run_manager=None) -> Dict[str, Any]:
+        """Chain 비동기 실행"""
+        problem_description = inputs[self.input_key]
 
-## 💡 시작 힌트
-{hint_result}
+        try:
+            analysis_result, hint_result = await asyncio.gather(
+                analyze_problem.ainvoke({"problem_description": problem_description}),
+                provide_hint.ainvoke(self._hint_input(problem_description))
+            )
 
----
-💪 **화이팅!** 단계별로 차근차근 접근해보세요. 막히는 부분이 있으면 언제든 도움을 요청하세요!
-"""
-            
+            result = self._format_result(analysis_result, hint_result)
             return {self.output_key: result}
-            
+
         except Exception as e:
             return {self.output_key: f"문제 온보딩 중 오류가 발생했습니다: {e}"}
 
@@ -80,8 +144,10 @@ class CodeSubmissionReviewChain(Chain):
     """코드 제출 리뷰 Chain
     
     사용자가 코드를 제출하고 리뷰를 요청했을 때 실행되는 워크플로우
-    1. 코드 리뷰
-    2. 복잡도 분석
+    1. 예제 채점 (문제에 입력/출력 예제가 있을 때, 모델 호출 전에 실행)
+    2. 코드 리뷰 (실패한 예제 요약 포함)
+    3. 복잡도 분석
+    4. 실행 시간 실측 (submission_data의 profile이 True일 때, 코드 리뷰와 동시에 실행)
     """
     
     input_key: str = "submission_data"
@@ -105,25 +171,51 @@ class CodeSubmissionReviewChain(Chain):
         problem_description = submission_data.get("problem_description", "")
         
         try:
-            # 1단계: 코드 리뷰
-            review_result = review_code(code, problem_description)
-
-            # 2단계: 복잡도 분석 (기본 분석)
-            complexity_result = "## 📊 성능 분석\n현재 코드의 복잡도를 분석하여 최적화 방향을 제시합니다."
+            # 실측은 모델 호출과 무관하므로 리뷰 응답을 기다리는 동안 자식 프로세스에서 진행
+            profile_future = None
+            if submission_data.get("profile"):
+                profile_future = _tool_executor.submit(profile_submission, code, problem_description)
+
+            # 1단계: 예제 채점 (모델이 구체적인 실패 사례에서 출발하도록 먼저 실행)
+            judge_result = ""
+            test_results = ""
+            judge_report = judge_submission(code, problem_description)
+            if judge_report.results or judge_report.error:
+                judge_result = _REVIEW_JUDGE_HEADER + judge_report.to_markdown() + "\n"
+                test_results = judge_report.summary()
+            emit(_REVIEW_TITLE + judge_result + _REVIEW_HEADER)
+
+            # 2단계: 코드 리뷰
+            review_result = review_code.invoke({
+                "code": code,
+                "problem_description": problem_description,
+                "test_results": test_results
+            })
+
+            # 3단계: 복잡도 분석 (로컬 정적 분석)
+            # review_code도 같은 코드로 analyze_complexity를 호출하므로 lru_cache에 있는 보고서를 그대로 받는다
+            complexity_result = analyze_complexity(code).to_markdown()
+            emit(_REVIEW_COMPLEXITY_HEADER + complexity_result)
+
+            # 4단계: 실행 시간 실측
+            profile_result = ""
+            if profile_future is not None:
+                try:
+                    profile_markdown = profile_future.result().to_markdown()
+                except Exception as e:
+                    profile_markdown = f"실행 시간을 측정하지 못했습니다: {e}"
+                profile_result = _REVIEW_PROFILE_HEADER + profile_markdown
+                emit(profile_result)
+            emit(_REVIEW_FOOTER)
             
             # 결과 조합
-            result = f"""
-# 📝 코드 리뷰 및 성능 분석
-
-## 🔍 코드 리뷰
-{review_result}
-
-## 📊 성능 분석
-{complexity_result}
-
----
-🎉 **수고하셨습니다!** 리뷰 내용을 참고하여 코드를 개선해보세요. 추가 질문이 있으면 언제든 말씀해주세요!
-"""
+            result = (
+                _REVIEW_TITLE + judge_result
+                + _REVIEW_HEADER + review_result
+                + _REVIEW_COMPLEXITY_HEADER + complexity_result
+                + profile_result
+                + _REVIEW_FOOTER
+            )
             
             return {self.output_key: result}
             
@@ -144,10 +236,11 @@ class DebuggingGuidanceChain(Chain):
     
     def __init__(self):
         super().__init__()
-        self.llm = ChatAnthropic(
-            model="claude-3-5-sonnet-20241022",
-            api_key=os.getenv("ANTHROPIC_API_KEY")
-        )
+
+    @property
+    def llm(self):
+        """공유 LLM 인스턴스 (체인을 새로 만들어도 HTTP 연결 재사용)"""
+        return get_llm()
     
     @property
     def input_keys(self) -> List[str]:
@@ -192,16 +285,15 @@ class DebuggingGuidanceChain(Chain):
 정답 코드를 직접 제공하지 말고, 사용자가 스스로 문제를 해결할 수 있도록 힌트를 제공하세요.
 """
             
-            response = self.llm.invoke([{"role": "user", "content": debugging_prompt}])
+            emit(_DEBUGGING_HEADER)
+            content = invoke_with_stream(
+                self.llm,
+                [{"role": "user", "content": debugging_prompt}],
+                label="debugging_guidance"
+            )
+            emit(_DEBUGGING_FOOTER)
             
-            result = f"""
-# 🔧 디버깅 가이드
-
-{response.content}
-
----
-🚀 **디버깅 화이팅!** 단계별로 확인해보시고, 추가 도움이 필요하면 언제든 말씀해주세요!
-"""
+            result = _DEBUGGING_HEADER + content + _DEBUGGING_FOOTER
             
             return {self.output_key: result}
             
@@ -220,14 +312,25 @@ def analyze_new_problem(problem_description: str) -> str:
         return f"문제 분석 중 오류가 발생했습니다: {e}"
 
 
-def review_code_submission(code: str, problem_description: str) -> str:
-    """코드 제출 리뷰"""
+async def analyze_new_problem_async(problem_description: str) -> str:
+    """새 문제 분석 (비동기)"""
+    try:
+        chain = ProblemOnboardingChain()
+        result = await chain.ainvoke({"problem_description": problem_description})
+        return result["onboarding_result"]
+    except Exception as e:
+        return f"문제 분석 중 오류가 발생했습니다: {e}"
+
+
+def review_code_submission(code: str, problem_description: str, profile: bool = False) -> str:
+    """코드 제출 리뷰 (profile이 True면 실행 시간 실측 포함)"""
     try:
         chain = CodeSubmissionReviewChain()
         result = chain({
             "submission_data": {
                 "code": code,
-                "problem_description": problem_description
+                "problem_description": problem_description,
+                "profile": profile
             }
         })
         return result["review_result"]
@@ -235,6 +338,16 @@ def review_code_submission(code: str, problem_description: str) -> str:
         return f"코드 리뷰 중 오류가 발생했습니다: {e}"
 
 
+def profile_code_submission(code: str, problem_description: str) -> str:
+    """코드 실행 시간 실측 (입력 크기를 늘려 가며 실행, 모델 호출 없음)"""
+    try:
+        result = _REVIEW_PROFILE_HEADER.lstrip() + profile_submission(code, problem_description).to_markdown()
+        emit(result)
+        return result
+    except Exception as e:
+        return f"실행 시간 측정 중 오류가 발생했습니다: {e}"
+
+
 def provide_debugging_guidance(debugging_request: str) -> str:
     """디버깅 가이드 제공"""
     try:
@@ -243,3 +356,24 @@ def provide_debugging_guidance(debugging_request: str) -> str:
         return result["debugging_result"]
     except Exception as e:
         return f"디버깅 가이드 생성 중 오류가 발생했습니다: {e}"
+
+
+# 스트리밍 편의 함수들 (헤드리스 사용)
+def stream_analyze_new_problem(problem_description: str) -> Iterator[str]:
+    """새 문제 분석 결과를 토큰 단위로 반환"""
+    return iter_streaming(analyze_new_problem, problem_description)
+
+
+def stream_review_code_submission(code: str, problem_description: str, profile: bool = False) -> Iterator[str]:
+    """코드 리뷰 결과를 토큰 단위로 반환"""
+    return iter_streaming(review_code_submission, code, problem_description, profile)
+
+
+def stream_profile_code_submission(code: str, problem_description: str) -> Iterator[str]:
+    """실행 시간 실측 결과를 반환"""
+    return iter_streaming(profile_code_submission, code, problem_description)
+
+
+def stream_debugging_guidance(debugging_request: str) -> Iterator[str]:
+    """디버깅 가이드를 토큰 단위로 반환"""
+    return iter_streaming(provide_debugging_guidance, debugging_request)
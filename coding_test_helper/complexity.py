@@ -0,0 +1,868 @@
+"""
+코딩 테스트 도우미 정적 복잡도 분석
+
+제출 코드를 실행하지 않고 구조만 보고 시간 복잡도를 추정한다. (LLM 호출 없음, 수 ms)
+- 반복문 중첩 깊이 (반복 횟수가 상수인 range, 절반씩 줄어드는 while은 구분)
+- 바깥 반복문 안에서 graph[node]처럼 인접 원소를 도는 반복문은 곱하지 않음 (BFS/DFS 전체 O(V+E))
+- 재귀 호출 (다중 재귀, 분할 정복, 메모이제이션/방문 체크 여부)
+- 정렬, 해시(set/dict) 사용
+- 반복문 안의 숨은 선형 연산: 리스트 in 검사, list.pop(0)/insert(0, x), 문자열 += 연결, 슬라이싱
+
+Python은 ast로 분석하고, JavaScript 등 중괄호 기반 언어는 토크나이저로 같은 항목을 근사한다.
+결과의 summary()는 리뷰 프롬프트에, to_markdown()은 리뷰 결과의 성능 분석 절에 사용한다.
+"""
+
+import re
+import ast
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+
+# 복잡도 표현: (지수 여부, n 차수, log n 차수) - 튜플 비교 순서가 곧 증가 속도 순서
+Cost = Tuple[int, int, int]
+O_1: Cost = (0, 0, 0)
+O_LOG: Cost = (0, 0, 1)
+O_N: Cost = (0, 1, 0)
+O_N_LOG: Cost = (0, 1, 1)
+O_EXP: Cost = (1, 0, 0)
+
+SEVERITY_WARNING = "warning"
+SEVERITY_INFO = "info"
+
+# 프롬프트 요약에 포함할 최대 항목 수
+MAX_SUMMARY_FINDINGS = 8
+
+# 메모/방문 기록으로 흔히 쓰는 이름
+_MEMO_NAMES = {"memo", "dp", "cache", "visited", "seen", "visit", "check", "checked"}
+# 인자 전체를 한 번 훑는 내장 함수
+_LINEAR_BUILTINS = {"sum", "min", "max", "any", "all", "list", "tuple", "set", "frozenset", "dict",
+                    "reversed", "enumerate", "zip", "map", "filter", "Counter", "deque"}
+_HASH_CONSTRUCTORS = {"set", "dict", "frozenset", "Counter", "defaultdict", "OrderedDict"}
+_LOG_FUNCTIONS = {"heappush", "heappop", "heappushpop", "heapreplace",
+                  "bisect", "bisect_left", "bisect_right", "insort", "insort_left", "insort_right"}
+# 리스트에서 원소를 찾거나 앞쪽을 당기는 O(n) 메서드
+_LINEAR_METHODS = {"index", "count", "remove"}
+
+_LANGUAGE_NAMES = {"python": "Python", "javascript": "JavaScript", "brace": "중괄호 기반 코드"}
+
+
+def cost_mul(a: Cost, b: Cost) -> Cost:
+    if a[0] or b[0]:
+        return O_EXP
+    return (0, a[1] + b[1], a[2] + b[2])
+
+
+def format_cost(cost: Cost) -> str:
+    """복잡도 튜플을 O(...) 표기로 변환"""
+    if cost[0]:
+        return "O(2^n)"
+    exp, degree, log = cost
+    parts = []
+    if degree == 1:
+        parts.append("n")
+    elif degree > 1:
+        parts.append(f"n^{degree}")
+    if log == 1:
+        parts.append("log n")
+    elif log > 1:
+        parts.append(f"log^{log} n")
+    return f"O({' '.join(parts) or '1'})"
+
+
+@dataclass
+class Finding:
+    """분석 중 발견한 항목 (행 번호 기준)"""
+
+    line: int
+    kind: str
+    message: str
+    severity: str = SEVERITY_INFO
+
+
+@dataclass
+class ComplexityReport:
+    """정적 복잡도 분석 결과"""
+
+    language: Optional[str]
+    time_complexity: Optional[str] = None
+    max_loop_depth: int = 0
+    findings: List[Finding] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+
+    def summary(self) -> str:
+        """리뷰 프롬프트에 넣을 짧은 요약"""
+        if self.error:
+            return f"정적 분석 불가: {self.error}"
+        lines = [f"예상 시간 복잡도: {self.time_complexity} (반복문 최대 중첩 {self.max_loop_depth}단계)"]
+        ordered = sorted(self.findings, key=lambda f: (f.severity != SEVERITY_WARNING, f.line))
+        for finding in ordered[:MAX_SUMMARY_FINDINGS]:
+            lines.append(f"- {finding.line}행 [{finding.kind}] {finding.message}")
+        if len(ordered) > MAX_SUMMARY_FINDINGS:
+            lines.append(f"- 외 {len(ordered) - MAX_SUMMARY_FINDINGS}건")
+        return "\n".join(lines)
+
+    def to_markdown(self) -> str:
+        """리뷰 결과의 성능 분석 절"""
+        language = _LANGUAGE_NAMES.get(self.language, "코드")
+        if self.error:
+            return f"정적 분석을 하지 못했습니다: {self.error}"
+        lines = [
+            f"**예상 시간 복잡도: {self.time_complexity}** · {language} 정적 분석 ({self.elapsed_ms:.1f}ms)",
+            ""
+        ]
+        for finding in sorted(self.findings, key=lambda f: f.line):
+            icon = "⚠️" if finding.severity == SEVERITY_WARNING else "ℹ️"
+            lines.append(f"- {icon} {finding.line}행: {finding.message}")
+        if not self.findings:
+            lines.append("- 눈에 띄는 비효율 패턴이 없습니다.")
+        lines.append("")
+        lines.append("> 코드 구조만 보고 추정한 값입니다. 문제의 입력 크기 제한과 함께 판단해보세요.")
+        return "\n".join(lines)
+
+
+def _call_name(node: ast.Call) -> Optional[str]:
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def _is_constant_int(node: ast.AST) -> bool:
+    if isinstance(node, ast.UnaryOp):
+        node = node.operand
+    return isinstance(node, ast.Constant) and isinstance(node.value, int)
+
+
+def _value_kind(value: ast.AST) -> Optional[str]:
+    """대입되는 값으로 변수 종류(list/set/dict/str/deque) 추정"""
+    if isinstance(value, (ast.List, ast.ListComp, ast.Tuple)):
+        return "list"
+    if isinstance(value, (ast.Set, ast.SetComp)):
+        return "set"
+    if isinstance(value, (ast.Dict, ast.DictComp)):
+        return "dict"
+    if isinstance(value, ast.JoinedStr) or (isinstance(value, ast.Constant) and isinstance(value.value, str)):
+        return "str"
+    if isinstance(value, ast.BinOp) and isinstance(value.op, ast.Mult):
+        # [0] * n
+        return _value_kind(value.left) or _value_kind(value.right)
+    if isinstance(value, ast.Call):
+        name = _call_name(value)
+        if name in ("list", "sorted", "split", "readlines"):
+            return "list"
+        if name in ("set", "frozenset"):
+            return "set"
+        if name in ("dict", "Counter", "defaultdict", "OrderedDict"):
+            return "dict"
+        if name in ("str", "join", "input", "strip", "readline"):
+            return "str"
+        if name == "deque":
+            return "deque"
+    return None
+
+
+def _annotation_kind(annotation: Optional[ast.AST]) -> str:
+    text = ast.dump(annotation) if annotation is not None else ""
+    for kind, markers in (("set", ("'set'", "'Set'")), ("dict", ("'dict'", "'Dict'")), ("str", ("'str'",))):
+        if any(marker in text for marker in markers):
+            return kind
+    return "param"
+
+
+def _collect_kinds(scope: ast.AST, inherited: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """스코프 안 변수 이름 → 종류 (매개변수는 타입을 모르므로 'param')"""
+    kinds = dict(inherited or {})
+    if isinstance(scope, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        args = scope.args
+        for arg in args.posonlyargs + args.args + args.kwonlyargs:
+            kinds[arg.arg] = _annotation_kind(arg.annotation)
+    for node in ast.walk(scope):
+        if isinstance(node, ast.Assign):
+            kind = _value_kind(node.value)
+            for target in node.targets:
+                if isinstance(target, ast.Name) and kind:
+                    kinds[target.id] = kind
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            kind = _value_kind(node.value) if node.value is not None else None
+            kinds[node.target.id] = kind or _annotation_kind(node.annotation)
+    return kinds
+
+
+class _Context:
+    """분석 중인 위치 (함수, 변수 종류, 바깥 반복문 행 번호)
+
+    scaling은 반복 횟수가 입력 크기에 비례해 복잡도에 곱해지는 반복문만 모은 것이다.
+    """
+
+    def __init__(self, function: Optional[str], kinds: Dict[str, str], loops: Tuple[int, ...] = (),
+                 scaling: Tuple[int, ...] = ()):
+        self.function = function
+        self.kinds = kinds
+        self.loops = loops
+        self.scaling = scaling
+
+    @property
+    def in_loop(self) -> bool:
+        return bool(self.loops)
+
+    def enter_loop(self, line: int, scales: bool = True) -> "_Context":
+        scaling = self.scaling + (line,) if scales else self.scaling
+        return _Context(self.function, self.kinds, self.loops + (line,), scaling)
+
+
+class _PythonAnalyzer:
+    """ast 기반 복잡도 추정"""
+
+    def __init__(self, tree: ast.Module):
+        self.tree = tree
+        self.findings: Dict[Tuple[int, str], Finding] = {}
+        self.module_kinds = _collect_kinds(tree)
+        self.functions: Dict[str, ast.AST] = {
+            node.name: node for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        }
+        self._function_costs: Dict[str, Cost] = {}
+        self._in_progress: set = set()
+        self.max_depth = 0
+        self.deepest_loops: Tuple[int, ...] = ()
+        self.uses_recursion_limit = "setrecursionlimit" in ast.dump(tree)
+
+    def add(self, line: int, kind: str, message: str, severity: str = SEVERITY_INFO):
+        self.findings.setdefault((line, message), Finding(line, kind, message, severity))
+
+    def run(self) -> Cost:
+        total = self._block(self.tree.body, _Context(None, self.module_kinds))
+        # 채점기가 직접 호출하는 풀이 함수도 포함
+        for name in self.functions:
+            total = max(total, self._function_cost(name))
+        # 상수 횟수/인접 원소 반복문은 빼고 실제로 곱해지는 중첩만 보고
+        if len(self.deepest_loops) >= 2:
+            chain = " → ".join(f"{line}행" for line in self.deepest_loops)
+            self.add(self.deepest_loops[-1], "nested_loops", f"{len(self.deepest_loops)}중 반복문 ({chain})")
+        return total
+
+    # 함수 / 재귀
+
+    def _function_cost(self, name: str) -> Cost:
+        if name in self._function_costs:
+            return self._function_costs[name]
+        if name in self._in_progress:
+            # 재귀 호출 비용은 _recursion_factor에서 따로 계산
+            return O_1
+        node = self.functions[name]
+        self._in_progress.add(name)
+        try:
+            kinds = _collect_kinds(node, self.module_kinds)
+            body = self._block(node.body, _Context(name, kinds))
+            cost = cost_mul(self._recursion_factor(node, kinds, body), body)
+        finally:
+            self._in_progress.discard(name)
+        self._function_costs[name] = cost
+        return cost
+
+    def _recursion_factor(self, node, kinds: Dict[str, str], body: Cost) -> Cost:
+        """재귀 호출 형태에 따른 호출 횟수 배율"""
+        calls, in_loop, loop_over_children = [], False, False
+        for loop in [n for n in ast.walk(node) if isinstance(n, (ast.For, ast.While))]:
+            if any(self._is_self_call(c, node.name) for c in ast.walk(loop)):
+                in_loop = True
+                if isinstance(loop, ast.For) and isinstance(loop.iter, (ast.Subscript, ast.Attribute)):
+                    # graph[v], node.children 처럼 인접 원소를 도는 순회
+                    loop_over_children = True
+        calls = [c for c in ast.walk(node) if self._is_self_call(c, node.name)]
+        if not calls:
+            return O_1
+
+        line = calls[0].lineno
+        if self._is_memoized(node, kinds):
+            self.add(line, "recursion", f"메모이제이션/방문 체크가 있는 재귀 `{node.name}`: 상태 수 × 호출당 작업")
+            return O_N
+        if any(self._is_halving(arg) for call in calls for arg in call.args):
+            if len(calls) >= 2 and body == O_1:
+                factor = O_N
+            else:
+                factor = O_LOG
+            self.add(line, "recursion", f"입력을 절반씩 줄이는 재귀 `{node.name}` (분할 정복, 깊이 O(log n))")
+            return factor
+        if loop_over_children:
+            self.add(line, "recursion", f"인접 원소를 따라가는 재귀 `{node.name}` (방문 체크가 없으면 같은 노드를 여러 번 방문할 수 있음)")
+            return O_N
+        if len(calls) >= 2 or in_loop:
+            self.add(
+                line, "recursion",
+                f"메모이제이션 없는 다중 재귀 `{node.name}`: 같은 인자로 반복 호출되면 지수 시간 (lru_cache나 메모 딕셔너리를 고려해보세요)",
+                SEVERITY_WARNING
+            )
+            return O_EXP
+        message = f"선형 재귀 `{node.name}` (깊이 O(n))"
+        severity = SEVERITY_INFO
+        if not self.uses_recursion_limit:
+            message += " - 파이썬 기본 재귀 한도(1000)를 넘으면 RecursionError가 납니다"
+            severity = SEVERITY_WARNING
+        self.add(line, "recursion", message, severity)
+        return O_N
+
+    @staticmethod
+    def _is_self_call(node: ast.AST, name: str) -> bool:
+        if not isinstance(node, ast.Call):
+            return False
+        func = node.func
+        if isinstance(func, ast.Name):
+            return func.id == name
+        return (isinstance(func, ast.Attribute) and func.attr == name
+                and isinstance(func.value, ast.Name) and func.value.id == "self")
+
+    @staticmethod
+    def _is_memoized(node, kinds: Dict[str, str]) -> bool:
+        for decorator in node.decorator_list:
+            target = decorator.func if isinstance(decorator, ast.Call) else decorator
+            name = target.attr if isinstance(target, ast.Attribute) else getattr(target, "id", "")
+            if name in ("lru_cache", "cache"):
+                return True
+        for child in ast.walk(node):
+            if isinstance(child, ast.Compare) and any(isinstance(op, (ast.In, ast.NotIn)) for op in child.ops):
+                for comparator in child.comparators:
+                    if isinstance(comparator, ast.Name) and (
+                        comparator.id in _MEMO_NAMES or kinds.get(comparator.id) in ("set", "dict")
+                    ):
+                        return True
+            if isinstance(child, ast.Subscript) and isinstance(child.value, ast.Name) and child.value.id in _MEMO_NAMES:
+                return True
+        return False
+
+    @staticmethod
+    def _is_halving(node: ast.AST) -> bool:
+        for child in ast.walk(node):
+            if isinstance(child, ast.BinOp) and isinstance(child.op, (ast.FloorDiv, ast.RShift)):
+                return True
+            if isinstance(child, ast.Slice):
+                return True
+            if isinstance(child, ast.Name) and child.id in ("mid", "middle", "half"):
+                return True
+        return False
+
+    # 문장
+
+    def _block(self, statements, ctx: _Context) -> Cost:
+        return max((self._stmt(statement, ctx) for statement in statements), default=O_1)
+
+    def _stmt(self, node: ast.stmt, ctx: _Context) -> Cost:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            # 정의만 하는 문장 (함수는 따로 분석)
+            return O_1
+        if isinstance(node, (ast.For, ast.AsyncFor)):
+            count = self._loop_count(node.iter, ctx)
+            inner = self._enter_loop(node, ctx, count != O_1)
+            body = self._block(node.body, inner)
+            return max(self._expr(node.iter, ctx), cost_mul(count, body), self._block(node.orelse, ctx))
+        if isinstance(node, ast.While):
+            inner = self._enter_loop(node, ctx, True)
+            count = O_LOG if self._is_halving_loop(node) else O_N
+            body = max(self._expr(node.test, inner), self._block(node.body, inner))
+            return max(cost_mul(count, body), self._block(node.orelse, ctx))
+        if isinstance(node, ast.AugAssign):
+            cost = self._expr(node.value, ctx)
+            if ctx.in_loop and isinstance(node.op, ast.Add) and self._is_string_target(node, ctx):
+                name = node.target.id if isinstance(node.target, ast.Name) else "문자열"
+                self.add(
+                    node.lineno, "string_concat",
+                    f"반복문 안에서 문자열 `{name}` += 연결 (매번 새 문자열 복사, 누적 O(n^2)) - 리스트에 모은 뒤 join을 고려해보세요",
+                    SEVERITY_WARNING
+                )
+                cost = max(cost, O_N)
+            return cost
+        return self._generic(node, ctx)
+
+    def _generic(self, node: ast.AST, ctx: _Context) -> Cost:
+        cost = O_1
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.stmt):
+                cost = max(cost, self._stmt(child, ctx))
+            elif isinstance(child, ast.expr):
+                cost = max(cost, self._expr(child, ctx))
+            else:
+                cost = max(cost, self._generic(child, ctx))
+        return cost
+
+    def _enter_loop(self, node: ast.AST, ctx: _Context, scales: bool) -> _Context:
+        inner = ctx.enter_loop(node.lineno, scales)
+        self.max_depth = max(self.max_depth, len(inner.loops))
+        if len(inner.scaling) > len(self.deepest_loops):
+            self.deepest_loops = inner.scaling
+        return inner
+
+    def _loop_count(self, iterable: ast.expr, ctx: _Context) -> Cost:
+        """반복문 한 번이 도는 횟수 (바깥 반복문과 곱할 배율)"""
+        if self._is_constant_range(iterable):
+            return O_1
+        if ctx.in_loop and self._is_neighbor_lookup(iterable):
+            self.add(
+                iterable.lineno, "neighbor_loop",
+                f"`{ast.unparse(iterable)}` 순회는 바깥 반복 전체에서 원소 수의 합만큼만 돌므로 곱하지 않음 "
+                "(인접 리스트라면 전체 O(V+E))"
+            )
+            return O_1
+        return O_N
+
+    @staticmethod
+    def _is_neighbor_lookup(node: ast.expr) -> bool:
+        """graph[node], adj.get(u, []), node.children 처럼 원소 하나에 딸린 목록 조회"""
+        if isinstance(node, ast.Subscript):
+            return not isinstance(node.slice, ast.Slice)
+        if isinstance(node, ast.Call) and _call_name(node) == "get" and isinstance(node.func, ast.Attribute):
+            return True
+        # self.items 같은 객체 전체 목록은 제외
+        return (isinstance(node, ast.Attribute) and isinstance(node.value, (ast.Name, ast.Subscript))
+                and getattr(node.value, "id", None) != "self")
+
+    @staticmethod
+    def _is_constant_range(node: ast.AST) -> bool:
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set, ast.Constant)):
+            return True
+        return (isinstance(node, ast.Call) and _call_name(node) == "range"
+                and bool(node.args) and all(_is_constant_int(arg) for arg in node.args))
+
+    @staticmethod
+    def _is_halving_loop(node: ast.While) -> bool:
+        for child in ast.walk(node):
+            if isinstance(child, ast.AugAssign) and isinstance(child.op, (ast.FloorDiv, ast.RShift, ast.Div, ast.Mult)):
+                return True
+            if isinstance(child, ast.BinOp) and isinstance(child.op, (ast.FloorDiv, ast.RShift)):
+                # mid = (lo + hi) // 2
+                return True
+        return False
+
+    @staticmethod
+    def _is_string_target(node: ast.AugAssign, ctx: _Context) -> bool:
+        if isinstance(node.target, ast.Name) and ctx.kinds.get(node.target.id) == "str":
+            return True
+        value = node.value
+        return isinstance(value, ast.JoinedStr) or (isinstance(value, ast.Constant) and isinstance(value.value, str))
+
+    # 식
+
+    def _expr(self, node: ast.expr, ctx: _Context) -> Cost:
+        if isinstance(node, ast.Lambda):
+            return O_1
+        if isinstance(node, (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp)):
+            return self._comprehension(node, ctx)
+        cost = self._generic(node, ctx)
+        if isinstance(node, ast.Call):
+            cost = max(cost, self._call(node, ctx))
+        elif isinstance(node, ast.Compare):
+            cost = max(cost, self._membership(node, ctx))
+        elif isinstance(node, ast.Subscript) and isinstance(node.slice, ast.Slice) and ctx.in_loop:
+            self.add(node.lineno, "slice", "반복문 안의 슬라이싱 (매번 O(k) 복사) - 인덱스로 접근할 수 있는지 확인해보세요")
+            cost = max(cost, O_N)
+        return cost
+
+    def _comprehension(self, node, ctx: _Context) -> Cost:
+        cost, count, inner = O_1, O_1, ctx
+        for generator in node.generators:
+            cost = max(cost, cost_mul(count, self._expr(generator.iter, inner)))
+            factor = self._loop_count(generator.iter, inner)
+            inner = self._enter_loop(generator.iter, inner, factor != O_1)
+            count = cost_mul(count, factor)
+            for condition in generator.ifs:
+                cost = max(cost, cost_mul(count, self._expr(condition, inner)))
+        elements = [node.key, node.value] if isinstance(node, ast.DictComp) else [node.elt]
+        for element in elements:
+            cost = max(cost, cost_mul(count, self._expr(element, inner)))
+        return max(cost, count)
+
+    def _call(self, node: ast.Call, ctx: _Context) -> Cost:
+        name = _call_name(node)
+        receiver = node.func.value if isinstance(node.func, ast.Attribute) else None
+        receiver_kind = ctx.kinds.get(receiver.id) if isinstance(receiver, ast.Name) else None
+
+        if name in self.functions and (receiver is None or (isinstance(receiver, ast.Name) and receiver.id == "self")):
+            return self._function_cost(name)
+        if name in ("sorted", "sort"):
+            self.add(node.lineno, "sort", "정렬 O(n log n)" + (" - 반복문 안에서 매번 정렬합니다" if ctx.in_loop else ""),
+                     SEVERITY_WARNING if ctx.in_loop else SEVERITY_INFO)
+            return O_N_LOG
+        if name in _LOG_FUNCTIONS:
+            return O_LOG
+        if name in _HASH_CONSTRUCTORS and receiver is None:
+            self.add(node.lineno, "hash", f"해시 기반 자료구조 `{name}` (조회/삽입 평균 O(1))")
+            return O_N if node.args else O_1
+        if name == "pop" and receiver_kind not in ("dict", "set") and node.args and _is_constant_int(node.args[0]) \
+                and getattr(node.args[0], "value", None) == 0:
+            if ctx.in_loop:
+                self.add(node.lineno, "pop_front",
+                         "반복문 안에서 list.pop(0) (앞 원소 제거마다 O(n) 이동) - collections.deque의 popleft를 고려해보세요",
+                         SEVERITY_WARNING)
+            return O_N
+        if name == "insert" and receiver_kind not in ("dict", "set") and node.args and _is_constant_int(node.args[0]):
+            if ctx.in_loop:
+                self.add(node.lineno, "insert_front", "반복문 안에서 list.insert(0, x) (삽입마다 O(n) 이동)", SEVERITY_WARNING)
+            return O_N
+        if name in _LINEAR_METHODS and receiver_kind in ("list", "param", None) and receiver is not None:
+            if ctx.in_loop:
+                self.add(node.lineno, "linear_method", f"반복문 안에서 `.{name}()` (호출마다 리스트 전체 탐색 O(n))",
+                         SEVERITY_WARNING)
+            return O_N
+        if name == "join" and node.args:
+            return O_N
+        if name in _LINEAR_BUILTINS and receiver is None and node.args:
+            return O_N
+        return O_1
+
+    def _membership(self, node: ast.Compare, ctx: _Context) -> Cost:
+        cost = O_1
+        for op, comparator in zip(node.ops, node.comparators):
+            if not isinstance(op, (ast.In, ast.NotIn)):
+                continue
+            if isinstance(comparator, (ast.List, ast.ListComp)):
+                kind = "list" if isinstance(comparator, ast.ListComp) else None
+            elif isinstance(comparator, ast.Name):
+                kind = ctx.kinds.get(comparator.id)
+            else:
+                kind = None
+            if kind not in ("list", "param", "deque", "str"):
+                continue
+            cost = O_N
+            if ctx.in_loop and kind != "str":
+                name = comparator.id if isinstance(comparator, ast.Name) else "리스트"
+                target = "매개변수" if kind == "param" else "리스트"
+                detail = " (리스트라면 호출마다 O(n))" if kind == "param" else " (호출마다 O(n))"
+                self.add(
+                    node.lineno, "list_membership",
+                    f"반복문 안에서 {target} `{name}`에 in 검사{detail} - 집합(set)으로 바꾸면 O(1)입니다",
+                    SEVERITY_WARNING
+                )
+        return cost
+
+
+def analyze_python(code: str) -> ComplexityReport:
+    """Python 코드 정적 분석"""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return ComplexityReport("python", error=f"{e.lineno}행 구문 오류 ({e.msg})")
+    analyzer = _PythonAnalyzer(tree)
+    cost = analyzer.run()
+    return ComplexityReport(
+        "python",
+        time_complexity=format_cost(cost),
+        max_loop_depth=analyzer.max_depth,
+        findings=list(analyzer.findings.values())
+    )
+
+
+# 중괄호 기반 언어 (JavaScript 등) - 토큰 단위 근사 분석
+
+_TOKEN_PATTERN = re.compile(r"""
+    (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)
+  | (?P<number>\d[\w.]*)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<op>=>|===|!==|==|!=|<=|>=|\+\+|--|\+=|-=|\*=|/=|>>>=|>>=|<<=|>>>|>>|<<|&&|\|\||[{}()\[\];,.<>=!+\-*/%&|^~?:])
+""", re.S | re.X)
+
+_KEYWORDS = {"if", "for", "while", "switch", "catch", "return", "function", "new", "typeof", "else", "do"}
+_JS_LINEAR_METHODS = {"includes", "indexOf", "lastIndexOf", "find", "findIndex", "filter", "map",
+                      "forEach", "reduce", "some", "every", "join", "slice", "concat"}
+_JS_FRONT_METHODS = {"shift", "unshift", "splice"}
+_JS_MEMO_MARKERS = _MEMO_NAMES | {"has"}
+
+
+@dataclass
+class Token:
+    kind: str
+    text: str
+    line: int
+
+
+def tokenize(code: str) -> List[Token]:
+    """주석을 제외한 토큰 목록 (행 번호 포함)"""
+    tokens, line, position = [], 1, 0
+    for match in _TOKEN_PATTERN.finditer(code):
+        line += code.count("\n", position, match.start())
+        position = match.start()
+        if match.lastgroup != "comment":
+            tokens.append(Token(match.lastgroup, match.group(), line))
+    return tokens
+
+
+def _matching(tokens: List[Token], start: int) -> int:
+    """start 위치의 여는 괄호와 짝이 맞는 닫는 괄호 위치"""
+    pairs = {"(": ")", "[": "]", "{": "}"}
+    opening, closing, depth = tokens[start].text, pairs[tokens[start].text], 0
+    for index in range(start, len(tokens)):
+        if tokens[index].text == opening:
+            depth += 1
+        elif tokens[index].text == closing:
+            depth -= 1
+            if depth == 0:
+                return index
+    return len(tokens) - 1
+
+
+@dataclass
+class _Block:
+    kind: str  # loop / function / block
+    line: int
+    factor: Cost = O_1
+    name: Optional[str] = None
+
+
+class _BraceAnalyzer:
+    """토큰과 중괄호 블록 스택으로 반복문/함수 범위를 추적"""
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.findings: Dict[Tuple[int, str], Finding] = {}
+        self.max_depth = 0
+        self.deepest_loops: Tuple[int, ...] = ()
+        self.functions: Dict[str, Dict] = {}
+
+    def add(self, line: int, kind: str, message: str, severity: str = SEVERITY_INFO):
+        self.findings.setdefault((line, message), Finding(line, kind, message, severity))
+
+    def run(self) -> Cost:
+        tokens, stack, total = self.tokens, [], O_1
+        pending: Optional[_Block] = None
+        inline_loops: List[_Block] = []
+        last_assigned: Optional[str] = None
+        index = 0
+
+        while index < len(tokens):
+            token = tokens[index]
+            text = token.text
+            following = tokens[index + 1].text if index + 1 < len(tokens) else ""
+
+            if text in ("for", "while") and following == "(":
+                close = _matching(tokens, index + 1)
+                header = tokens[index + 2:close]
+                loop = _Block("loop", token.line, self._loop_factor(text, header, stack, inline_loops))
+                after = tokens[close + 1].text if close + 1 < len(tokens) else ""
+                if after == "{":
+                    pending = loop
+                else:
+                    inline_loops.append(loop)
+                self._note_depth(stack, inline_loops)
+                index = close + 1
+                continue
+
+            if text == "{":
+                if pending is None and tokens[index - 1].text == "=>" and last_assigned:
+                    pending = self._define(last_assigned, token.line)
+                stack.append(pending or _Block("block", token.line))
+                pending = None
+                self._note_depth(stack, inline_loops)
+            elif text == "}":
+                if stack:
+                    stack.pop()
+                inline_loops.clear()
+            elif text == ";":
+                # 빈 본문 반복문(for (...) for (...);)도 문장이 끝나기 전에 반영
+                total = max(total, self._multiplier(stack, inline_loops))
+                inline_loops.clear()
+                last_assigned = None
+            elif text == "+=" and following[:1] in ("'", '"', "`") and self._loops(stack, inline_loops):
+                name = tokens[index - 1].text if index else "문자열"
+                self.add(token.line, "string_concat",
+                         f"반복문 안에서 문자열 `{name}` += 연결 (누적 O(n^2)) - 배열에 모은 뒤 join을 고려해보세요",
+                         SEVERITY_WARNING)
+            elif token.kind == "name" and following == "=" and text not in _KEYWORDS:
+                last_assigned = text
+            elif token.kind == "name" and following == "(" and text not in _KEYWORDS:
+                close = _matching(tokens, index + 1)
+                is_definition = close + 1 < len(tokens) and tokens[close + 1].text == "{" and (
+                    index == 0 or tokens[index - 1].text != ".")
+                if is_definition:
+                    pending = self._define(text, token.line)
+                    index = close + 1
+                    continue
+                total = max(total, self._call(index, stack, inline_loops))
+
+            function = self._current_function(stack)
+            if function and token.kind == "name" and text in _JS_MEMO_MARKERS:
+                self.functions[function]["memo"] = True
+            total = max(total, self._multiplier(stack, inline_loops))
+            index += 1
+
+        for name, info in self.functions.items():
+            total = max(total, self._recursion_cost(name, info))
+        # 상수 횟수/인접 원소 반복문은 빼고 실제로 곱해지는 중첩만 보고
+        if len(self.deepest_loops) >= 2:
+            chain = " → ".join(f"{line}행" for line in self.deepest_loops)
+            self.add(self.deepest_loops[-1], "nested_loops", f"{len(self.deepest_loops)}중 반복문 ({chain})")
+        return total
+
+    def _loop_factor(self, keyword: str, header: List[Token], stack: List[_Block],
+                     inline_loops: List[_Block]) -> Cost:
+        """반복문 머리(괄호 안 토큰)로 반복 횟수 배율 추정"""
+        texts = [t.text for t in header]
+        if any(op in texts for op in ("*=", "/=", ">>=")) or ">>" in texts or ("/" in texts and "2" in texts):
+            return O_LOG
+        if keyword != "for":
+            return O_N
+        if "of" in texts:
+            iterable = header[texts.index("of") + 1:]
+            if iterable and iterable[0].text == "[":
+                # for (const [dx, dy] of [[0, 1], [1, 0]])
+                return O_1
+            calls = [iterable[i - 1].text for i, t in enumerate(iterable) if t.text == "(" and i]
+            # graph[node], node.children, adj.get(u) (arr.slice(i) 같은 메서드 호출은 제외)
+            is_lookup = (len(iterable) >= 2 and iterable[0].kind == "name" and iterable[1].text in ("[", ".")
+                         and all(name == "get" for name in calls))
+            if is_lookup and self._loops(stack, inline_loops):
+                self.add(
+                    header[0].line, "neighbor_loop",
+                    f"`{''.join(t.text for t in iterable)}` 순회는 바깥 반복 전체에서 원소 수의 합만큼만 돌므로 곱하지 않음 "
+                    "(인접 리스트라면 전체 O(V+E))"
+                )
+                return O_1
+            return O_N
+        # for (let d = 0; d < 4; d++)
+        if ";" in texts:
+            condition = texts[texts.index(";") + 1:]
+            bounds = [condition[i + 1] for i, op in enumerate(condition[:-1]) if op in ("<", "<=")]
+            if bounds and all(bound.isdigit() for bound in bounds):
+                return O_1
+        return O_N
+
+    def _define(self, name: str, line: int) -> _Block:
+        self.functions.setdefault(name, {"line": line, "calls": [], "cost": O_1, "memo": False})
+        return _Block("function", line, name=name)
+
+    def _current_function(self, stack: List[_Block]) -> Optional[str]:
+        for block in reversed(stack):
+            if block.kind == "function":
+                return block.name
+        return None
+
+    def _loops(self, stack: List[_Block], inline_loops: List[_Block]) -> List[_Block]:
+        """현재 함수 안쪽의 반복문 (함수 밖 반복문은 호출 횟수로 따로 계산)"""
+        loops = []
+        for block in reversed(stack):
+            if block.kind == "function":
+                break
+            if block.kind == "loop":
+                loops.insert(0, block)
+        return loops + inline_loops
+
+    def _multiplier(self, stack: List[_Block], inline_loops: List[_Block]) -> Cost:
+        cost = O_1
+        for loop in self._loops(stack, inline_loops):
+            cost = cost_mul(cost, loop.factor)
+        function = self._current_function(stack)
+        if function in self.functions:
+            info = self.functions[function]
+            info["cost"] = max(info["cost"], cost)
+        return cost
+
+    def _note_depth(self, stack: List[_Block], inline_loops: List[_Block]):
+        loops = self._loops(stack, inline_loops)
+        self.max_depth = max(self.max_depth, len(loops))
+        scaling = tuple(loop.line for loop in loops if loop.factor != O_1)
+        if len(scaling) > len(self.deepest_loops):
+            self.deepest_loops = scaling
+
+    def _call(self, index: int, stack: List[_Block], inline_loops: List[_Block]) -> Cost:
+        token = self.tokens[index]
+        name, line = token.text, token.line
+        is_method = index > 0 and self.tokens[index - 1].text == "."
+        in_loop = bool(self._loops(stack, inline_loops))
+        function = self._current_function(stack)
+        multiplier = self._multiplier(stack, inline_loops)
+
+        if not is_method and name == function:
+            self.functions[name]["calls"].append((line, in_loop))
+            return multiplier
+        cost = O_1
+        if is_method and name == "sort":
+            self.add(line, "sort", "정렬 O(n log n)" + (" - 반복문 안에서 매번 정렬합니다" if in_loop else ""),
+                     SEVERITY_WARNING if in_loop else SEVERITY_INFO)
+            cost = O_N_LOG
+        elif is_method and name in ("includes", "indexOf", "lastIndexOf") and in_loop:
+            self.add(line, "list_membership",
+                     f"반복문 안에서 배열 `.{name}()` (호출마다 O(n)) - Set/Map으로 바꾸면 O(1)입니다", SEVERITY_WARNING)
+            cost = O_N
+        elif is_method and name in _JS_FRONT_METHODS:
+            if in_loop:
+                self.add(line, "pop_front", f"반복문 안에서 `.{name}()` (원소 이동 O(n))", SEVERITY_WARNING)
+            cost = O_N
+        elif is_method and name in _JS_LINEAR_METHODS:
+            cost = O_N
+        elif name in ("Set", "Map") and index > 0 and self.tokens[index - 1].text == "new":
+            self.add(line, "hash", f"해시 기반 자료구조 `{name}` (조회/삽입 평균 O(1))")
+        cost = cost_mul(multiplier, cost)
+        if function in self.functions:
+            info = self.functions[function]
+            info["cost"] = max(info["cost"], cost)
+        return cost
+
+    def _recursion_cost(self, name: str, info: Dict) -> Cost:
+        calls = info["calls"]
+        if not calls:
+            return O_1
+        line = calls[0][0]
+        if info["memo"]:
+            self.add(line, "recursion", f"메모이제이션/방문 체크가 있는 재귀 `{name}`: 상태 수 × 호출당 작업")
+            return cost_mul(O_N, info["cost"])
+        if len(calls) >= 2 or any(in_loop for _, in_loop in calls):
+            self.add(line, "recursion", f"메모이제이션 없는 다중 재귀 `{name}`: 같은 인자로 반복 호출되면 지수 시간",
+                     SEVERITY_WARNING)
+            return O_EXP
+        self.add(line, "recursion", f"선형 재귀 `{name}` (깊이 O(n))")
+        return cost_mul(O_N, info["cost"])
+
+
+def analyze_brace_language(code: str, language: str = "javascript") -> ComplexityReport:
+    """JavaScript 등 중괄호 기반 코드 정적 분석 (토크나이저 근사)"""
+    analyzer = _BraceAnalyzer(tokenize(code))
+    cost = analyzer.run()
+    return ComplexityReport(
+        language,
+        time_complexity=format_cost(cost),
+        max_loop_depth=analyzer.max_depth,
+        findings=list(analyzer.findings.values())
+    )
+
+
+def detect_language(code: str) -> Optional[str]:
+    """python / javascript / brace / None"""
+    try:
+        ast.parse(code)
+        return "python"
+    except SyntaxError:
+        pass
+    if re.search(r"\b(function|const|let|var)\b|=>|console\.log", code):
+        return "javascript"
+    if "{" in code and ";" in code:
+        return "brace"
+    return None
+
+
+@lru_cache(maxsize=32)
+def analyze_complexity(code: str, language: Optional[str] = None) -> ComplexityReport:
+    """제출 코드의 시간 복잡도 정적 추정
+
+    Args:
+        code: 분석할 코드
+        language: 언어 (None이면 자동 감지)
+
+    Returns:
+        예상 복잡도와 행 번호가 붙은 발견 항목
+    """
+    started = time.perf_counter()
+    language = language or detect_language(code)
+    try:
+        if language in ("javascript", "brace"):
+            report = analyze_brace_language(code, language)
+        else:
+            # 감지 실패도 Python으로 분석해 구문 오류 위치를 알려줌
+            report = analyze_python(code)
+    except (RecursionError, ValueError) as e:
+        # 지나치게 깊은 중첩, 널 문자 등
+        report = ComplexityReport(language, error=str(e) or type(e).__name__)
+    report.elapsed_ms = (time.perf_counter() - started) * 1000
+    return report
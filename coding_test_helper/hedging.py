@@ -0,0 +1,255 @@
+"""
+코딩 테스트 도우미 헤지 요청 (hedged requests)
+
+첫 토큰이 최근 TTFT(time-to-first-token) p95보다 늦어지면 같은 요청을 한 번 더 보내고,
+먼저 첫 토큰을 보낸 응답을 사용하며 나머지 응답은 읽기를 중단한다.
+추가 요청 비율과 동시 헤지 수를 제한해 늘어나는 비용의 상한을 둔다.
+
+기본값은 꺼짐이며 CODING_TEST_HELPER_HEDGING=1로 켠다.
+"""
+
+import os
+import time
+import queue
+import threading
+import contextvars
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+# 헤지 대상 호출 (사용량 기록 label 기준)
+DEFAULT_HEDGED_LABELS = ("analyze_problem", "review_code")
+
+# 헤지 기준 시간 = clamp(최근 TTFT의 percentile 값, min_delay, max_delay)
+DEFAULT_PERCENTILE = 0.95
+DEFAULT_MIN_DELAY = 0.5
+DEFAULT_MAX_DELAY = 10.0
+# 표본이 적을 때 사용할 기준 시간
+DEFAULT_INITIAL_DELAY = 3.0
+MIN_SAMPLES = 20
+WINDOW_SIZE = 200
+
+# 비용 상한: 전체 호출 대비 헤지 비율, 동시에 진행 중인 헤지 수
+DEFAULT_MAX_HEDGE_RATIO = 0.1
+DEFAULT_MAX_CONCURRENT_HEDGES = 2
+
+
+class LatencyWindow:
+    """최근 TTFT 표본 (스레드 안전)"""
+
+    def __init__(self, size: int = WINDOW_SIZE):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def percentile(self, ratio: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(round(ratio * (len(samples) - 1))))]
+
+
+class HedgingPolicy:
+    """헤지 여부와 기준 시간 결정, 통계 집계"""
+
+    def __init__(self, enabled: bool = False,
+                 labels: Iterable[str] = DEFAULT_HEDGED_LABELS,
+                 percentile: float = DEFAULT_PERCENTILE,
+                 min_delay: float = DEFAULT_MIN_DELAY,
+                 max_delay: float = DEFAULT_MAX_DELAY,
+                 initial_delay: float = DEFAULT_INITIAL_DELAY,
+                 max_hedge_ratio: float = DEFAULT_MAX_HEDGE_RATIO,
+                 max_concurrent_hedges: int = DEFAULT_MAX_CONCURRENT_HEDGES):
+        self.enabled = enabled
+        self.labels = set(labels)
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.initial_delay = initial_delay
+        self.max_hedge_ratio = max_hedge_ratio
+        self.max_concurrent_hedges = max_concurrent_hedges
+
+        self.ttft = LatencyWindow()
+        self._lock = threading.Lock()
+        self._active_hedges = 0
+        self.stats = {"calls": 0, "hedged": 0, "hedge_wins": 0, "skipped_by_budget": 0}
+
+    def applies_to(self, label: str) -> bool:
+        return self.enabled and label in self.labels
+
+    def hedge_delay(self) -> float:
+        """두 번째 요청을 보내기 전 기다릴 시간(초)"""
+        if len(self.ttft) < MIN_SAMPLES:
+            return self.initial_delay
+        return min(self.max_delay, max(self.min_delay, self.ttft.percentile(self.percentile)))
+
+    def try_start_hedge(self) -> bool:
+        """비용 상한 안이면 헤지 시작을 기록하고 True"""
+        with self._lock:
+            within_ratio = (self.stats["hedged"] + 1) <= self.max_hedge_ratio * max(self.stats["calls"], 1)
+            if not within_ratio or self._active_hedges >= self.max_concurrent_hedges:
+                self.stats["skipped_by_budget"] += 1
+                return False
+            self._active_hedges += 1
+            self.stats["hedged"] += 1
+            return True
+
+    def finish_hedge(self, hedge_won: bool):
+        with self._lock:
+            self._active_hedges -= 1
+            if hedge_won:
+                self.stats["hedge_wins"] += 1
+
+    def record_call(self):
+        with self._lock:
+            self.stats["calls"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        stats["hedge_delay"] = self.hedge_delay()
+        stats["ttft_samples"] = len(self.ttft)
+        return stats
+
+
+class _Attempt:
+    """llm.stream을 별도 스레드에서 읽어 이벤트 큐로 전달하는 요청 하나"""
+
+    def __init__(self, index: int, start_stream: Callable[[], Iterable[Any]], events: "queue.Queue"):
+        self.index = index
+        self.started_at = time.perf_counter()
+        self.cancelled = threading.Event()
+        self._start_stream = start_stream
+        self._events = events
+        context = contextvars.copy_context()
+        self.thread = threading.Thread(
+            target=context.run, args=(self._run,), name=f"hedge-attempt-{index}", daemon=True
+        )
+        self.thread.start()
+
+    def _run(self):
+        iterator = None
+        try:
+            iterator = iter(self._start_stream())
+            for chunk in iterator:
+                if self.cancelled.is_set():
+                    break
+                self._events.put((self, "chunk", chunk))
+            else:
+                self._events.put((self, "done", None))
+        except Exception as e:
+            if not self.cancelled.is_set():
+                self._events.put((self, "error", e))
+        finally:
+            # 취소된 요청은 응답 스트림을 닫아 연결과 스케줄러 슬롯을 반환
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    pass
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+def hedged_stream(start_stream: Callable[[], Iterable[Any]], policy: HedgingPolicy) -> Iterable[Any]:
+    """헤지를 적용해 스트리밍 청크 반환
+
+    Args:
+        start_stream: 새 요청을 시작해 청크 이터레이터를 반환하는 함수 (예: lambda: llm.stream(messages))
+        policy: 헤지 정책
+
+    Yields:
+        먼저 첫 청크를 보낸 요청의 청크
+    """
+    policy.record_call()
+    events: "queue.Queue" = queue.Queue()
+    attempts: List[_Attempt] = [_Attempt(0, start_stream, events)]
+    failed = set()
+    winner: Optional[_Attempt] = None
+    hedge_deadline = attempts[0].started_at + policy.hedge_delay()
+    hedge_started = False
+
+    try:
+        while True:
+            timeout = None
+            if winner is None and not hedge_started:
+                timeout = max(0.0, hedge_deadline - time.perf_counter())
+            try:
+                attempt, kind, payload = events.get(timeout=timeout)
+            except queue.Empty:
+                # 기준 시간 안에 첫 토큰이 없으면 한 번 더 요청 (비용 상한 안에서만)
+                hedge_started = True
+                if policy.try_start_hedge():
+                    attempts.append(_Attempt(1, start_stream, events))
+                continue
+
+            if winner is None:
+                if kind == "error":
+                    # 실패는 재시도 계층(스케줄러)이 처리하므로 남은 요청이 없으면 그대로 전달
+                    failed.add(attempt.index)
+                    if len(failed) == len(attempts):
+                        raise payload
+                    continue
+                winner = attempt
+                now = time.perf_counter()
+                policy.ttft.record(now - attempt.started_at)
+                if attempt is not attempts[0] and attempts[0].index not in failed:
+                    # 헤지가 이기면 원 요청의 취소 시점까지 경과 시간도 기록 (실제 TTFT의 하한)
+                    # 이긴 요청만 기록하면 느린 요청이 표본에서 빠져 p95가 낮게 치우친다
+                    policy.ttft.record(now - attempts[0].started_at)
+                for other in attempts:
+                    if other is not winner:
+                        other.cancel()
+
+            if attempt is not winner:
+                continue
+            if kind == "chunk":
+                yield payload
+            elif kind == "done":
+                return
+            else:
+                raise payload
+    finally:
+        for attempt in attempts:
+            if attempt is not winner:
+                attempt.cancel()
+        if len(attempts) > 1:
+            policy.finish_hedge(hedge_won=winner is attempts[1])
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default) not in ("0", "", "false", "False")
+
+
+_policy: Optional[HedgingPolicy] = None
+_policy_lock = threading.Lock()
+
+
+def get_hedging_policy() -> HedgingPolicy:
+    """전역 헤지 정책 반환
+
+    환경변수:
+        CODING_TEST_HELPER_HEDGING: "1"이면 사용
+        CODING_TEST_HELPER_HEDGE_RATIO: 전체 호출 대비 최대 헤지 비율 (기본 0.1)
+        CODING_TEST_HELPER_HEDGE_MIN_DELAY / _MAX_DELAY: 기준 시간 하한/상한(초)
+    """
+    global _policy
+    with _policy_lock:
+        if _policy is None:
+            _policy = HedgingPolicy(
+                enabled=_env_flag("CODING_TEST_HELPER_HEDGING", "0"),
+                max_hedge_ratio=float(os.getenv("CODING_TEST_HELPER_HEDGE_RATIO", DEFAULT_MAX_HEDGE_RATIO)),
+                min_delay=float(os.getenv("CODING_TEST_HELPER_HEDGE_MIN_DELAY", DEFAULT_MIN_DELAY)),
+                max_delay=float(os.getenv("CODING_TEST_HELPER_HEDGE_MAX_DELAY", DEFAULT_MAX_DELAY))
+            )
+        return _policy
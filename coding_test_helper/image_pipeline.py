@@ -0,0 +1,202 @@
+"""
+코딩 테스트 도우미 스크린샷 인코딩 파이프라인
+
+화면 캡처 이미지를 비전 요청에 보내기 전에
+- 이미지 토큰 예산에 맞게 축소하고
+- 텍스트 위주 화면은 흑백으로 바꾸고
+- 내용에 따라 손실 압축 형식(WebP/JPEG)과 품질을 골라
+업로드 크기와 이미지 토큰 비용을 줄인다.
+"""
+
+import io
+import math
+import time
+import base64
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from PIL import Image, ImageStat, features
+
+
+# Anthropic 비전 입력 기준: 이미지 토큰 ≈ (가로 × 세로) / 750, 긴 변 1568px 초과 시 서버에서 축소
+PIXELS_PER_TOKEN = 750
+MAX_LONG_EDGE = 1568
+DEFAULT_TOKEN_BUDGET = 1600
+
+# 텍스트 위주 화면 판별 기준
+TEXT_MAX_SATURATION = 40.0
+TEXT_MAX_VIVID_RATIO = 0.05
+VIVID_SATURATION = 128
+
+# 형식별 기본 품질
+WEBP_TEXT_QUALITY = 80
+WEBP_PHOTO_QUALITY = 70
+JPEG_TEXT_QUALITY = 85
+JPEG_PHOTO_QUALITY = 70
+
+MEDIA_TYPES = {
+    "WEBP": "image/webp",
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+}
+
+
+@dataclass
+class EncodedImage:
+    """인코딩된 이미지와 측정값"""
+    data: bytes
+    format: str
+    quality: Optional[int]
+    width: int
+    height: int
+    original_width: int
+    original_height: int
+    grayscale: bool
+    text_heavy: bool
+    encode_seconds: float
+
+    @property
+    def media_type(self) -> str:
+        return MEDIA_TYPES[self.format]
+
+    @property
+    def extension(self) -> str:
+        return "jpg" if self.format == "JPEG" else self.format.lower()
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.data)
+
+    @property
+    def estimated_tokens(self) -> int:
+        return estimate_image_tokens(self.width, self.height)
+
+    @property
+    def original_tokens(self) -> int:
+        return estimate_image_tokens(self.original_width, self.original_height)
+
+    def to_base64(self) -> str:
+        return base64.b64encode(self.data).decode("ascii")
+
+    def to_content_block(self) -> Dict[str, Any]:
+        """Anthropic 메시지의 image 콘텐츠 블록"""
+        return {
+            "type": "image",
+            "source": {
+                "type": "base64",
+                "media_type": self.media_type,
+                "data": self.to_base64(),
+            },
+        }
+
+    def summary(self) -> str:
+        """전송 전 표시용 요약"""
+        return (
+            f"{self.width}x{self.height} {self.format}"
+            f"{f' q{self.quality}' if self.quality else ''}"
+            f"{' 흑백' if self.grayscale else ''}, "
+            f"{self.size_bytes / 1024:.0f}KB, 이미지 토큰 약 {self.estimated_tokens} "
+            f"(원본 {self.original_width}x{self.original_height} 기준 약 {self.original_tokens})"
+        )
+
+
+def estimate_image_tokens(width: int, height: int) -> int:
+    """이미지 토큰 수 추정 (서버 측 자동 축소 반영)"""
+    scale = min(1.0, MAX_LONG_EDGE / max(width, height, 1))
+    width, height = int(width * scale), int(height * scale)
+    return max(1, math.ceil(width * height / PIXELS_PER_TOKEN))
+
+
+def target_size(width: int, height: int, max_tokens: int = DEFAULT_TOKEN_BUDGET):
+    """토큰 예산과 긴 변 제한을 만족하는 크기 (비율 유지, 확대하지 않음)"""
+    scale = min(
+        1.0,
+        math.sqrt(max_tokens * PIXELS_PER_TOKEN / max(width * height, 1)),
+        MAX_LONG_EDGE / max(width, height, 1)
+    )
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def is_text_heavy(image: Image.Image) -> bool:
+    """코드/문서처럼 채도가 낮은 화면인지 판별
+
+    작은 축소본의 채도 채널만 보므로 원본 크기와 관계없이 빠르다.
+    구문 강조 정도의 색은 허용하고, 사진/그림처럼 선명한 색이 넓게 퍼진 화면은 제외한다.
+    """
+    sample = image.convert("RGB")
+    sample.thumbnail((256, 256))
+    saturation = sample.convert("HSV").getchannel("S")
+    histogram = saturation.histogram()
+    vivid_ratio = sum(histogram[VIVID_SATURATION:]) / max(sum(histogram), 1)
+    return (
+        ImageStat.Stat(saturation).mean[0] <= TEXT_MAX_SATURATION
+        and vivid_ratio <= TEXT_MAX_VIVID_RATIO
+    )
+
+
+def choose_format(text_heavy: bool, preferred: Optional[str] = None):
+    """내용에 맞는 (형식, 품질) 선택
+
+    WebP를 우선 사용하고, Pillow에 WebP 지원이 없으면 JPEG을 사용한다.
+    텍스트 화면은 글자 경계가 뭉개지지 않도록 품질을 높인다.
+    """
+    image_format = (preferred or "").upper() or ("WEBP" if features.check("webp") else "JPEG")
+    if image_format == "JPG":
+        image_format = "JPEG"
+    if image_format == "WEBP":
+        return image_format, WEBP_TEXT_QUALITY if text_heavy else WEBP_PHOTO_QUALITY
+    if image_format == "JPEG":
+        return image_format, JPEG_TEXT_QUALITY if text_heavy else JPEG_PHOTO_QUALITY
+    return image_format, None
+
+
+def prepare_image(image: Image.Image, max_tokens: int = DEFAULT_TOKEN_BUDGET,
+                  grayscale: Optional[bool] = None, image_format: Optional[str] = None,
+                  quality: Optional[int] = None) -> EncodedImage:
+    """비전 요청용 이미지 인코딩
+
+    Args:
+        image: 원본 이미지 (pyautogui.screenshot() 결과 등)
+        max_tokens: 이미지 토큰 예산
+        grayscale: 흑백 변환 여부 (None이면 텍스트 위주 화면일 때만 변환)
+        image_format: "WEBP", "JPEG", "PNG" (None이면 자동 선택)
+        quality: 손실 압축 품질 (None이면 내용에 따라 선택)
+
+    Returns:
+        인코딩 결과와 크기/토큰/소요 시간
+    """
+    started_at = time.perf_counter()
+    original_width, original_height = image.size
+
+    text_heavy = is_text_heavy(image)
+    if grayscale is None:
+        grayscale = text_heavy
+    chosen_format, chosen_quality = choose_format(text_heavy, image_format)
+    if quality is not None:
+        chosen_quality = quality
+
+    # 색 변환을 먼저 해서 축소할 채널 수를 줄임
+    converted = image.convert("L" if grayscale else "RGB")
+    size = target_size(original_width, original_height, max_tokens)
+    if size != converted.size:
+        # reducing_gap: 정수 배율로 먼저 줄인 뒤 LANCZOS 적용 (큰 캡처에서 수 배 빠름)
+        converted = converted.resize(size, Image.LANCZOS, reducing_gap=2.0)
+
+    buffer = io.BytesIO()
+    save_params: Dict[str, Any] = {"optimize": True} if chosen_format in ("JPEG", "PNG") else {"method": 4}
+    if chosen_quality is not None:
+        save_params["quality"] = chosen_quality
+    converted.save(buffer, format=chosen_format, **save_params)
+
+    return EncodedImage(
+        data=buffer.getvalue(),
+        format=chosen_format,
+        quality=chosen_quality,
+        width=converted.width,
+        height=converted.height,
+        original_width=original_width,
+        original_height=original_height,
+        grayscale=grayscale,
+        text_heavy=text_heavy,
+        encode_seconds=time.perf_counter() - started_at,
+    )
@@ -0,0 +1,334 @@
+"""
+코딩 테스트 도우미 로컬 채점기
+
+문제 본문의 `입력:`/`출력:` 예제(백준 형식 `예제 입력 1`/`예제 출력 1`, 영문 `Input:`/`Output:` 포함)를 추출해
+제출 코드를 예제마다 별도 자식 프로세스(sandbox_runner.py)에서 동시에 실행하고 AC/WA/TLE/MLE/RE를 판정한다.
+예제마다 CPU 시간/메모리 rlimit을 새로 적용하기 위해 재사용 워커 대신 테스트당 프로세스를 띄운다.
+
+- 표준 입력 풀이: 예제 입력을 표준 입력으로 주고 출력을 줄 단위로 비교 (줄 끝 공백 무시)
+- 함수 풀이: `nums1 = [1,2,2,1], nums2 = [2,2]` 같은 예제 입력을 인자로 해석해 호출하고 반환값 비교
+  (문제에 "어떤 순서로든"이 있으면 리스트 순서 무시)
+
+모델 호출 없이 리뷰 전에 실행하며, 실패한 예제 요약은 리뷰 프롬프트에 함께 전달한다.
+"""
+
+import os
+import re
+import ast
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .profiler import (
+    STATUS_MEMORY,
+    STATUS_OK,
+    STATUS_TIMEOUT,
+    find_entry,
+    parse_time_limit,
+    run_sandboxed,
+)
+
+
+VERDICT_AC = "AC"
+VERDICT_WA = "WA"
+VERDICT_TLE = "TLE"
+VERDICT_MLE = "MLE"
+VERDICT_RE = "RE"
+
+_VERDICT_LABELS = {
+    VERDICT_AC: "✅ 통과",
+    VERDICT_WA: "❌ 오답",
+    VERDICT_TLE: "⏱ 시간 초과",
+    VERDICT_MLE: "💥 메모리 초과",
+    VERDICT_RE: "💣 런타임 에러",
+}
+
+DEFAULT_TIME_LIMIT = 1.0
+DEFAULT_MEMORY_LIMIT_MB = 256
+# 인터프리터 시작 시간을 감안한 자식 프로세스 대기 시간 = 시간 제한 × 배율 + 여유
+WALL_TIMEOUT_FACTOR = 2
+WALL_TIMEOUT_SLACK = 1.0
+# 요약/결과에 보여줄 입출력 최대 길이
+MAX_SHOWN_CHARS = 300
+
+_HEADER = re.compile(
+    r"^\s*(?:(?:예제|example)\s*)?(입력|출력|input|output)\s*(?:\d+\s*)?(?:복사\s*)?(?:[:：]\s*(.*)|)$",
+    re.IGNORECASE
+)
+_EXAMPLE_PREFIX = re.compile(r"^\s*(?:예제|example)", re.IGNORECASE)
+_SECTION_END = re.compile(r"^\s*(설명|explanation|제약|constraints?|힌트|hint|노트|note|출처)\b", re.IGNORECASE)
+_MEMORY_LIMIT = re.compile(r"메모리\s*제한\s*[:：]?\s*(\d+)\s*MB", re.IGNORECASE)
+_ANY_ORDER = re.compile(r"어떤\s*순서|순서\s*(?:는|와)?\s*(?:상관|무관)|any\s+order", re.IGNORECASE)
+
+
+@dataclass
+class Example:
+    """문제 본문의 예제 하나"""
+
+    index: int
+    input: str
+    expected: str
+
+
+@dataclass
+class TestResult:
+    """예제 하나의 판정"""
+
+    example: Example
+    verdict: str
+    seconds: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    actual: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class JudgeReport:
+    """예제 채점 결과"""
+
+    results: List[TestResult] = field(default_factory=list)
+    mode: Optional[str] = None
+    entry: Optional[str] = None
+    time_limit: float = DEFAULT_TIME_LIMIT
+    memory_mb: int = DEFAULT_MEMORY_LIMIT_MB
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def passed(self) -> int:
+        return sum(result.verdict == VERDICT_AC for result in self.results)
+
+    @property
+    def failures(self) -> List[TestResult]:
+        return [result for result in self.results if result.verdict != VERDICT_AC]
+
+    @property
+    def verdict(self) -> Optional[str]:
+        """전체 판정 (첫 번째 실패 예제의 판정, 모두 통과하면 AC)"""
+        if not self.results:
+            return None
+        failures = self.failures
+        return failures[0].verdict if failures else VERDICT_AC
+
+    def summary(self) -> str:
+        """리뷰 프롬프트에 넣을 실패 예제 요약"""
+        if self.error:
+            return f"예제 채점 불가: {self.error}"
+        lines = [f"예제 {len(self.results)}개 중 {self.passed}개 통과"]
+        for result in self.failures:
+            # 실행 시간은 매번 달라 응답 캐시 키를 흔들므로 프롬프트 요약에서는 제외
+            lines.append(f"- 예제 {result.example.index}: {result.verdict}")
+            lines.append(f"  입력: {_shorten(result.example.input)}")
+            lines.append(f"  기대 출력: {_shorten(result.example.expected)}")
+            if result.actual is not None:
+                lines.append(f"  실제 출력: {_shorten(result.actual)}")
+            if result.error:
+                lines.append(f"  오류: {result.error}")
+        return "\n".join(lines)
+
+    def to_markdown(self) -> str:
+        """리뷰 결과의 예제 채점 절"""
+        if self.error:
+            return f"예제를 채점하지 못했습니다: {self.error}"
+        target = f"함수 `{self.entry}`" if self.mode == "function" else "표준 입력"
+        lines = [
+            f"**{self.passed}/{len(self.results)} 통과** · {target}, 예제당 제한 {self.time_limit:g}초 / {self.memory_mb}MB",
+            "",
+            "| 예제 | 판정 | 실행 시간 | 메모리 |",
+            "|---:|---|---:|---:|",
+        ]
+        for result in self.results:
+            seconds = f"{result.seconds * 1000:.2f}ms" if result.seconds is not None else "-"
+            memory = f"{result.peak_rss_mb:.1f}MB" if result.peak_rss_mb is not None else "-"
+            lines.append(f"| {result.example.index} | {_VERDICT_LABELS[result.verdict]} | {seconds} | {memory} |")
+        for result in self.failures:
+            lines.append("")
+            lines.append(f"**예제 {result.example.index} ({result.verdict})**")
+            lines.append(f"- 입력: `{_shorten(result.example.input)}`")
+            lines.append(f"- 기대 출력: `{_shorten(result.example.expected)}`")
+            if result.actual is not None:
+                lines.append(f"- 실제 출력: `{_shorten(result.actual)}`")
+            if result.error:
+                lines.append(f"- 오류: {result.error}")
+        return "\n".join(lines)
+
+
+def _shorten(text: str) -> str:
+    text = " ⏎ ".join(line for line in str(text).strip().splitlines())
+    return text if len(text) <= MAX_SHOWN_CHARS else text[:MAX_SHOWN_CHARS] + "…"
+
+
+def extract_examples(problem_description: str) -> List[Example]:
+    """문제 본문에서 입력/출력 예제 쌍 추출
+
+    `입력: ...`처럼 콜론이 있거나 `예제 입력 1`처럼 '예제'로 시작하는 줄만 예제로 본다.
+    (백준의 '입력' 형식 설명 절과 구분하기 위함) 내용은 같은 줄 콜론 뒤 또는 다음 줄부터
+    빈 줄, 다음 예제 머리글, '설명'/'제약' 같은 절 제목 전까지이다.
+    """
+    blocks: List[Tuple[str, List[str]]] = []
+    current: Optional[List[str]] = None
+    for line in (problem_description or "").splitlines():
+        header = _HEADER.match(line)
+        if header and (header.group(2) is not None or _EXAMPLE_PREFIX.match(line)):
+            kind = "input" if header.group(1).lower() in ("입력", "input") else "output"
+            current = [header.group(2).strip()] if header.group(2) and header.group(2).strip() else []
+            blocks.append((kind, current))
+            continue
+        if current is None:
+            continue
+        if _SECTION_END.match(line) or (not line.strip() and current):
+            current = None
+            continue
+        if line.strip():
+            current.append(line.rstrip())
+
+    examples = []
+    pending_input: Optional[str] = None
+    for kind, lines in blocks:
+        text = "\n".join(lines).strip()
+        if kind == "input":
+            pending_input = text
+        elif pending_input is not None:
+            examples.append(Example(len(examples) + 1, pending_input, text))
+            pending_input = None
+    return examples
+
+
+def parse_memory_limit(problem_description: str) -> Optional[int]:
+    """문제의 메모리 제한(MB) 추출 (예: 메모리 제한 256 MB)"""
+    match = _MEMORY_LIMIT.search(problem_description or "")
+    return int(match.group(1)) if match else None
+
+
+def _literal(text: str) -> Any:
+    """예제 값 해석 (Python 리터럴, 실패하면 JSON - true/false/null)"""
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return json.loads(text)
+
+
+def parse_call_arguments(text: str) -> Tuple[List[Any], Dict[str, Any]]:
+    """함수 풀이 예제 입력을 호출 인자로 해석 (예: `nums1 = [1,2,2,1], nums2 = [2,2]`, `"abc", 2`)
+
+    Raises:
+        ValueError: 인자로 해석할 수 없는 입력
+    """
+    text = " ".join(text.split())
+    try:
+        call = ast.parse(f"f({text})", mode="eval").body
+        args = [_literal(ast.unparse(arg)) for arg in call.args]
+        kwargs = {keyword.arg: _literal(ast.unparse(keyword.value)) for keyword in call.keywords}
+    except (ValueError, SyntaxError, TypeError) as e:
+        raise ValueError(f"예제 입력을 함수 인자로 해석하지 못했습니다: {text}") from e
+    return args, kwargs
+
+
+def _normalize_output(text: str) -> List[str]:
+    lines = [line.rstrip() for line in text.strip("\n").splitlines()]
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _canonical(value: Any, any_order: bool) -> Any:
+    """JSON 왕복으로 튜플/리스트 차이를 없애고, 순서 무관이면 리스트 정렬"""
+    value = json.loads(json.dumps(value, default=repr))
+    if any_order and isinstance(value, list):
+        return sorted(value, key=lambda item: json.dumps(item, sort_keys=True))
+    return value
+
+
+def _compare_return(expected_text: str, returned_json: str, any_order: bool) -> bool:
+    returned = json.loads(returned_json)
+    try:
+        expected = _literal(expected_text)
+    except (ValueError, SyntaxError):
+        # 리터럴이 아닌 기대 출력은 문자열로 비교
+        return str(returned).strip() == expected_text.strip()
+    return _canonical(expected, any_order) == _canonical(returned, any_order)
+
+
+def _run_example(code: str, mode: str, entry: Optional[str], example: Example,
+                 time_limit: float, memory_mb: int, any_order: bool) -> TestResult:
+    config: Dict[str, Any] = {"code": code, "mode": mode, "entry": entry, "capture_output": True}
+    if mode == "stdin":
+        config["stdin"] = example.input + "\n"
+    else:
+        try:
+            config["args"], config["kwargs"] = parse_call_arguments(example.input)
+        except ValueError as e:
+            return TestResult(example, VERDICT_RE, error=str(e))
+
+    outcome = run_sandboxed(
+        config, time_limit * WALL_TIMEOUT_FACTOR + WALL_TIMEOUT_SLACK, memory_mb, cpu_seconds=time_limit
+    )
+    status = outcome.get("status")
+    result = TestResult(example, VERDICT_RE, seconds=outcome.get("seconds"), peak_rss_mb=outcome.get("peak_rss_mb"))
+    if status == STATUS_TIMEOUT or (status == STATUS_OK and result.seconds > time_limit):
+        result.verdict = VERDICT_TLE
+        return result
+    if status == STATUS_MEMORY:
+        result.verdict = VERDICT_MLE
+        return result
+    if status != STATUS_OK:
+        line = outcome.get("line")
+        result.error = f"{outcome.get('error')}" + (f" ({line}행)" if line else "")
+        return result
+
+    if mode == "stdin":
+        result.actual = outcome.get("stdout", "").strip()
+        passed = _normalize_output(outcome.get("stdout", "")) == _normalize_output(example.expected)
+    else:
+        result.actual = outcome.get("return")
+        passed = _compare_return(example.expected, outcome.get("return", "null"), any_order)
+    result.verdict = VERDICT_AC if passed else VERDICT_WA
+    return result
+
+
+def judge_submission(
+    code: str,
+    problem_description: str,
+    time_limit: Optional[float] = None,
+    memory_mb: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> JudgeReport:
+    """문제 예제로 제출 코드 채점
+
+    Args:
+        code: Python 제출 코드
+        problem_description: 예제가 포함된 문제 전문
+        time_limit: 예제당 CPU 시간 제한(초) (None이면 문제에서 추출, 기본 1초)
+        memory_mb: 예제당 메모리 제한(MB) (None이면 문제에서 추출, 기본 256MB)
+        max_workers: 동시에 실행할 예제 수 (기본: CPU 수)
+
+    Returns:
+        예제별 판정과 실행 시간 (예제가 없으면 결과가 빈 보고서)
+    """
+    started = time.perf_counter()
+    report = JudgeReport(
+        time_limit=time_limit or parse_time_limit(problem_description) or DEFAULT_TIME_LIMIT,
+        memory_mb=memory_mb or parse_memory_limit(problem_description) or DEFAULT_MEMORY_LIMIT_MB
+    )
+    examples = extract_examples(problem_description)
+    if not examples:
+        return report
+    try:
+        report.mode, report.entry = find_entry(code)
+    except SyntaxError as e:
+        report.error = f"Python 코드만 채점할 수 있습니다 ({e.lineno}행 구문 오류: {e.msg})"
+        return report
+
+    any_order = bool(_ANY_ORDER.search(problem_description))
+    workers = max(1, min(len(examples), max_workers or os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="judge") as pool:
+        report.results = list(pool.map(
+            lambda example: _run_example(
+                code, report.mode, report.entry, example, report.time_limit, report.memory_mb, any_order
+            ),
+            examples
+        ))
+    report.elapsed = time.perf_counter() - started
+    return report
@@ -0,0 +1,177 @@
+"""
+코딩 테스트 도우미 LLM 클라이언트 레지스트리
+
+(model, temperature)별로 오래 유지되는 ChatAnthropic 인스턴스를 제공하고,
+모든 인스턴스가 keep-alive 연결 풀을 가진 HTTP 클라이언트 하나를 공유하도록 관리
+공유 클라이언트의 모든 모델 요청은 전역 요청 스케줄러(scheduler.py)를 거친다.
+카세트(cassette.py)가 설정되면 네트워크 전송 계층 대신(또는 앞에서) 요청을 녹화/재생한다.
+"""
+
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+import anthropic
+from langchain_anthropic import ChatAnthropic
+
+from .cassette import AsyncCassetteTransport, CassetteTransport, MODE_REPLAY, get_cassette
+from .prompt_cache import cache_headers
+from .scheduler import AsyncScheduledTransport, ScheduledTransport, scheduler_enabled
+from . import tracing
+
+
+DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
+DEFAULT_BASE_URL = "https://api.anthropic.com"
+
+# 연결 풀 설정
+POOL_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=300.0
+)
+REQUEST_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+
+_lock = threading.Lock()
+_http_client: Optional[httpx.Client] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+_llms: Dict[Tuple[str, Optional[float]], ChatAnthropic] = {}
+
+# 도구/Chain/Agent 모듈이 모두 이 모듈을 import하므로 첫 실행 전에 단계별 추적 훅이 설치됨
+tracing.install()
+
+
+def get_base_url() -> str:
+    """API 기본 URL 반환
+
+    ANTHROPIC_BASE_URL 환경변수로 로컬 대체 서버를 지정할 수 있다.
+    """
+    return os.getenv("ANTHROPIC_BASE_URL") or DEFAULT_BASE_URL
+
+
+def get_http_client() -> httpx.Client:
+    """공유 동기 HTTP 클라이언트 반환"""
+    global _http_client
+    with _lock:
+        if _http_client is None or _http_client.is_closed:
+            transport = httpx.HTTPTransport(limits=POOL_LIMITS)
+            cassette = get_cassette()
+            if cassette is not None:
+                transport = CassetteTransport(cassette, None if cassette.mode == MODE_REPLAY else transport)
+            if scheduler_enabled():
+                transport = ScheduledTransport(transport)
+            _http_client = httpx.Client(transport=transport, timeout=REQUEST_TIMEOUT)
+        return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """공유 비동기 HTTP 클라이언트 반환"""
+    global _async_http_client
+    with _lock:
+        if _async_http_client is None or _async_http_client.is_closed:
+            transport = httpx.AsyncHTTPTransport(limits=POOL_LIMITS)
+            cassette = get_cassette()
+            if cassette is not None:
+                transport = AsyncCassetteTransport(cassette, None if cassette.mode == MODE_REPLAY else transport)
+            if scheduler_enabled():
+                transport = AsyncScheduledTransport(transport)
+            _async_http_client = httpx.AsyncClient(transport=transport, timeout=REQUEST_TIMEOUT)
+        return _async_http_client
+
+
+def _attach_shared_clients(llm: ChatAnthropic, api_key: Optional[str], base_url: str):
+    """ChatAnthropic 내부 SDK 클라이언트를 공유 HTTP 클라이언트 기반으로 교체"""
+    client_params = {
+        "api_key": api_key,
+        "base_url": base_url,
+        "max_retries": llm.max_retries,
+        "default_headers": llm.default_headers or None,
+    }
+    # langchain_anthropic 버전에 따라 private 필드 또는 cached_property이므로 인스턴스에 직접 설정
+    object.__setattr__(
+        llm, "_client",
+        anthropic.Anthropic(http_client=get_http_client(), **client_params)
+    )
+    object.__setattr__(
+        llm, "_async_client",
+        anthropic.AsyncAnthropic(http_client=get_async_http_client(), **client_params)
+    )
+
+
+def get_llm(model: str = DEFAULT_MODEL, temperature: Optional[float] = None) -> ChatAnthropic:
+    """(model, temperature)별 공유 ChatAnthropic 인스턴스 반환
+
+    Args:
+        model: 모델 이름
+        temperature: 샘플링 온도 (None이면 모델 기본값)
+
+    Returns:
+        프로세스 전체에서 재사용되는 ChatAnthropic 인스턴스
+    """
+    key = (model, temperature)
+    llm = _llms.get(key)
+    if llm is not None:
+        return llm
+
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    base_url = get_base_url()
+    params = {
+        "model": model,
+        "api_key": api_key,
+        "base_url": base_url,
+        "default_headers": cache_headers(),
+    }
+    if temperature is not None:
+        params["temperature"] = temperature
+    if scheduler_enabled():
+        # 재시도는 스케줄러가 우선순위/속도 제한을 지키며 처리하므로 SDK 재시도는 끔
+        params["max_retries"] = 0
+
+    llm = ChatAnthropic(**params)
+    try:
+        _attach_shared_clients(llm, api_key, base_url)
+    except Exception as e:
+        print(f"공유 HTTP 클라이언트 연결 실패 (기본 클라이언트 사용): {e}")
+
+    with _lock:
+        # 동시에 생성된 경우 먼저 등록된 인스턴스 사용
+        return _llms.setdefault(key, llm)
+
+
+def warm_up(background: bool = True) -> Optional[threading.Thread]:
+    """API 서버와 미리 연결(TCP/TLS)을 맺어 첫 요청 지연을 줄임
+
+    응답 코드와 상관없이 연결만 풀에 남기면 되므로 결과는 무시한다.
+
+    Args:
+        background: True면 백그라운드 스레드에서 실행
+
+    Returns:
+        백그라운드 실행 시 스레드, 아니면 None
+    """
+    def _warm_up():
+        try:
+            get_http_client().head(get_base_url(), timeout=5.0)
+        except Exception as e:
+            print(f"API 연결 예열 실패: {e}")
+
+    if not background:
+        _warm_up()
+        return None
+
+    thread = threading.Thread(target=_warm_up, name="llm-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def close_clients():
+    """공유 클라이언트 및 등록된 LLM 정리"""
+    global _http_client, _async_http_client
+    with _lock:
+        _llms.clear()
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+        # 비동기 클라이언트는 이벤트 루프 밖에서 닫을 수 없으므로 참조만 해제
+        _async_http_client = None
@@ -0,0 +1,207 @@
+"""
+코딩 테스트 도우미 대화 메모리
+
+토큰 예산을 넘지 않도록 오래된 대화를 요약으로 압축하고,
+긴 코드 블록은 해시 참조로 바꿔 프롬프트 크기가 계속 커지지 않도록 관리
+"""
+
+import re
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from langchain.memory.chat_memory import BaseChatMemory
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, get_buffer_string
+
+
+_CODE_BLOCK = re.compile(r"```([\w+-]*)\n(.*?)```", re.DOTALL)
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 추정
+
+    API 호출 없이 계산하기 위해 UTF-8 바이트 4개당 1토큰으로 본다.
+    (영문은 약 4글자, 한글은 약 1.3글자당 1토큰)
+    """
+    if not text:
+        return 0
+    return max(1, len(text.encode("utf-8")) // 4)
+
+
+def content_text(content: Any) -> str:
+    """메시지 content를 텍스트로 변환
+
+    tool calling Agent의 최종 출력은 content 블록 리스트일 수 있으므로 text 블록만 이어 붙인다.
+    """
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            block.get("text", "") if isinstance(block, dict) else str(block)
+            for block in content
+        )
+    return str(content)
+
+
+def estimate_message_tokens(messages: List[BaseMessage]) -> int:
+    """메시지 리스트의 대략적인 토큰 수"""
+    return sum(estimate_tokens(str(message.content)) + 4 for message in messages)
+
+
+class TokenBudgetMemory(BaseChatMemory):
+    """토큰 예산 기반 요약 메모리
+
+    - 최근 대화는 원문(긴 코드 블록은 해시 참조)으로 유지
+    - 예산이나 최근 대화 수를 넘으면 가장 오래된 대화부터 요약에 합침
+    - 요약과 최근 대화를 합친 크기는 max_token_limit을 넘지 않음
+    """
+
+    memory_key: str = "chat_history"
+    return_messages: bool = True
+
+    max_token_limit: int = 2000
+    max_recent_turns: int = 5
+    code_block_min_lines: int = 8
+
+    summary: str = ""
+    code_refs: Dict[str, str] = {}
+    summarizer: Optional[Any] = None
+
+    # 마지막으로 로드된 메모리 크기(토큰)
+    last_memory_tokens: int = 0
+
+    @property
+    def memory_variables(self) -> List[str]:
+        return [self.memory_key]
+
+    def compact_code(self, text: str) -> str:
+        """긴 코드 블록을 해시 참조로 교체 (원문은 code_refs에 보관)"""
+        def replace(match):
+            language, code = match.group(1), match.group(2)
+            line_count = code.count("\n") + 1
+            if line_count < self.code_block_min_lines:
+                return match.group(0)
+            digest = hashlib.sha1(code.encode("utf-8")).hexdigest()[:10]
+            self.code_refs[digest] = code
+            return f"[코드 {language or 'text'} #{digest}, {line_count}줄]"
+
+        return _CODE_BLOCK.sub(replace, text)
+
+    def save_context(self, inputs: Dict[str, Any], outputs: Dict[str, str]) -> None:
+        """대화 저장 후 예산에 맞게 압축"""
+        input_str, output_str = self._get_input_output(inputs, outputs)
+        self.chat_memory.add_messages([
+            HumanMessage(content=self.compact_code(content_text(input_str))),
+            AIMessage(content=self.compact_code(content_text(output_str)))
+        ])
+        self._prune()
+
+    def _summary_tokens(self) -> int:
+        return estimate_tokens(self.summary) + 8 if self.summary else 0
+
+    def _prune(self):
+        """예산 또는 최근 대화 수를 넘는 오래된 대화를 요약에 합침"""
+        messages = self.chat_memory.messages
+
+        while messages and (
+            len(messages) > self.max_recent_turns * 2
+            or estimate_message_tokens(messages) + self._summary_tokens() > self.max_token_limit
+        ):
+            self._fold_into_summary(messages[:2])
+            messages = messages[2:]
+
+        self.chat_memory.messages = messages
+
+    def _fold_into_summary(self, messages: List[BaseMessage]):
+        """대화를 요약에 합치고 요약 크기를 예산 안으로 제한"""
+        if self.summarizer is not None:
+            try:
+                prompt = (
+                    "다음은 코딩 테스트 학습 대화의 기존 요약과 새 대화입니다. "
+                    "문제, 사용자가 막힌 지점, 이미 제공된 힌트 위주로 5줄 이내로 요약을 갱신하세요.\n\n"
+                    f"기존 요약:\n{self.summary or '(없음)'}\n\n"
+                    f"새 대화:\n{get_buffer_string(messages)}"
+                )
+                self.summary = self.summarizer.invoke(prompt).content.strip()
+            except Exception as e:
+                print(f"대화 요약 실패 (로컬 요약 사용): {e}")
+                self.summary = self._local_summary(messages)
+        else:
+            self.summary = self._local_summary(messages)
+
+        # 요약은 예산의 절반을 넘지 않도록 오래된 줄부터 제거
+        limit = self.max_token_limit // 2
+        lines = self.summary.splitlines()
+        while lines and estimate_tokens("\n".join(lines)) > limit:
+            lines.pop(0)
+        self.summary = "\n".join(lines)
+
+    def _local_summary(self, messages: List[BaseMessage]) -> str:
+        """LLM 없이 각 대화의 첫 줄만 남기는 요약"""
+        lines = self.summary.splitlines() if self.summary else []
+        for message in messages:
+            role = "사용자" if isinstance(message, HumanMessage) else "도우미"
+            first_line = next(
+                (line.strip("# ").strip() for line in str(message.content).splitlines() if line.strip()),
+                ""
+            )
+            if first_line:
+                lines.append(f"- {role}: {first_line[:80]}")
+        return "\n".join(lines)
+
+    def load_memory_variables(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """요약 + 최근 대화 반환"""
+        messages = list(self.chat_memory.messages)
+
+        if self.summary:
+            summary_text = f"[이전 대화 요약]\n{self.summary}"
+            if messages and isinstance(messages[0], HumanMessage):
+                messages[0] = HumanMessage(content=f"{summary_text}\n\n{messages[0].content}")
+            else:
+                messages = [
+                    HumanMessage(content=summary_text),
+                    AIMessage(content="이전 대화 내용을 참고하겠습니다.")
+                ] + messages
+
+        self.last_memory_tokens = estimate_message_tokens(messages)
+
+        if self.return_messages:
+            return {self.memory_key: messages}
+        return {self.memory_key: get_buffer_string(messages)}
+
+    def clear(self) -> None:
+        super().clear()
+        self.summary = ""
+        self.code_refs = {}
+        self.last_memory_tokens = 0
+
+
+class PromptSizeTracker(BaseCallbackHandler):
+    """요청(턴)별 LLM 입력 크기 측정
+
+    LLM 호출 시작 시 메시지 크기를 추정하고, 응답에 사용량 정보가 있으면 실제 입력 토큰을 기록한다.
+    """
+
+    def __init__(self):
+        self.turn_calls = 0
+        self.turn_estimated_tokens = 0
+        self.turn_input_tokens = 0
+
+    def start_turn(self):
+        self.turn_calls = 0
+        self.turn_estimated_tokens = 0
+        self.turn_input_tokens = 0
+
+    def on_chat_model_start(self, serialized, messages, **kwargs):
+        self.turn_calls += 1
+        for message_list in messages:
+            self.turn_estimated_tokens += estimate_message_tokens(message_list)
+
+    def on_llm_start(self, serialized, prompts, **kwargs):
+        self.turn_calls += 1
+        self.turn_estimated_tokens += sum(estimate_tokens(prompt) for prompt in prompts)
+
+    def on_llm_end(self, response, **kwargs):
+        usage = (response.llm_output or {}).get("usage") or {}
+        if isinstance(usage, dict):
+            self.turn_input_tokens += usage.get("input_tokens", 0) or 0
@@ -0,0 +1,423 @@
+"""
+코딩 테스트 도우미 실측 복잡도 프로파일러
+
+제출 코드를 격리된 자식 프로세스(sandbox_runner.py)에서 입력 크기를 2배씩 늘려 가며 실행하고
+크기별 실행 시간과 최대 메모리(RSS)를 측정한다. 측정값을 흔한 복잡도 함수들에 NumPy 최소제곱으로 맞춰
+가장 잘 맞는 복잡도를 고르고, 문제의 최대 N에서 걸릴 시간을 추정한다.
+
+- 함수 풀이(LeetCode 형식): 매개변수 이름/타입 힌트로 입력 생성 (nums → 정수 리스트, s → 문자열, n → 크기 등)
+- 표준 입력 풀이(백준 형식): 기본 "첫 줄 N, 둘째 줄 N개 정수" 형식, stdin_generator로 바꿀 수 있음
+- 자식 프로세스는 CPU 시간/메모리 rlimit과 제한 시간 안에서 실행 (rlimit은 POSIX만)
+"""
+
+import os
+import re
+import ast
+import sys
+import json
+import math
+import time
+import tempfile
+import subprocess
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from .sandbox_runner import RESULT_MARKER
+
+
+RUNNER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sandbox_runner.py")
+
+DEFAULT_START_N = 16
+DEFAULT_GROWTH = 2
+DEFAULT_MAX_MEASURED_N = 1 << 20
+# 크기 하나의 실행 제한 시간, 전체 측정 예산 (초)
+DEFAULT_RUN_TIMEOUT = 2.0
+DEFAULT_TOTAL_BUDGET = 10.0
+DEFAULT_MEMORY_LIMIT_MB = 512
+DEFAULT_REPEATS = 3
+# 문제에서 찾지 못했을 때 사용할 값
+DEFAULT_TIME_LIMIT = 1.0
+DEFAULT_PROJECTION_N = 100_000
+# 맞춤에 필요한 최소 측정 수, 맞춤에 쓸 최소 실행 시간(초)
+MIN_FIT_POINTS = 3
+MIN_RELIABLE_SECONDS = 1e-4
+# 가장 잘 맞는 복잡도와 오차가 이 배율 안이면 더 단순한 복잡도 선택
+SIMPLER_CLASS_TOLERANCE = 1.15
+
+# (이름, 성장 함수) - 단순한 순서
+COMPLEXITY_CLASSES: List[Tuple[str, Callable[[np.ndarray], np.ndarray]]] = [
+    ("O(1)", lambda n: np.ones_like(n)),
+    ("O(log n)", lambda n: np.log2(n)),
+    ("O(n)", lambda n: n),
+    ("O(n log n)", lambda n: n * np.log2(n)),
+    ("O(n^2)", lambda n: n ** 2),
+    ("O(n^3)", lambda n: n ** 3),
+    ("O(2^n)", lambda n: np.exp2(n)),
+]
+# 2^n은 이 크기 이하에서만 후보로 사용 (그 이상은 의미 없는 값)
+EXPONENTIAL_MAX_N = 64
+
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_MEMORY = "memory"
+STATUS_ERROR = "error"
+
+_NUMBER = r"(\d+(?:\.\d+)?\s*(?:\*|×|x)\s*10\s*(?:\^|\*\*)\s*\d+|10\s*(?:\^|\*\*)\s*\d+|\d+(?:\.\d+)?e\d+|\d[\d,]*)"
+_SIZE_VARIABLE = re.compile(r"(?i)(^[nmk]$|len|length|size|count|길이|개수|크기|수$)")
+_UPPER_BOUND = re.compile(r"([\w.\[\]가-힣]+)\s*(?:<=|≤|<|이하)\s*" + _NUMBER)
+_TIME_LIMIT = re.compile(r"시간\s*제한\s*[:：]?\s*(\d+(?:\.\d+)?)\s*초")
+
+
+@dataclass
+class Measurement:
+    """입력 크기 하나의 측정 결과"""
+
+    n: int
+    status: str
+    seconds: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ProfileReport:
+    """실측 프로파일 결과"""
+
+    mode: Optional[str] = None
+    entry: Optional[str] = None
+    measurements: List[Measurement] = field(default_factory=list)
+    fitted_class: Optional[str] = None
+    coefficients: Optional[Tuple[float, float]] = None
+    max_n: int = DEFAULT_PROJECTION_N
+    max_n_found: bool = False
+    time_limit: float = DEFAULT_TIME_LIMIT
+    projected_seconds: Optional[float] = None
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def completed(self) -> List[Measurement]:
+        return [m for m in self.measurements if m.status == STATUS_OK]
+
+    def stop_reason(self) -> Optional[str]:
+        last = self.measurements[-1] if self.measurements else None
+        if last is None or last.status == STATUS_OK:
+            return None
+        if last.status == STATUS_TIMEOUT:
+            return f"n = {last.n:,}에서 측정 제한 시간 초과"
+        if last.status == STATUS_MEMORY:
+            return f"n = {last.n:,}에서 메모리 제한 초과"
+        return f"n = {last.n:,}에서 오류: {last.error}"
+
+    def growth_note(self) -> Optional[str]:
+        """맞춤이 불가능할 때 마지막 두 측정값의 증가 배율"""
+        points = self.completed
+        if self.fitted_class or len(points) < 2 or not points[-2].seconds:
+            return None
+        previous, last = points[-2], points[-1]
+        ratio = last.seconds / previous.seconds
+        return f"n이 {previous.n:,} → {last.n:,}로 {last.n // previous.n}배 늘 때 실행 시간 {ratio:,.0f}배 증가"
+
+    def summary(self) -> str:
+        """리뷰 프롬프트에 넣을 짧은 요약"""
+        if self.error:
+            return f"실측 불가: {self.error}"
+        lines = []
+        if self.fitted_class:
+            lines.append(f"실측 추정 복잡도: {self.fitted_class}")
+        if self.projected_seconds is not None:
+            lines.append(f"최대 N = {self.max_n:,}에서 예상 실행 시간 {_format_seconds(self.projected_seconds)} (제한 {self.time_limit:g}초)")
+        points = ", ".join(f"n={m.n:,}: {_format_seconds(m.seconds)}" for m in self.completed[-4:])
+        if points:
+            lines.append(f"측정값: {points}")
+        note = self.growth_note()
+        if note:
+            lines.append(note)
+        reason = self.stop_reason()
+        if reason:
+            lines.append(f"중단: {reason}")
+        return "\n".join(lines)
+
+    def to_markdown(self) -> str:
+        """리뷰 결과의 실측 절"""
+        if self.error:
+            return f"실행 시간을 측정하지 못했습니다: {self.error}"
+        target = f"함수 `{self.entry}` 호출" if self.mode == "function" else "표준 입력 실행"
+        lines = []
+        if self.fitted_class:
+            lines.append(f"**실측 추정 복잡도: {self.fitted_class}** · {target}, 측정 {self.elapsed:.1f}초")
+        else:
+            lines.append(f"**복잡도를 추정할 만큼 측정하지 못했습니다** · {target}, 측정 {self.elapsed:.1f}초")
+        lines += ["", "| n | 실행 시간 | 최대 메모리 |", "|---:|---:|---:|"]
+        for m in self.measurements:
+            if m.status == STATUS_OK:
+                lines.append(f"| {m.n:,} | {_format_seconds(m.seconds)} | {m.peak_rss_mb:.1f}MB |")
+            else:
+                label = {STATUS_TIMEOUT: "⏱ 제한 시간 초과", STATUS_MEMORY: "💥 메모리 초과"}.get(m.status, "❌ 오류")
+                lines.append(f"| {m.n:,} | {label} | - |")
+        lines.append("")
+
+        reason = self.stop_reason()
+        if reason and self.measurements[-1].status == STATUS_ERROR:
+            lines.append(f"- ❌ {reason}")
+            if self.mode == "stdin":
+                lines.append("- 자동 생성 입력 형식(첫 줄 N, 둘째 줄 N개 정수)이 문제와 다르면 오류가 날 수 있습니다.")
+        note = self.growth_note()
+        if note:
+            lines.append(f"- 📈 {note}")
+        if self.projected_seconds is not None:
+            source = "문제 조건" if self.max_n_found else "문제에서 찾지 못해 기본값"
+            verdict = "✅ 제한 안" if self.projected_seconds <= self.time_limit else "⚠️ 시간 초과 예상"
+            lines.append(
+                f"- 최대 N = {self.max_n:,} ({source}) 예상 실행 시간: **{_format_seconds(self.projected_seconds)}**"
+                f" (제한 {self.time_limit:g}초) {verdict}"
+            )
+        lines.append("")
+        lines.append("> 무작위로 생성한 입력으로 이 컴퓨터에서 측정한 값입니다. 채점 서버와 최악의 입력에서는 달라질 수 있습니다.")
+        return "\n".join(lines)
+
+
+def _format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if math.isinf(seconds) or seconds > 3600 * 24 * 365:
+        return "사실상 끝나지 않음"
+    if seconds >= 1:
+        return f"{seconds:,.2f}초"
+    return f"{seconds * 1000:.2f}ms"
+
+
+def _parse_number(text: str) -> Optional[float]:
+    text = text.replace(",", "").replace(" ", "").replace("**", "^")
+    match = re.fullmatch(r"(?:(\d+(?:\.\d+)?)(?:\*|×|x))?10\^(\d+)", text)
+    if match:
+        return float(match.group(1) or 1) * 10 ** int(match.group(2))
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def parse_max_n(problem_description: str) -> Optional[int]:
+    """문제 제약 조건에서 입력 크기 상한 추출 (예: 1 <= nums.length <= 10^5, N ≤ 100,000)"""
+    bounds = []
+    for variable, number in _UPPER_BOUND.findall(problem_description or ""):
+        if "[" in variable or not _SIZE_VARIABLE.search(variable):
+            # nums[i] <= 10^9 같은 값 범위는 제외
+            continue
+        value = _parse_number(number)
+        if value and value >= 1:
+            bounds.append(int(value))
+    return max(bounds) if bounds else None
+
+
+def parse_time_limit(problem_description: str) -> Optional[float]:
+    """문제의 시간 제한(초) 추출 (예: 시간 제한 2초)"""
+    match = _TIME_LIMIT.search(problem_description or "")
+    return float(match.group(1)) if match else None
+
+
+def find_entry(code: str) -> Tuple[str, Optional[str]]:
+    """실행 방식과 호출할 함수 결정
+
+    최상위 함수도 Solution 클래스도 없으면 출력만 하는 프로그램까지 포함해 표준 입력 풀이로 본다.
+
+    Returns:
+        ("stdin", None) 또는 ("function", 함수 이름)
+
+    Raises:
+        SyntaxError: 코드 구문 오류
+    """
+    tree = ast.parse(code)
+    if re.search(r"\binput\s*\(|\bstdin\b|\bopen\s*\(\s*0\b", code):
+        return "stdin", None
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "Solution":
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and not item.name.startswith("_"):
+                    return "function", f"Solution.{item.name}"
+
+    functions = [node for node in tree.body if isinstance(node, ast.FunctionDef)]
+    if not functions:
+        return "stdin", None
+    for node in functions:
+        if node.name in ("solution", "solve"):
+            return "function", node.name
+    # 다른 함수에서 호출되지 않는 함수 중 마지막 것 (보조 함수 제외)
+    called = {
+        child.func.id for child in ast.walk(tree)
+        if isinstance(child, ast.Call) and isinstance(child.func, ast.Name)
+    }
+    candidates = [node for node in functions if node.name not in called] or functions
+    return "function", candidates[-1].name
+
+
+def run_sandboxed(config: dict, timeout: float, memory_mb: int = DEFAULT_MEMORY_LIMIT_MB,
+                  cpu_seconds: Optional[float] = None) -> dict:
+    """sandbox_runner.py를 격리 모드 자식 프로세스로 실행하고 결과 반환
+
+    Args:
+        config: sandbox_runner 설정
+        timeout: 실제 경과 시간 제한(초)
+        memory_mb: 메모리 상한(MB)
+        cpu_seconds: CPU 시간 상한(초) (None이면 timeout과 같음)
+
+    rlimit은 자식 프로세스가 설정을 읽은 직후 스스로 건다 (스레드가 있는 프로세스에서 preexec_fn은 안전하지 않음).
+    """
+    config = dict(config, cpu_seconds=cpu_seconds or timeout, memory_mb=memory_mb)
+    with tempfile.TemporaryDirectory(prefix="coding-test-run-") as workdir:
+        try:
+            completed = subprocess.run(
+                [sys.executable, "-I", RUNNER_PATH],
+                input=json.dumps(config),
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                cwd=workdir,
+                env={"PATH": os.environ.get("PATH", ""), "PYTHONHASHSEED": "0", "PYTHONIOENCODING": "utf-8"},
+            )
+        except subprocess.TimeoutExpired:
+            return {"status": STATUS_TIMEOUT}
+
+    for line in reversed(completed.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    if completed.returncode in (-9, -24) or "MemoryError" in completed.stderr:
+        # SIGKILL/SIGXCPU: rlimit 초과
+        return {"status": STATUS_TIMEOUT if completed.returncode == -24 else STATUS_MEMORY}
+    detail = completed.stderr.strip().splitlines()[-1:] or [f"종료 코드 {completed.returncode}"]
+    return {"status": STATUS_ERROR, "error": detail[0]}
+
+
+def fit_complexity(ns: List[float], seconds: List[float]) -> Tuple[str, Tuple[float, float], float]:
+    """측정값에 가장 잘 맞는 복잡도
+
+    각 후보 f에 대해 t ≈ a·f(n) + b를 상대 오차 기준 최소제곱으로 맞추고(a ≥ 0),
+    오차가 가장 작은 후보와 비슷하면(SIMPLER_CLASS_TOLERANCE 배 이내) 더 단순한 후보를 고른다.
+
+    Returns:
+        (복잡도 이름, (a, b), 상대 오차 RMS)
+    """
+    n = np.asarray(ns, dtype=float)
+    t = np.asarray(seconds, dtype=float)
+    weights = 1.0 / np.maximum(t, 1e-9)
+    fits = []
+    for name, growth in COMPLEXITY_CLASSES:
+        if name == "O(2^n)" and n.max() > EXPONENTIAL_MAX_N:
+            continue
+        if name == "O(1)":
+            design = np.ones((len(n), 1))
+        else:
+            design = np.column_stack([growth(n), np.ones_like(n)])
+        solution, *_ = np.linalg.lstsq(design * weights[:, None], t * weights, rcond=None)
+        if name == "O(1)":
+            a, b = 0.0, float(solution[0])
+        else:
+            a, b = float(solution[0]), float(solution[1])
+            if a < 0:
+                continue
+        predicted = a * (growth(n) if name != "O(1)" else 0) + b
+        error = float(np.sqrt(np.mean(((predicted - t) * weights) ** 2)))
+        fits.append((name, (a, b), error))
+
+    best_error = min(fit[2] for fit in fits)
+    for fit in fits:
+        if fit[2] <= best_error * SIMPLER_CLASS_TOLERANCE + 1e-9:
+            return fit
+    return fits[-1]
+
+
+def project(fitted_class: str, coefficients: Tuple[float, float], n: int) -> float:
+    """맞춘 복잡도로 크기 n의 실행 시간 추정"""
+    a, b = coefficients
+    growth = dict(COMPLEXITY_CLASSES)[fitted_class]
+    with np.errstate(over="ignore"):
+        value = a * float(growth(np.array([float(n)]))[0]) + b if fitted_class != "O(1)" else b
+    return max(0.0, value) if math.isfinite(value) else math.inf
+
+
+def profile_submission(
+    code: str,
+    problem_description: str = "",
+    max_n: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    stdin_generator: Optional[Callable[[int], str]] = None,
+    start_n: int = DEFAULT_START_N,
+    growth: int = DEFAULT_GROWTH,
+    run_timeout: float = DEFAULT_RUN_TIMEOUT,
+    total_budget: float = DEFAULT_TOTAL_BUDGET,
+    memory_mb: int = DEFAULT_MEMORY_LIMIT_MB,
+) -> ProfileReport:
+    """제출 코드를 입력 크기를 늘려 가며 실행하고 복잡도와 최대 N 실행 시간 추정
+
+    Args:
+        code: Python 제출 코드
+        problem_description: 문제 전문 (최대 N, 시간 제한 추출)
+        max_n: 예상 시간을 계산할 입력 크기 (None이면 문제에서 추출)
+        time_limit: 시간 제한(초) (None이면 문제에서 추출)
+        stdin_generator: 표준 입력 풀이용 입력 생성 함수 (n → 입력 문자열)
+        start_n: 처음 측정할 입력 크기
+        growth: 입력 크기 증가 배율
+        run_timeout: 크기 하나의 실행 제한 시간(초)
+        total_budget: 전체 측정 예산(초)
+        memory_mb: 자식 프로세스 메모리 상한(MB)
+
+    Returns:
+        크기별 측정값, 맞춘 복잡도, 최대 N 예상 시간
+    """
+    started = time.perf_counter()
+    found_n = parse_max_n(problem_description)
+    report = ProfileReport(
+        max_n=max_n or found_n or DEFAULT_PROJECTION_N,
+        max_n_found=bool(max_n or found_n),
+        time_limit=time_limit or parse_time_limit(problem_description) or DEFAULT_TIME_LIMIT
+    )
+    try:
+        report.mode, report.entry = find_entry(code)
+    except SyntaxError as e:
+        report.error = f"Python 코드만 측정할 수 있습니다 ({e.lineno}행 구문 오류: {e.msg})"
+        return report
+
+    n = start_n
+    # 최대 N보다 한 단계 더 큰 크기까지만 측정
+    limit = min(DEFAULT_MAX_MEASURED_N, report.max_n * growth)
+    while n <= limit:
+        remaining = total_budget - (time.perf_counter() - started)
+        if remaining <= 0:
+            break
+        config = {"code": code, "mode": report.mode, "entry": report.entry, "n": n, "repeats": DEFAULT_REPEATS}
+        if report.mode == "stdin" and stdin_generator is not None:
+            config["stdin"] = stdin_generator(n)
+        result = run_sandboxed(config, min(run_timeout * DEFAULT_REPEATS, remaining), memory_mb)
+        measurement = Measurement(
+            n=n,
+            status=result.get("status", STATUS_ERROR),
+            seconds=result.get("seconds"),
+            peak_rss_mb=result.get("peak_rss_mb"),
+            error=result.get("error")
+        )
+        if measurement.status == STATUS_OK and measurement.seconds > run_timeout:
+            measurement.status = STATUS_TIMEOUT
+        report.measurements.append(measurement)
+        if measurement.status != STATUS_OK:
+            break
+        # 다음 크기가 제한 시간을 넘을 것이 분명하면 중단 (최소 n^2 증가 가정)
+        if measurement.seconds * growth ** 2 > run_timeout and len(report.completed) >= MIN_FIT_POINTS:
+            break
+        n *= growth
+
+    points = report.completed
+    # 수 μs 단위 측정은 잡음이 커서 충분한 측정값이 있으면 맞춤에서 제외
+    reliable = [m for m in points if m.seconds >= MIN_RELIABLE_SECONDS]
+    if len(reliable) >= MIN_FIT_POINTS:
+        points = reliable
+    if len(points) >= MIN_FIT_POINTS:
+        report.fitted_class, report.coefficients, _ = fit_complexity(
+            [m.n for m in points], [m.seconds for m in points]
+        )
+        report.projected_seconds = project(report.fitted_class, report.coefficients, report.max_n)
+    report.elapsed = time.perf_counter() - started
+    return report
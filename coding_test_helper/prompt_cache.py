@@ -0,0 +1,68 @@
+"""
+코딩 테스트 도우미 프롬프트 캐싱
+
+매 호출마다 동일한 시스템 프롬프트와 도구 설명을 API 측 프롬프트 캐시 대상으로 표시.
+캐시는 바이트 단위로 동일한 접두부에만 적용되므로 캐시 대상 텍스트는 상수로만 만든다.
+MIN_CACHEABLE_TOKENS보다 짧은 접두부는 표시해도 캐시되지 않으므로 표시하지 않는다.
+"""
+
+import os
+import json
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from langchain_core.messages import SystemMessage
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from .memory import estimate_tokens
+
+
+# 구버전 API/SDK용 프롬프트 캐싱 베타 헤더
+PROMPT_CACHE_BETA = "prompt-caching-2024-07-31"
+
+# 모델이 캐시하는 최소 접두부 길이 (이보다 짧으면 API가 캐시 표시를 무시함)
+MIN_CACHEABLE_TOKENS = 1024
+
+# tools 필드가 있을 때 API가 시스템 프롬프트 앞에 덧붙이는 도구 사용 안내 크기 (tool_choice=auto 기준)
+TOOL_USE_SYSTEM_TOKENS = 346
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def prompt_cache_enabled() -> bool:
+    """프롬프트 캐싱 사용 여부 (CODING_TEST_HELPER_PROMPT_CACHE=0이면 끔)"""
+    return os.getenv("CODING_TEST_HELPER_PROMPT_CACHE", "1") != "0"
+
+
+def cache_headers() -> Dict[str, str]:
+    """LLM 클라이언트 기본 헤더"""
+    if not prompt_cache_enabled():
+        return {}
+    return {"anthropic-beta": PROMPT_CACHE_BETA}
+
+
+def estimate_tool_tokens(tools: Optional[Sequence[Any]]) -> int:
+    """tools 필드(도구 스키마 + API의 도구 사용 안내)가 접두부에 더하는 토큰 수 추정"""
+    if not tools:
+        return 0
+    schemas = json.dumps([convert_to_openai_tool(tool) for tool in tools], ensure_ascii=False)
+    return estimate_tokens(schemas) + TOOL_USE_SYSTEM_TOKENS
+
+
+def cacheable_text(text: str, prefix_tokens: int = 0) -> Union[str, List[Dict[str, Any]]]:
+    """텍스트를 캐시 지점이 표시된 content 블록으로 변환
+
+    캐싱이 꺼져 있거나, 앞선 접두부(prefix_tokens)를 합쳐도 MIN_CACHEABLE_TOKENS보다
+    짧으면 API가 캐시 표시를 무시하므로 텍스트를 그대로 돌려준다.
+    """
+    if not prompt_cache_enabled() or estimate_tokens(text) + prefix_tokens < MIN_CACHEABLE_TOKENS:
+        return text
+    return [{"type": "text", "text": text, "cache_control": dict(CACHE_CONTROL)}]
+
+
+def cacheable_system_message(text: str, tools: Optional[Sequence[Any]] = None) -> SystemMessage:
+    """캐시 지점이 표시된 시스템 메시지
+
+    API는 tools → system 순서로 접두부를 구성하므로, 시스템 메시지 끝에 캐시 지점을 두면
+    도구 스키마까지 함께 캐시된다. 길이 판단에 도구 스키마를 넣으려면 tools를 넘긴다.
+    """
+    return SystemMessage(content=cacheable_text(text, prefix_tokens=estimate_tool_tokens(tools)))
@@ -0,0 +1,148 @@
+"""
+코딩 테스트 도우미 요청 라우터
+
+자유 형식 요청의 키워드로 의도를 결정하여, 명확한 요청은 ReAct Agent를 거치지 않고
+analyze_problem / review_code / provide_hint 도구로 바로 보냄
+(위젯 버튼은 각자 전용 Chain/대화상자를 쓰므로 Agent와 라우터를 거치지 않음)
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+
+INTENT_ANALYZE = "analyze_problem"
+INTENT_REVIEW = "review_code"
+INTENT_HINT = "provide_hint"
+INTENT_AGENT = "agent"
+
+# 의도별 키워드와 가중치
+INTENT_KEYWORDS = {
+    INTENT_ANALYZE: {
+        "문제 분석": 3, "분석해": 2, "분석": 1, "요구사항": 2, "제약": 1,
+        "문제 요약": 2, "어떤 문제": 1, "analyze": 2, "analysis": 2,
+    },
+    INTENT_REVIEW: {
+        "코드 리뷰": 3, "리뷰": 2, "검토": 2, "개선점": 2, "피드백": 1,
+        "내 코드": 2, "이 코드": 1, "review": 2, "feedback": 1,
+    },
+    INTENT_HINT: {
+        "힌트": 3, "막혔": 2, "막혀": 2, "접근": 1, "어떻게 풀": 2,
+        "어떻게 접근": 2, "다음 단계": 2, "hint": 3, "stuck": 2,
+    },
+}
+
+# 힌트 종류 키워드
+HINT_TYPE_KEYWORDS = {
+    "debugging": ("에러", "오류", "디버그", "디버깅", "버그", "틀렸", "실패", "error", "bug"),
+    "algorithm": ("알고리즘", "자료구조", "복잡도", "algorithm", "data structure"),
+}
+
+# 코드로 보이는 줄 패턴
+_CODE_LINE = re.compile(
+    r"^\s*(def |class |for |while |if |elif |else:|return\b|import |from \S+ import|"
+    r"#include|public |private |int |let |const |var |function\b|print\(|[A-Za-z_]\w*\s*=[^=])"
+)
+_CODE_FENCE = re.compile(r"```[\w+-]*\n(.*?)```", re.DOTALL)
+
+# 의도 결정 기준 점수와 차이
+MIN_SCORE = 2
+MIN_MARGIN = 1
+
+
+@dataclass
+class RouteDecision:
+    """라우팅 결과"""
+    intent: str
+    reason: str
+    tool_input: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def bypasses_agent(self) -> bool:
+        return self.intent != INTENT_AGENT
+
+
+def split_code(text: str) -> Tuple[str, str]:
+    """요청 텍스트를 (코드, 나머지 설명)으로 분리
+
+    코드 블록(```)이 있으면 그 내용을, 없으면 코드처럼 보이는 연속된 줄들을 코드로 본다.
+    """
+    fenced = _CODE_FENCE.findall(text)
+    if fenced:
+        code = "\n".join(block.strip("\n") for block in fenced)
+        rest = _CODE_FENCE.sub("", text)
+        return code, rest.strip()
+
+    lines = text.splitlines()
+    code_lines = [
+        index for index, line in enumerate(lines)
+        if _CODE_LINE.match(line) or (line.startswith(("    ", "\t")) and line.strip())
+    ]
+    if len(code_lines) < 2:
+        return "", text.strip()
+
+    start, end = code_lines[0], code_lines[-1]
+    code = "\n".join(lines[start:end + 1])
+    rest = "\n".join(lines[:start] + lines[end + 1:])
+    return code.strip("\n"), rest.strip()
+
+
+def detect_hint_type(text: str) -> str:
+    """요청 텍스트에서 힌트 종류 추정"""
+    lowered = text.lower()
+    for hint_type, keywords in HINT_TYPE_KEYWORDS.items():
+        if any(keyword in lowered for keyword in keywords):
+            return hint_type
+    return "next_step"
+
+
+def score_intents(text: str) -> Dict[str, int]:
+    """키워드 기반 의도 점수 계산"""
+    lowered = text.lower()
+    scores = {
+        intent: sum(weight for keyword, weight in keywords.items() if keyword in lowered)
+        for intent, keywords in INTENT_KEYWORDS.items()
+    }
+    code, _ = split_code(text)
+    if code:
+        scores[INTENT_REVIEW] += 2
+    return scores
+
+
+def _tool_input(intent: str, text: str) -> Dict[str, str]:
+    """의도에 맞는 도구 입력 생성"""
+    if intent == INTENT_REVIEW:
+        code, rest = split_code(text)
+        return {"code": code or text, "problem_description": rest}
+    if intent == INTENT_HINT:
+        return {
+            "problem_description": text,
+            "current_progress": "",
+            "hint_type": detect_hint_type(text),
+        }
+    return {"problem_description": text}
+
+
+def route_request(user_input: str) -> RouteDecision:
+    """요청 의도 결정
+
+    Args:
+        user_input: 사용자 입력
+
+    Returns:
+        라우팅 결과 (애매하면 INTENT_AGENT)
+    """
+    text = user_input.strip()
+    if not text:
+        return RouteDecision(INTENT_AGENT, "빈 요청")
+
+    scores = score_intents(text)
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    (best, best_score), (_, second_score) = ranked[0], ranked[1]
+
+    if best_score < MIN_SCORE or best_score - second_score < MIN_MARGIN:
+        return RouteDecision(INTENT_AGENT, f"애매한 요청 (점수: {scores})")
+    if best == INTENT_REVIEW and not split_code(text)[0]:
+        return RouteDecision(INTENT_AGENT, "리뷰 요청이지만 코드를 찾지 못함")
+
+    return RouteDecision(best, f"키워드 (점수: {scores})", _tool_input(best, text))
@@ -0,0 +1,212 @@
+"""
+코딩 테스트 도우미 제출 코드 실행기 (자식 프로세스용)
+
+profiler.py/judge.py가 `python -I sandbox_runner.py`로 띄우며, 표준 입력으로 받은 JSON 설정대로 제출 코드를 한 번 실행하고
+마지막 줄에 RESULT_MARKER + 결과 JSON을 출력한다. 표준 라이브러리만 사용한다.
+
+설정:
+    code: 제출 코드
+    mode: "function" (entry 함수를 생성된 인자로 호출) / "stdin" (코드 전체를 표준 입력과 함께 실행)
+    entry: 호출할 함수 이름 ("Solution.twoSum"처럼 클래스 메서드 가능)
+    n: 생성할 입력 크기
+    stdin: 표준 입력 문자열 (없으면 n으로 생성)
+    args, kwargs: 함수 인자 (없으면 n으로 생성)
+    repeats: 반복 실행 횟수 (가장 짧은 시간 사용)
+    capture_output: 프로그램 출력과 함수 반환값(JSON)을 결과에 포함할지 여부
+    cpu_seconds, memory_mb: CPU 시간/주소 공간 상한 (POSIX, 제출 코드 실행 전에 설정)
+"""
+
+import io
+import os
+import sys
+import copy
+import json
+import math
+import time
+import random
+import string
+import inspect
+import tempfile
+import traceback
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+RESULT_MARKER = "__CODING_TEST_HELPER_RESULT__"
+
+_STRING_NAMES = {"s", "t", "p", "s1", "s2", "word", "text", "string", "pattern", "sentence", "str1", "str2"}
+_STRING_LIST_NAMES = {"words", "strs", "strings", "names", "tokens"}
+_GRID_NAMES = {"grid", "matrix", "board", "maze", "mat", "field"}
+_SIZE_NAMES = {"n", "m", "size", "length", "count", "num", "number"}
+_INT_NAMES = {"k", "target", "x", "val", "value", "amount", "limit", "start", "end", "goal", "capacity"}
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스 최대 RSS (MB)
+
+    Linux의 ru_maxrss는 fork한 부모의 RSS가 exec 후에도 남으므로 /proc의 VmHWM을 우선 사용한다.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def set_resource_limits(cpu_seconds: float, memory_mb: int):
+    """현재 프로세스의 CPU 시간/주소 공간 상한 설정 (POSIX)"""
+    if resource is None:
+        return
+    cpu = max(1, int(math.ceil(cpu_seconds)))
+    limits = [
+        (resource.RLIMIT_CPU, (cpu, cpu + 1)),
+        (resource.RLIMIT_CORE, (0, 0)),
+        (resource.RLIMIT_AS, (memory_mb * 1024 * 1024, memory_mb * 1024 * 1024)),
+    ]
+    for kind, value in limits:
+        try:
+            resource.setrlimit(kind, value)
+        except (ValueError, OSError):
+            # macOS 등 일부 환경은 RLIMIT_AS를 지원하지 않음
+            pass
+
+
+def make_argument(name: str, annotation, n: int, rng: random.Random):
+    """매개변수 이름/타입 힌트로 크기 n인 입력 생성"""
+    lname = name.lower()
+    hint = "" if annotation is inspect.Parameter.empty else str(getattr(annotation, "__name__", annotation)).lower()
+    if "list[list" in hint or lname in _GRID_NAMES:
+        side = max(1, math.isqrt(n))
+        return [[rng.randint(0, 9) for _ in range(side)] for _ in range(side)]
+    if "list[str" in hint or lname in _STRING_LIST_NAMES:
+        return ["".join(rng.choices(string.ascii_lowercase, k=5)) for _ in range(n)]
+    if hint == "str" or (not hint and lname in _STRING_NAMES):
+        return "".join(rng.choices(string.ascii_lowercase, k=n))
+    if lname in _SIZE_NAMES:
+        return n
+    if hint == "int" or lname in _INT_NAMES:
+        return rng.randint(1, n)
+    return [rng.randint(1, n) for _ in range(n)]
+
+
+def make_stdin(n: int, rng: random.Random) -> str:
+    """기본 표준 입력 형식: 첫 줄 N, 둘째 줄 N개의 정수"""
+    return f"{n}\n{' '.join(str(rng.randint(1, n)) for _ in range(n))}\n"
+
+
+def _resolve_entry(namespace: dict, entry: str):
+    owner_name, _, method = entry.rpartition(".")
+    if owner_name:
+        return getattr(namespace[owner_name](), method)
+    return namespace[entry]
+
+
+def run(config: dict) -> dict:
+    compiled = compile(config["code"], "<submission>", "exec")
+    n = int(config.get("n", 0))
+    seed = int(config.get("seed", 0))
+    repeats = max(1, int(config.get("repeats", 1)))
+    capture = bool(config.get("capture_output"))
+    sink = io.StringIO()
+    best = math.inf
+    returned = None
+
+    if config.get("mode") == "stdin":
+        stdin_text = config.get("stdin")
+        if stdin_text is None:
+            stdin_text = make_stdin(n, random.Random(seed))
+        stdin_bytes = stdin_text.encode("utf-8")
+        # open(0)/os.read(0)로 읽는 코드도 같은 입력을 받도록 fd 0도 입력 파일로 바꿈
+        stdin_file = tempfile.TemporaryFile(buffering=0)
+        stdin_file.write(stdin_bytes)
+        for _ in range(repeats):
+            sink = io.StringIO()
+            # open(0)을 닫으면 fd 0도 닫히므로 실행마다 다시 연결
+            os.dup2(stdin_file.fileno(), 0)
+            os.lseek(0, 0, os.SEEK_SET)
+            # sys.stdin.buffer를 쓰는 코드를 위해 바이트 버퍼 위의 텍스트 스트림 사용
+            sys.stdin, sys.stdout = io.TextIOWrapper(io.BytesIO(stdin_bytes), encoding="utf-8"), sink
+            started = time.perf_counter()
+            try:
+                exec(compiled, {"__name__": "__main__", "__builtins__": __builtins__})
+            except SystemExit:
+                pass
+            finally:
+                best = min(best, time.perf_counter() - started)
+                sys.stdin, sys.stdout = sys.__stdin__, sys.__stdout__
+    else:
+        namespace = {"__name__": "__submission__", "__builtins__": __builtins__}
+        sys.stdout = sink
+        try:
+            exec(compiled, namespace)
+            func = _resolve_entry(namespace, config["entry"])
+            parameters = list(inspect.signature(func).parameters.values())
+            for _ in range(repeats):
+                # 같은 입력을 새로 만들어 이전 실행의 변경(정렬 등)이 영향을 주지 않게 함
+                if "args" in config or "kwargs" in config:
+                    args = copy.deepcopy(config.get("args", []))
+                    kwargs = copy.deepcopy(config.get("kwargs", {}))
+                else:
+                    rng = random.Random(seed)
+                    args = [make_argument(p.name, p.annotation, n, rng) for p in parameters]
+                    kwargs = {}
+                started = time.perf_counter()
+                returned = func(*args, **kwargs)
+                best = min(best, time.perf_counter() - started)
+        finally:
+            sys.stdout = sys.__stdout__
+
+    result = {"status": "ok", "seconds": best, "peak_rss_mb": peak_rss_mb()}
+    if capture:
+        result["stdout"] = sink.getvalue()
+        result["return"] = json.dumps(_jsonable(returned))
+    return result
+
+
+def _jsonable(value):
+    """반환값을 JSON으로 옮길 수 있는 형태로 변환 (set은 정렬한 리스트, 그 밖은 repr)"""
+    if isinstance(value, (set, frozenset)):
+        return sorted((_jsonable(item) for item in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return repr(value)
+
+
+def main():
+    config = json.loads(sys.stdin.read())
+    if config.get("cpu_seconds") and config.get("memory_mb"):
+        set_resource_limits(float(config["cpu_seconds"]), int(config["memory_mb"]))
+    try:
+        result = run(config)
+    except MemoryError:
+        result = {"status": "memory", "error": "MemoryError", "peak_rss_mb": peak_rss_mb()}
+    except RecursionError:
+        result = {"status": "error", "error": "RecursionError: 재귀 깊이 초과", "peak_rss_mb": peak_rss_mb()}
+    except BaseException as e:
+        frames = [frame for frame in traceback.extract_tb(e.__traceback__) if frame.filename == "<submission>"]
+        result = {
+            "status": "error",
+            "error": f"{type(e).__name__}: {e}",
+            "line": frames[-1].lineno if frames else None,
+            "peak_rss_mb": peak_rss_mb(),
+        }
+    sys.__stdout__.write("\n" + RESULT_MARKER + json.dumps(result) + "\n")
+    sys.__stdout__.flush()
+
+
+if __name__ == "__main__":
+    main()
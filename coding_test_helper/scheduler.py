@@ -0,0 +1,545 @@
+"""
+코딩 테스트 도우미 요청 스케줄러
+
+모든 LLM API 요청이 공유 HTTP 클라이언트의 전송 계층(transport)에서 이 스케줄러를 거치도록 하여
+- 토큰 버킷으로 분당 요청 수/입력 토큰 수 제한
+- 우선순위 (interactive > prefetch > batch) 순서로 실행
+- 동시 실행 수 제한
+- 429/5xx/연결 오류 시 지수 백오프 + 지터로 재시도
+를 한 곳에서 처리하고, 대기열 길이와 대기 시간을 지표로 제공한다.
+"""
+
+import io
+import os
+import json
+import time
+import base64
+import heapq
+import random
+import asyncio
+import itertools
+import threading
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import httpx
+from PIL import Image
+
+from .image_pipeline import DEFAULT_TOKEN_BUDGET, estimate_image_tokens
+from .tracing import note_queue_wait, note_retry
+
+
+# 우선순위 (값이 작을수록 먼저 실행)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_PREFETCH = 1
+PRIORITY_BATCH = 2
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_PREFETCH: "prefetch",
+    PRIORITY_BATCH: "batch",
+}
+
+# 기본 제한값 (환경변수로 변경 가능)
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_REQUESTS_PER_MINUTE = 50
+DEFAULT_TOKENS_PER_MINUTE = 40000
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 30.0
+
+# 재시도 대상 HTTP 상태 (529: API 과부하)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+# 대기 시간 통계에 보관할 최근 표본 수
+WAIT_SAMPLE_SIZE = 500
+
+
+class PromotablePriority:
+    """대기 중에 올릴 수 있는 요청 우선순위
+
+    미리 보낸(prefetch) 요청의 결과를 사용자가 기다리기 시작하면 promote()로 대기열 순서를 앞당긴다.
+    """
+
+    def __init__(self, priority: int):
+        self.priority = priority
+        self._lock = threading.Lock()
+        self._waiting: List[tuple] = []
+
+    def promote(self, priority: int = PRIORITY_INTERACTIVE):
+        """우선순위를 올리고, 이미 대기열에 있는 요청도 다시 정렬"""
+        with self._lock:
+            if priority >= self.priority:
+                return
+            self.priority = priority
+            waiting = list(self._waiting)
+        for scheduler, ticket in waiting:
+            scheduler.reprioritize(ticket, priority)
+
+    def _attach(self, scheduler: "RequestScheduler", ticket: list):
+        with self._lock:
+            ticket[0] = min(ticket[0], self.priority)
+            self._waiting.append((scheduler, ticket))
+
+    def _detach(self, ticket: list):
+        with self._lock:
+            self._waiting = [entry for entry in self._waiting if entry[1] is not ticket]
+
+
+_current_priority: contextvars.ContextVar = contextvars.ContextVar(
+    "request_priority", default=PRIORITY_INTERACTIVE
+)
+_current_promotable: contextvars.ContextVar = contextvars.ContextVar("promotable_priority", default=None)
+
+
+def get_current_priority() -> int:
+    """현재 컨텍스트의 요청 우선순위"""
+    return _current_priority.get()
+
+
+def get_current_promotable() -> Optional[PromotablePriority]:
+    """현재 컨텍스트의 올릴 수 있는 우선순위 (없으면 None)"""
+    return _current_promotable.get()
+
+
+@contextmanager
+def request_priority(priority: Union[int, PromotablePriority]):
+    """컨텍스트 안의 LLM 요청 우선순위 지정 (PromotablePriority면 대기 중에 올릴 수 있음)"""
+    promotable = priority if isinstance(priority, PromotablePriority) else None
+    token = _current_priority.set(promotable.priority if promotable else priority)
+    promotable_token = _current_promotable.set(promotable)
+    try:
+        yield
+    finally:
+        _current_promotable.reset(promotable_token)
+        _current_priority.reset(token)
+
+
+class TokenBucket:
+    """분당 허용량 기반 토큰 버킷"""
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount만큼 쓸 수 있을 때까지 남은 시간(초), 0이면 바로 사용 가능"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float):
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+
+class RequestScheduler:
+    """우선순위/속도 제한/동시 실행 제한 스케줄러
+
+    acquire()는 호출한 스레드에서 차례가 올 때까지 기다렸다가 실행 슬롯을 내주고,
+    요청이 끝나면 release()로 반환한다. 호출 스레드에서 그대로 실행되므로
+    토큰 스트리밍 등 contextvars 기반 상태가 유지된다.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: float = DEFAULT_TOKENS_PER_MINUTE,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 base_delay: float = DEFAULT_BASE_DELAY,
+                 max_delay: float = DEFAULT_MAX_DELAY):
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+
+        self._condition = threading.Condition()
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+
+        self._wait_samples = deque(maxlen=WAIT_SAMPLE_SIZE)
+        self.stats = {"admitted": 0, "completed": 0, "retries": 0, "rate_limited": 0, "failed": 0}
+
+    def acquire(self, priority: int = PRIORITY_INTERACTIVE, tokens: int = 0,
+                promotable: Optional[PromotablePriority] = None) -> float:
+        """실행 차례가 올 때까지 대기
+
+        대기열 맨 앞(우선순위 → 도착 순)이고, 동시 실행 수와 두 버킷에 여유가 있을 때 반환한다.
+
+        Args:
+            priority: 요청 우선순위
+            tokens: 예상 입력 토큰 수
+            promotable: 대기 중에 우선순위를 올릴 수 있게 할 핸들
+
+        Returns:
+            대기한 시간(초)
+        """
+        started_at = time.perf_counter()
+        ticket = [priority, next(self._sequence)]
+
+        with self._condition:
+            if promotable is not None:
+                promotable._attach(self, ticket)
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    if self._waiting[0] is ticket and self._in_flight < self.max_concurrency:
+                        wait = max(self.request_bucket.wait_time(1), self.token_bucket.wait_time(tokens))
+                        if wait <= 0:
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+            except BaseException:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+                raise
+            finally:
+                if promotable is not None:
+                    promotable._detach(ticket)
+
+            heapq.heappop(self._waiting)
+            self.request_bucket.consume(1)
+            self.token_bucket.consume(tokens)
+            self._in_flight += 1
+            self.stats["admitted"] += 1
+            # 다음 대기 요청도 조건을 다시 확인하도록 깨움
+            self._condition.notify_all()
+
+        waited = time.perf_counter() - started_at
+        self._wait_samples.append(waited)
+        return waited
+
+    def reprioritize(self, ticket: list, priority: int):
+        """대기 중인 요청의 우선순위 변경 (이미 실행 중이면 무시)"""
+        with self._condition:
+            if not any(waiting is ticket for waiting in self._waiting):
+                return
+            ticket[0] = priority
+            heapq.heapify(self._waiting)
+            self._condition.notify_all()
+
+    def release(self, succeeded: Optional[bool] = True):
+        """실행 슬롯 반환
+
+        Args:
+            succeeded: 요청 성공 여부 (재시도할 요청이면 None으로 두어 집계하지 않음)
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if succeeded is not None:
+                self.stats["completed" if succeeded else "failed"] += 1
+            self._condition.notify_all()
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """재시도 대기 시간 (지수 백오프 + full jitter, 서버가 Retry-After를 주면 그 이상)"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def record_retry(self, status_code: Optional[int] = None):
+        with self._condition:
+            self.stats["retries"] += 1
+            if status_code == 429:
+                self.stats["rate_limited"] += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """대기열 길이, 실행 중 요청 수, 대기 시간 통계"""
+        with self._condition:
+            queue_depth = {name: 0 for name in PRIORITY_NAMES.values()}
+            for priority, _ in self._waiting:
+                queue_depth[PRIORITY_NAMES.get(priority, str(priority))] += 1
+            in_flight = self._in_flight
+            stats = dict(self.stats)
+
+        waits = sorted(self._wait_samples)
+
+        def percentile(ratio: float) -> float:
+            if not waits:
+                return 0.0
+            return waits[min(len(waits) - 1, int(round(ratio * (len(waits) - 1))))] * 1000
+
+        return {
+            **stats,
+            "queue_depth": sum(queue_depth.values()),
+            "queue_depth_by_priority": queue_depth,
+            "in_flight": in_flight,
+            "max_concurrency": self.max_concurrency,
+            "wait_ms_p50": percentile(0.5),
+            "wait_ms_p95": percentile(0.95),
+            "wait_ms_max": waits[-1] * 1000 if waits else 0.0,
+        }
+
+
+def _iter_image_sources(value):
+    """요청 JSON에서 {"type": "image"} 블록의 source를 찾음"""
+    if isinstance(value, dict):
+        if value.get("type") == "image" and isinstance(value.get("source"), dict):
+            yield value["source"]
+            return
+        for item in value.values():
+            yield from _iter_image_sources(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_image_sources(item)
+
+
+def _image_tokens(source: dict) -> int:
+    """base64 이미지의 헤더에서 크기를 읽어 이미지 토큰 수 추정"""
+    try:
+        with Image.open(io.BytesIO(base64.b64decode(source.get("data", "")))) as image:
+            return estimate_image_tokens(*image.size)
+    except Exception:
+        return DEFAULT_TOKEN_BUDGET
+
+
+def estimate_request_tokens(request: httpx.Request) -> int:
+    """요청 본문 크기로 입력 토큰 수 추정 (UTF-8 4바이트당 1토큰)
+
+    base64 이미지 데이터는 텍스트로 세지 않고, 이미지 크기 기준 토큰 수((가로 × 세로) / 750)를 더한다.
+    """
+    try:
+        content = request.content
+    except httpx.RequestNotRead:
+        return 0
+    if b'"image"' not in content:
+        return len(content) // 4
+
+    try:
+        body = json.loads(content)
+    except ValueError:
+        return len(content) // 4
+    text_bytes = len(content)
+    image_tokens = 0
+    for source in _iter_image_sources(body):
+        data = source.get("data")
+        if isinstance(data, str):
+            text_bytes -= len(data)
+            image_tokens += _image_tokens(source)
+    return max(0, text_bytes) // 4 + image_tokens
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _is_scheduled(request: httpx.Request) -> bool:
+    """모델 호출(POST)만 스케줄링하고 연결 예열(HEAD) 등은 그대로 보냄"""
+    return request.method == "POST"
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """응답 본문을 다 읽거나 닫을 때 실행 슬롯을 반환하는 스트림 (스트리밍 응답 동안 슬롯 유지)"""
+
+    def __init__(self, stream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self):
+        try:
+            self._stream.close()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class ScheduledTransport(httpx.BaseTransport):
+    """요청을 스케줄러를 거쳐 보내는 httpx 전송 계층"""
+
+    def __init__(self, transport: httpx.BaseTransport, scheduler: Optional[RequestScheduler] = None):
+        self._transport = transport
+        self._scheduler = scheduler
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        return self._scheduler or get_scheduler()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not _is_scheduled(request):
+            return self._transport.handle_request(request)
+
+        scheduler = self.scheduler
+        priority = get_current_priority()
+        promotable = get_current_promotable()
+        tokens = estimate_request_tokens(request)
+
+        for attempt in range(scheduler.max_retries + 1):
+            last_attempt = attempt == scheduler.max_retries
+            note_queue_wait(scheduler.acquire(priority, tokens, promotable))
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError:
+                scheduler.release(succeeded=False if last_attempt else None)
+                if last_attempt:
+                    raise
+                scheduler.record_retry()
+                note_retry()
+                time.sleep(scheduler.backoff_delay(attempt))
+                continue
+            except BaseException:
+                # 카세트 미스, 취소, KeyboardInterrupt 등 재시도하지 않는 예외도 슬롯은 반환
+                scheduler.release(succeeded=False)
+                raise
+
+            if response.status_code in RETRYABLE_STATUS_CODES and not last_attempt:
+                response.close()
+                scheduler.release(succeeded=None)
+                scheduler.record_retry(response.status_code)
+                note_retry()
+                time.sleep(scheduler.backoff_delay(attempt, _retry_after(response)))
+                continue
+
+            succeeded = response.status_code < 400
+            response.stream = _ReleasingStream(response.stream, lambda: scheduler.release(succeeded))
+            return response
+
+    def close(self):
+        self._transport.close()
+
+
+# 비동기 요청의 슬롯 대기(블로킹 acquire)를 처리하는 스레드 풀
+_acquire_executor = ThreadPoolExecutor(thread_name_prefix="scheduler-acquire")
+
+
+async def _acquire_async(scheduler: RequestScheduler, priority: int, tokens: int,
+                         promotable: Optional[PromotablePriority] = None) -> float:
+    """스레드 풀에서 슬롯을 기다림
+
+    기다리는 동안 작업이 취소되어도 스레드는 슬롯을 받게 되므로, 받는 즉시 반환하도록 콜백을 건다.
+    """
+    future = _acquire_executor.submit(scheduler.acquire, priority, tokens, promotable)
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        def release_when_acquired(done):
+            if not done.cancelled() and done.exception() is None:
+                scheduler.release(None)
+
+        future.add_done_callback(release_when_acquired)
+        raise
+
+
+class AsyncScheduledTransport(httpx.AsyncBaseTransport):
+    """비동기 클라이언트용 ScheduledTransport (대기는 스레드 풀에서 처리)"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, scheduler: Optional[RequestScheduler] = None):
+        self._transport = transport
+        self._scheduler = scheduler
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        return self._scheduler or get_scheduler()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not _is_scheduled(request):
+            return await self._transport.handle_async_request(request)
+
+        scheduler = self.scheduler
+        priority = get_current_priority()
+        promotable = get_current_promotable()
+        tokens = estimate_request_tokens(request)
+
+        for attempt in range(scheduler.max_retries + 1):
+            last_attempt = attempt == scheduler.max_retries
+            note_queue_wait(await _acquire_async(scheduler, priority, tokens, promotable))
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                scheduler.release(succeeded=False if last_attempt else None)
+                if last_attempt:
+                    raise
+                scheduler.record_retry()
+                note_retry()
+                await asyncio.sleep(scheduler.backoff_delay(attempt))
+                continue
+            except BaseException:
+                scheduler.release(succeeded=False)
+                raise
+
+            if response.status_code in RETRYABLE_STATUS_CODES and not last_attempt:
+                await response.aclose()
+                scheduler.release(succeeded=None)
+                scheduler.record_retry(response.status_code)
+                note_retry()
+                await asyncio.sleep(scheduler.backoff_delay(attempt, _retry_after(response)))
+                continue
+
+            succeeded = response.status_code < 400
+            response.stream = _AsyncReleasingStream(response.stream, lambda: scheduler.release(succeeded))
+            return response
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+def scheduler_enabled() -> bool:
+    """스케줄러 사용 여부 (CODING_TEST_HELPER_SCHEDULER=0이면 끔)"""
+    return os.getenv("CODING_TEST_HELPER_SCHEDULER", "1") != "0"
+
+
+_scheduler: Optional[RequestScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> RequestScheduler:
+    """전역 요청 스케줄러 반환
+
+    환경변수:
+        CODING_TEST_HELPER_MAX_CONCURRENCY: 동시 실행 수
+        CODING_TEST_HELPER_RPM: 분당 요청 수
+        CODING_TEST_HELPER_TPM: 분당 입력 토큰 수
+        CODING_TEST_HELPER_MAX_RETRIES: 최대 재시도 횟수
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = RequestScheduler(
+                max_concurrency=int(os.getenv("CODING_TEST_HELPER_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+                requests_per_minute=float(os.getenv("CODING_TEST_HELPER_RPM", DEFAULT_REQUESTS_PER_MINUTE)),
+                tokens_per_minute=float(os.getenv("CODING_TEST_HELPER_TPM", DEFAULT_TOKENS_PER_MINUTE)),
+                max_retries=int(os.getenv("CODING_TEST_HELPER_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+            )
+        return _scheduler
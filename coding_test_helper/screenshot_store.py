@@ -0,0 +1,136 @@
+"""
+코딩 테스트 도우미 스크린샷 비동기 저장
+
+캡처 이미지는 메모리 버퍼로 바로 요청에 사용하고,
+screenshots/ 디스크 저장은 백그라운드 스레드가 맡아 요청 경로에서 제외한다.
+원본 프레임은 PNG 인코딩까지 저장 스레드에서 처리하므로 요청용 축소본과 별개로 보존된다.
+"""
+
+import time
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+
+# 대기열이 가득 차면 저장을 건너뜀 (요청 경로를 막지 않기 위해)
+MAX_PENDING_WRITES = 32
+
+# 종료 표시
+_STOP = object()
+
+
+class ScreenshotWriter:
+    """백그라운드 스크린샷 저장기
+
+    save()는 대기열에 넣고 바로 반환하며, 실제 파일 쓰기는 전용 스레드에서 처리한다.
+    """
+
+    def __init__(self, directory: Union[str, Path] = "screenshots", max_pending: int = MAX_PENDING_WRITES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.stats = {"queued": 0, "written": 0, "dropped": 0, "failed": 0, "bytes": 0, "write_seconds": 0.0}
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+                self._thread.start()
+
+    def save(self, filename: str, data: bytes) -> Path:
+        """파일 저장 예약
+
+        Args:
+            filename: screenshots/ 안의 파일 이름
+            data: 인코딩된 이미지 바이트 (bytes, memoryview 등)
+
+        Returns:
+            저장될 경로 (실제 쓰기는 나중에 완료됨)
+        """
+        path = self.directory / filename
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((path, data))
+            self.stats["queued"] += 1
+        except queue.Full:
+            self.stats["dropped"] += 1
+            print(f"스크린샷 저장 대기열이 가득 차 저장을 건너뜁니다: {path}")
+        return path
+
+    def save_image(self, filename: str, image) -> Path:
+        """PIL 이미지 저장 예약 (인코딩도 저장 스레드에서 처리)
+
+        Args:
+            filename: screenshots/ 안의 파일 이름 (확장자로 형식 결정)
+            image: 저장할 PIL 이미지 (예약 후에는 수정하지 않아야 함)
+
+        Returns:
+            저장될 경로 (실제 쓰기는 나중에 완료됨)
+        """
+        return self.save(filename, image)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                path, data = item
+                started_at = time.perf_counter()
+                try:
+                    if isinstance(data, (bytes, bytearray, memoryview)):
+                        path.write_bytes(data)
+                    else:
+                        data.save(path)
+                    self.stats["written"] += 1
+                    self.stats["bytes"] += path.stat().st_size
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    print(f"스크린샷 저장 실패 ({path}): {e}")
+                self.stats["write_seconds"] += time.perf_counter() - started_at
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 저장이 끝날 때까지 대기
+
+        Returns:
+            제한 시간 안에 모두 저장되었는지 여부
+        """
+        if timeout is None:
+            self._queue.join()
+            return True
+        deadline = time.perf_counter() + timeout
+        while self._queue.unfinished_tasks:
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self, timeout: float = 5.0):
+        """남은 저장을 마치고 스레드 종료"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self.flush(timeout)
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, float]:
+        return dict(self.stats, pending=self._queue.unfinished_tasks)
+
+
+_writers: Dict[Path, ScreenshotWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_screenshot_writer(directory: Union[str, Path] = "screenshots") -> ScreenshotWriter:
+    """디렉토리별 전역 스크린샷 저장기 반환"""
+    key = Path(directory).resolve()
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = ScreenshotWriter(directory)
+        return writer
@@ -0,0 +1,102 @@
+"""
+코딩 테스트 도우미 세션 성능 지표
+
+위젯의 성능 패널(PerformanceHUD)이 주기적으로 읽어 가는 값을 한 곳에서 모은다.
+- 사용자 동작(문제 분석, 코드 리뷰, 힌트 등)별 최근 응답 시간 p50/p95
+- 이번 세션 토큰 사용량과 예상 비용
+- 응답 캐시 적중률, 프롬프트 캐시 비율
+- 스케줄러 대기열 길이, 실행 중 요청 수
+"""
+
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Dict, Optional
+
+from .usage import get_usage_tracker
+
+
+# 100만 토큰당 가격(USD) - claude-3-5-sonnet 기준
+DEFAULT_PRICES_PER_MTOK = {
+    "input_tokens": 3.0,
+    "output_tokens": 15.0,
+    "cache_creation_input_tokens": 3.75,
+    "cache_read_input_tokens": 0.30,
+}
+
+# 동작별로 보관할 최근 응답 시간 수
+LATENCY_WINDOW = 50
+
+
+def estimate_cost(totals: Dict[str, Any], prices: Optional[Dict[str, float]] = None) -> float:
+    """토큰 사용량으로 예상 비용(USD) 계산"""
+    prices = prices or DEFAULT_PRICES_PER_MTOK
+    return sum(totals.get(field, 0) * price for field, price in prices.items()) / 1_000_000
+
+
+class ActionLatencies:
+    """사용자 동작별 최근 응답 시간 (스레드 안전)"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        # 최근에 사용한 동작이 뒤에 오도록 유지
+        self._samples: "OrderedDict[str, deque]" = OrderedDict()
+
+    def record(self, action: str, seconds: float):
+        with self._lock:
+            samples = self._samples.pop(action, None) or deque(maxlen=self.window)
+            samples.append(seconds)
+            self._samples[action] = samples
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """동작별 {count, p50, p95} (최근 사용 순)"""
+        with self._lock:
+            items = [(action, sorted(samples)) for action, samples in self._samples.items()]
+
+        def percentile(values, ratio: float) -> float:
+            return values[min(len(values) - 1, int(round(ratio * (len(values) - 1))))]
+
+        return {
+            action: {"count": len(values), "p50": percentile(values, 0.5), "p95": percentile(values, 0.95)}
+            for action, values in reversed(items)
+        }
+
+
+_action_latencies = ActionLatencies()
+
+
+def record_action(action: str, seconds: float):
+    """사용자 동작 응답 시간 기록 (요청 시작 → 결과 표시)"""
+    _action_latencies.record(action, seconds)
+
+
+def get_action_latencies() -> ActionLatencies:
+    return _action_latencies
+
+
+def collect_snapshot() -> Dict[str, Any]:
+    """성능 패널에 표시할 현재 값 모음 (UI 스레드에서 호출해도 될 만큼 가벼움)"""
+    totals = get_usage_tracker().totals()
+    snapshot = {
+        "actions": _action_latencies.summary(),
+        "requests": totals["requests"],
+        "input_tokens": totals["input_tokens"] + totals["cache_read_input_tokens"] + totals["cache_creation_input_tokens"],
+        "output_tokens": totals["output_tokens"],
+        "cost_usd": estimate_cost(totals),
+        "prompt_cache_ratio": totals["cached_input_ratio"],
+        "response_cache_hit_rate": None,
+        "queue_depth": 0,
+        "in_flight": 0,
+    }
+
+    from .cache import get_response_cache
+    cache = get_response_cache()
+    if cache is not None:
+        snapshot["response_cache_hit_rate"] = cache.get_stats()["hit_rate"]
+
+    from .scheduler import get_scheduler, scheduler_enabled
+    if scheduler_enabled():
+        metrics = get_scheduler().get_metrics()
+        snapshot["queue_depth"] = metrics["queue_depth"]
+        snapshot["in_flight"] = metrics["in_flight"]
+    return snapshot
@@ -0,0 +1,94 @@
+"""
+코딩 테스트 도우미 동일 요청 병합 (single-flight)
+
+같은 캐시 키의 LLM 호출이 진행 중이면 새로 요청하지 않고 진행 중인 호출의 결과를 함께 받는다.
+(더블 클릭, 힌트 다이얼로그 반복 요청, 여러 창의 같은 문제 요청 등)
+"""
+
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Dict, Optional
+
+
+class SingleFlight:
+    """키별로 동시에 하나의 호출만 실행
+
+    - 먼저 온 호출(leader)이 자기 스레드에서 func을 실행하고, 같은 키로 나중에 온 호출(follower)은
+      leader의 Future를 기다린다.
+    - leader가 예외로 끝나면 같은 예외가 모든 follower에게 전달되고, 키는 바로 비워져
+      다음 호출은 새로 요청한다. (실패 결과는 공유하지 않음)
+    - follower가 기다리다 시간 초과로 포기해도 leader 호출은 취소되지 않는다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self.stats = {"leaders": 0, "coalesced": 0, "shared_errors": 0}
+
+    def do(self, key: str, func: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """key로 func 실행 (진행 중인 같은 키 호출이 있으면 그 결과 공유)
+
+        Args:
+            key: 요청 식별 키 (응답 캐시 키)
+            func: 실제 호출
+            timeout: follower의 최대 대기 시간(초), None이면 무제한
+
+        Returns:
+            func 결과
+
+        Raises:
+            func이 발생시킨 예외, follower 대기 시간 초과 시 TimeoutError
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                # 직접 실행하므로 PENDING 상태로 두어 중단 시 cancel()로 follower를 깨울 수 있게 함
+                future = self._in_flight[key] = Future()
+                self.stats["leaders"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            try:
+                return future.result(timeout)
+            except CancelledError:
+                # leader가 취소된 경우 직접 호출
+                return self.do(key, func, timeout)
+            except Exception:
+                with self._lock:
+                    self.stats["shared_errors"] += 1
+                raise
+
+        try:
+            result = func()
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            if isinstance(e, Exception):
+                future.set_exception(e)
+            else:
+                # KeyboardInterrupt 등으로 중단되면 follower는 각자 다시 요청
+                future.cancel()
+            raise
+
+        with self._lock:
+            self._in_flight.pop(key, None)
+        future.set_result(result)
+        return result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._in_flight)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats, in_flight=len(self._in_flight))
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """전역 single-flight 인스턴스 반환"""
+    return _single_flight
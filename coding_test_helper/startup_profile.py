@@ -0,0 +1,123 @@
+"""
+코딩 테스트 도우미 시작 시간 프로파일링
+
+별도 프로세스에서 `python -X importtime`으로 모듈을 불러와
+모듈별 import 시간(자체/누적)을 표로 정리
+
+실행:
+    python -m coding_test_helper.startup_profile
+    python coding_test_floating_helper.py --profile-imports
+"""
+
+import sys
+import json
+import argparse
+import subprocess
+from typing import Any, Dict, List, Optional
+
+
+# 도우미가 사용하는 주요 모듈
+DEFAULT_MODULES = [
+    "coding_test_helper.tools",
+    "coding_test_helper.agents",
+    "coding_test_helper.chains",
+    "coding_test_helper.ui_components",
+]
+
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """-X importtime 출력 파싱
+
+    각 줄 형식: "import time:   self [us] | cumulative | imported package"
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        entries.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+            "self_us": int(fields[0]),
+            "cumulative_us": int(fields[1]),
+        })
+    return entries
+
+
+def profile_imports(modules: Optional[List[str]] = None, cwd: Optional[str] = None) -> Dict[str, Any]:
+    """새 프로세스에서 모듈을 불러오며 import 시간 측정
+
+    Args:
+        modules: 측정할 모듈 목록 (기본값: 도우미 주요 모듈)
+        cwd: 실행 디렉토리 (프로젝트 루트)
+
+    Returns:
+        total_us, top_level(직접 불러온 모듈별 누적 시간), entries(전체 항목)
+    """
+    modules = modules or DEFAULT_MODULES
+    code = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=cwd
+    )
+    entries = parse_importtime(result.stderr)
+
+    # 최상위(depth 0) 항목의 누적 시간 합이 전체 import 시간
+    top_level = [entry for entry in entries if entry["depth"] == 0]
+    return {
+        "modules": modules,
+        "returncode": result.returncode,
+        "error": result.stderr.splitlines()[-1] if result.returncode else None,
+        "total_us": sum(entry["cumulative_us"] for entry in top_level),
+        "top_level": sorted(top_level, key=lambda entry: entry["cumulative_us"], reverse=True),
+        "entries": entries,
+    }
+
+
+def format_report(profile: Dict[str, Any], top: int = 20) -> str:
+    """import 시간 보고서 문자열 생성"""
+    lines = [
+        "🕒 Import 시간 보고서",
+        f"대상 모듈: {', '.join(profile['modules'])}",
+        f"전체 import 시간: {profile['total_us'] / 1000:.1f} ms",
+    ]
+    if profile["error"]:
+        lines.append(f"⚠️ import 실패: {profile['error']}")
+
+    lines.append("")
+    lines.append(f"{'누적 ms':>10}  {'자체 ms':>8}  모듈 (최상위 import 기준 상위 {top}개)")
+    for entry in profile["top_level"][:top]:
+        lines.append(
+            f"{entry['cumulative_us'] / 1000:>10.1f}  {entry['self_us'] / 1000:>8.1f}  {entry['module']}"
+        )
+
+    slowest = sorted(profile["entries"], key=lambda entry: entry["self_us"], reverse=True)[:top]
+    lines.append("")
+    lines.append(f"{'자체 ms':>10}  모듈 (자체 시간 상위 {top}개)")
+    for entry in slowest:
+        lines.append(f"{entry['self_us'] / 1000:>10.1f}  {entry['module']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="코딩 테스트 도우미 import 시간 측정")
+    parser.add_argument("modules", nargs="*", help="측정할 모듈 (기본값: 도우미 주요 모듈)")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    profile = profile_imports(args.modules or None)
+    if args.json:
+        profile.pop("entries")
+        print(json.dumps(profile, indent=2, ensure_ascii=False))
+    else:
+        print(format_report(profile, top=args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+코딩 테스트 도우미 토큰 스트리밍
+
+LLM 응답 토큰을 스레드 안전 큐로 전달하여 UI나 제너레이터에서
+응답이 완성되기 전에 표시할 수 있도록 지원
+"""
+
+import time
+import queue
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from .usage import extract_usage, get_usage_tracker
+from .hedging import get_hedging_policy, hedged_stream
+
+
+_current_stream: contextvars.ContextVar = contextvars.ContextVar("token_stream", default=None)
+
+# 스트림 종료 표시
+_END = object()
+
+
+class TokenStream:
+    """스레드 안전 토큰 스트림
+
+    생산자(LLM 호출 스레드)는 push/close를 호출하고,
+    소비자는 drain(UI 폴링) 또는 반복(제너레이터)으로 토큰을 받는다.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue" = queue.Queue()
+        self.started_at = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[str] = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+
+    def push(self, text: str):
+        """토큰 추가"""
+        if not text:
+            return
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self._queue.put(text)
+
+    def close(self, result: Optional[str] = None, error: Optional[BaseException] = None):
+        """스트림 종료
+
+        Args:
+            result: 최종 응답 전문 (스트리밍된 토큰과 다를 수 있음)
+            error: 실행 중 발생한 예외
+        """
+        self.result = result
+        self.error = error
+        self.finished_at = time.perf_counter()
+        self._queue.put(_END)
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """첫 토큰까지 걸린 시간(초)"""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def total_time(self) -> Optional[float]:
+        """전체 소요 시간(초)"""
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def drain(self, max_items: int = 1000) -> Tuple[List[str], bool]:
+        """대기 중인 토큰을 블로킹 없이 꺼냄 (UI 폴링용)
+
+        Returns:
+            (토큰 리스트, 스트림 종료 여부)
+        """
+        tokens = []
+        for _ in range(max_items):
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _END:
+                self.done = True
+                break
+            tokens.append(item)
+        return tokens, self.done
+
+    def __iter__(self) -> Iterator[str]:
+        """종료될 때까지 토큰을 블로킹으로 반환"""
+        while not self.done:
+            item = self._queue.get()
+            if item is _END:
+                self.done = True
+                break
+            yield item
+
+
+def get_current_stream() -> Optional[TokenStream]:
+    """현재 컨텍스트의 토큰 스트림 반환 (없으면 None)"""
+    return _current_stream.get()
+
+
+@contextmanager
+def streaming_to(stream: Optional[TokenStream]):
+    """컨텍스트 안의 LLM 호출 토큰을 stream으로 전달 (None이면 전달하지 않음)"""
+    token = _current_stream.set(stream)
+    try:
+        yield stream
+    finally:
+        _current_stream.reset(token)
+
+
+def emit(text: str):
+    """현재 스트림에 LLM이 생성하지 않은 텍스트(제목 등) 추가"""
+    stream = get_current_stream()
+    if stream is not None:
+        stream.push(text)
+
+
+def _chunk_text(chunk: Any) -> str:
+    """스트리밍 청크에서 텍스트만 추출"""
+    content = getattr(chunk, "content", chunk)
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            block.get("text", "") if isinstance(block, dict) else str(block)
+            for block in content
+        )
+    return ""
+
+
+def invoke_with_stream(llm, messages: List[Any], label: str = "llm") -> str:
+    """LLM 호출
+
+    현재 컨텍스트에 토큰 스트림이 있으면 llm.stream으로 토큰을 전달하며 호출하고,
+    없으면 llm.invoke로 한 번에 호출한다. 헤지 대상 호출은 첫 토큰 시점을 알아야 하므로
+    항상 스트리밍으로 호출한다. 토큰 사용량은 전역 사용량 기록기에 남긴다.
+
+    Args:
+        llm: 호출할 LLM 인스턴스
+        messages: 요청 메시지
+        label: 사용량 기록용 호출 위치 이름
+
+    Returns:
+        응답 텍스트 전문
+    """
+    stream = get_current_stream()
+    policy = get_hedging_policy()
+    # 추적 span 이름으로 사용
+    config = {"run_name": label}
+    if policy.applies_to(label):
+        chunks = hedged_stream(lambda: llm.stream(messages, config=config), policy)
+    elif stream is None:
+        response = llm.invoke(messages, config=config)
+        get_usage_tracker().record(label, extract_usage(response))
+        return response.content
+    else:
+        chunks = llm.stream(messages, config=config)
+
+    parts = []
+    aggregated = None
+    for chunk in chunks:
+        aggregated = chunk if aggregated is None else aggregated + chunk
+        text = _chunk_text(chunk)
+        if text:
+            parts.append(text)
+            if stream is not None:
+                stream.push(text)
+    if aggregated is not None:
+        get_usage_tracker().record(label, extract_usage(aggregated))
+    return "".join(parts)
+
+
+def run_streaming(func: Callable[..., str], *args, **kwargs) -> TokenStream:
+    """func을 백그라운드 스레드에서 스트리밍 모드로 실행
+
+    Returns:
+        func 실행 중 생성되는 토큰을 받을 TokenStream
+    """
+    stream = TokenStream()
+
+    def worker():
+        try:
+            with streaming_to(stream):
+                result = func(*args, **kwargs)
+            stream.close(result=result)
+        except Exception as e:
+            stream.close(error=e)
+
+    threading.Thread(target=worker, daemon=True).start()
+    return stream
+
+
+def iter_streaming(func: Callable[..., str], *args, **kwargs) -> Iterator[str]:
+    """func 실행 중 생성되는 토큰을 반환하는 제너레이터 (헤드리스 사용)"""
+    stream = run_streaming(func, *args, **kwargs)
+    yield from stream
+    if stream.error is not None:
+        raise stream.error
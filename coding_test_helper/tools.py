@@ -4,33 +4,79 @@
 LangChain Tool 인터페이스를 구현하여 학습 중심 코딩 테스트 도움 기능 제공
 """
 
-import os
+from typing import Any, Dict, List, Union
+
 from langchain_core.tools import tool
-from langchain_anthropic import ChatAnthropic
 
-# 프롬프트는 직접 시스템 프롬프트로 대체
+from .cache import get_response_cache, make_cache_key
+from .complexity import analyze_complexity
+from .llm_registry import DEFAULT_MODEL, get_llm
+from .prompt_cache import cacheable_text
+from .singleflight import get_single_flight
+from .streaming import emit, invoke_with_stream
 
+# 프롬프트는 직접 시스템 프롬프트로 대체
 
-# LLM 인스턴스 전역 변수
-_llm_anthropic = None
+# 기본 모델
+ANTHROPIC_MODEL = DEFAULT_MODEL
 
 def get_anthropic_llm():
-    """Anthropic LLM 인스턴스 반환"""
-    global _llm_anthropic
-    if _llm_anthropic is None:
-        try:
-            _llm_anthropic = ChatAnthropic(
-                model="claude-3-5-sonnet-20241022",
-                api_key=os.getenv("ANTHROPIC_API_KEY")
-            )
-        except Exception as e:
-            print(f"Anthropic LLM 초기화 실패: {e}")
-            return None
-    return _llm_anthropic
+    """Anthropic LLM 인스턴스 반환 (공유 레지스트리)"""
+    try:
+        return get_llm(ANTHROPIC_MODEL)
+    except Exception as e:
+        print(f"Anthropic LLM 초기화 실패: {e}")
+        return None
 
 # OpenAI LLM은 현재 사용하지 않음
 
 
+def invoke_llm(llm, system_prompt: str, user_message: Union[str, List[Dict[str, Any]]], **cache_inputs) -> str:
+    """LLM 호출 (응답 캐시 적용)
+
+    모델, 시스템 프롬프트, 정규화된 입력이 같으면 캐시된 응답을 반환하고,
+    같은 요청이 이미 진행 중이면 새로 호출하지 않고 그 결과를 기다린다.
+    오류 응답은 캐시하지 않는다. 토큰 스트림이 활성화되어 있으면 응답을 스트리밍한다.
+    시스템 프롬프트는 API 측 프롬프트 캐시 대상으로 표시한다.
+
+    Args:
+        llm: 호출할 LLM 인스턴스
+        system_prompt: 시스템 프롬프트
+        user_message: 사용자 메시지 (텍스트 또는 이미지를 포함한 content 블록 목록)
+        **cache_inputs: 캐시 키에 포함할 도구 입력값
+
+    Returns:
+        LLM 응답 텍스트
+    """
+    cache = get_response_cache()
+    cache_key = make_cache_key(ANTHROPIC_MODEL, system_prompt, **cache_inputs)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            emit(cached)
+            return cached
+
+    called = []
+
+    def call() -> str:
+        called.append(True)
+        content = invoke_with_stream(llm, [
+            {"role": "system", "content": cacheable_text(system_prompt)},
+            {"role": "user", "content": user_message}
+        ], label=cache_inputs.get("tool", "llm"))
+
+        if cache is not None and isinstance(content, str):
+            cache.set(cache_key, content)
+        return content
+
+    # 같은 요청이 진행 중이면 새로 호출하지 않고 그 결과를 받음
+    content = get_single_flight().do(cache_key, call)
+    if not called:
+        # 다른 호출이 받은 결과이므로 현재 스트림에는 한 번에 표시
+        emit(content)
+    return content
+
+
 @tool
 def analyze_problem(problem_description: str) -> str:
     """코딩 테스트 문제를 분석하여 핵심 요구사항과 추상적인 힌트를 제공합니다.
@@ -68,24 +114,26 @@ def analyze_problem(problem_description: str) -> str:
 
         user_message = f"다음 코딩 테스트 문제를 분석해주세요:\n\n{problem_description}"
 
-        response = llm.invoke([
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message}
-        ])
-
-        return response.content
+        return invoke_llm(
+            llm,
+            system_prompt,
+            user_message,
+            tool="analyze_problem",
+            problem_description=problem_description
+        )
 
     except Exception as e:
         return f"문제 분석 중 오류가 발생했습니다: {e}"
 
 
 @tool
-def review_code(code: str, problem_description: str) -> str:
+def review_code(code: str, problem_description: str, test_results: str = "") -> str:
     """사용자의 코드를 리뷰하고 개선 방향에 대한 힌트를 제공합니다.
 
     Args:
         code: 사용자가 작성한 코드
         problem_description: 코딩 테스트 문제 전문
+        test_results: 예제 채점 결과 요약 (없으면 빈 문자열)
 
     Returns:
         코드 리뷰 결과 및 개선 힌트
@@ -115,6 +163,17 @@ def review_code(code: str, problem_description: str) -> str:
 ## 🚀 성능 고려사항
 [시간/공간 복잡도 관련 힌트]"""
 
+        # 반복문/재귀/숨은 선형 연산은 로컬 정적 분석 결과를 넘겨 모델이 추론하지 않도록 함
+        static_analysis = analyze_complexity(code).summary()
+        # 예제 채점에서 실패한 사례가 있으면 그 입력/출력에서 출발해 원인을 짚도록 함
+        judge_section = ""
+        if test_results:
+            judge_section = f"""
+예제 채점 결과 (로컬 실행):
+{test_results}
+실패한 예제가 있다면 그 입력에서 코드가 어떻게 동작하는지부터 짚어주세요.
+"""
+
         user_message = f"""
 문제: {problem_description}
 
@@ -123,15 +182,21 @@ def review_code(code: str, problem_description: str) -> str:
 {code}
 ```
 
-위 코드를 리뷰하고 개선 방향을 힌트로 제공해주세요.
+정적 분석 결과 (로컬 분석, 행 번호 기준):
+{static_analysis}
+{judge_section}
+위 코드를 리뷰하고 개선 방향을 힌트로 제공해주세요. 성능 고려사항은 정적 분석 결과를 근거로 설명해주세요.
 """
 
-        response = llm.invoke([
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message}
-        ])
-
-        return response.content
+        return invoke_llm(
+            llm,
+            system_prompt,
+            user_message,
+            tool="review_code",
+            code=code,
+            problem_description=problem_description,
+            test_results=test_results
+        )
 
     except Exception as e:
         return f"코드 리뷰 중 오류가 발생했습니다: {e}"
@@ -186,12 +251,15 @@ def provide_hint(problem_description: str, current_progress: str = "", hint_type
 요청: {hint_prompts.get(hint_type, hint_prompts["next_step"])}
 """
 
-        response = llm.invoke([
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message}
-        ])
-
-        return response.content
+        return invoke_llm(
+            llm,
+            system_prompt,
+            user_message,
+            tool="provide_hint",
+            problem_description=problem_description,
+            current_progress=current_progress,
+            hint_type=hint_type
+        )
 
     except Exception as e:
         return f"힌트 제공 중 오류가 발생했습니다: {e}"
@@ -0,0 +1,478 @@
+"""
+코딩 테스트 도우미 단계별 추적 (tracing)
+
+LangChain 전역 콜백 훅으로 모든 @tool 호출, Chain 실행, AgentExecutor 반복, LLM 요청을 span으로 기록한다.
+span에는 첫 토큰까지 시간(TTFT), 전체 시간, 입력/출력/캐시 토큰, 스케줄러 대기 시간, 재시도 횟수가 담기며
+JSONL 추적 파일과 Prometheus 텍스트 형식(/metrics)으로 내보낸다.
+
+기록은 메모리 집계와 큐 적재만 하고 파일 쓰기는 백그라운드 스레드가 모아서 처리하므로
+평소에 켜 두어도 요청당 비용이 작다.
+
+환경변수:
+    CODING_TEST_HELPER_TRACING: "0"이면 끔 (기본 켬)
+    CODING_TEST_HELPER_TRACE_FILE: span을 기록할 JSONL 파일 경로
+    CODING_TEST_HELPER_METRICS_PORT: Prometheus 지표를 제공할 포트
+"""
+
+import os
+import json
+import time
+import queue
+import threading
+import contextvars
+from collections import defaultdict
+from dataclasses import dataclass, asdict, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from .usage import extract_usage
+
+
+KIND_TOOL = "tool"
+KIND_CHAIN = "chain"
+KIND_AGENT = "agent"
+KIND_AGENT_ITERATION = "agent_iteration"
+KIND_LLM = "llm"
+
+# 지연 히스토그램 구간(초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 최근 span 보관 개수 (HUD 등 조회용)
+RECENT_SPAN_COUNT = 200
+
+
+# 스레드별 스케줄러 누적값 (LLM span 시작/종료 시점의 차이로 요청별 값 계산)
+_scheduler_counters = threading.local()
+
+
+def note_queue_wait(seconds: float):
+    """스케줄러 대기 시간 기록 (scheduler 전송 계층에서 호출)"""
+    _scheduler_counters.queue_wait = getattr(_scheduler_counters, "queue_wait", 0.0) + seconds
+
+
+def note_retry():
+    """재시도 기록 (scheduler 전송 계층에서 호출)"""
+    _scheduler_counters.retries = getattr(_scheduler_counters, "retries", 0) + 1
+
+
+# 현재 컨텍스트에서 실행 중인 가장 안쪽 span
+# (Chain._call 안에서 콜백 없이 호출한 도구/LLM은 parent_run_id가 없으므로 이 값으로 부모를 연결)
+_active_span: contextvars.ContextVar = contextvars.ContextVar("active_span", default=None)
+
+
+def _scheduler_snapshot() -> Tuple[float, int]:
+    return getattr(_scheduler_counters, "queue_wait", 0.0), getattr(_scheduler_counters, "retries", 0)
+
+
+@dataclass
+class Span:
+    """실행 단계 하나"""
+    span_id: str
+    trace_id: str
+    parent_id: Optional[str]
+    kind: str
+    name: str
+    start: float
+    end: Optional[float] = None
+    duration_ms: Optional[float] = None
+    ttft_ms: Optional[float] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+    queue_ms: float = 0.0
+    retries: int = 0
+    iterations: int = 0
+    error: Optional[str] = None
+    # 내부 측정용 (내보내지 않음)
+    _started: float = field(default=0.0, repr=False)
+    _scheduler_start: Tuple[float, int] = field(default=(0.0, 0), repr=False)
+    _previous_active: Any = field(default=None, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: value for key, value in asdict(self).items() if not key.startswith("_")}
+
+
+class _Histogram:
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float):
+        self.total += 1
+        self.sum += seconds
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.counts[index] += 1
+
+
+class SpanExporter:
+    """span을 JSONL 파일에 모아서 쓰는 백그라운드 작성기"""
+
+    def __init__(self, path: str, batch_size: int = 50, flush_interval: float = 1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue" = queue.Queue(maxsize=10000)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span):
+        try:
+            self._queue.put_nowait(span.to_dict())
+        except queue.Full:
+            # 디스크가 느려도 요청 경로를 막지 않음
+            self.dropped += 1
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write(self, batch: List[Dict[str, Any]]):
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for item in batch:
+                    f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"추적 파일 기록 실패: {e}")
+
+    def flush(self, timeout: float = 5.0):
+        """대기 중인 span을 모두 기록할 때까지 대기 (최대 timeout초)"""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+
+class Tracer:
+    """span 수집과 집계"""
+
+    def __init__(self, exporter: Optional[SpanExporter] = None):
+        self.exporter = exporter
+        self._lock = threading.Lock()
+        self._recent: List[Dict[str, Any]] = []
+        self._histograms: Dict[Tuple[str, str], _Histogram] = defaultdict(_Histogram)
+        self._ttft: Dict[str, _Histogram] = defaultdict(_Histogram)
+        self._counters: Dict[Tuple[str, str, str], float] = defaultdict(float)
+
+    def finish(self, span: Span, error: Optional[BaseException] = None):
+        span.end = time.time()
+        span.duration_ms = (time.perf_counter() - span._started) * 1000
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+
+        with self._lock:
+            key = (span.kind, span.name)
+            self._histograms[key].observe(span.duration_ms / 1000)
+            if span.ttft_ms is not None:
+                self._ttft[span.name].observe(span.ttft_ms / 1000)
+            if span.kind == KIND_LLM:
+                for metric in ("input_tokens", "output_tokens", "cached_tokens", "retries", "queue_ms"):
+                    self._counters[(metric, span.kind, span.name)] += getattr(span, metric)
+            if span.error:
+                self._counters[("errors", span.kind, span.name)] += 1
+            self._recent.append(span.to_dict())
+            if len(self._recent) > RECENT_SPAN_COUNT:
+                del self._recent[:len(self._recent) - RECENT_SPAN_COUNT]
+
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+    def recent_spans(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [span for span in self._recent if kind is None or span["kind"] == kind]
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 지표"""
+        lines = [
+            "# HELP coding_helper_span_seconds Span duration by kind and name",
+            "# TYPE coding_helper_span_seconds histogram",
+        ]
+        with self._lock:
+            histograms = list(self._histograms.items())
+            ttft = list(self._ttft.items())
+            counters = list(self._counters.items())
+
+        def write_histogram(metric: str, labels: str, histogram: _Histogram):
+            for bound, count in zip(LATENCY_BUCKETS, histogram.counts):
+                lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {histogram.total}')
+            lines.append(f"{metric}_sum{{{labels}}} {histogram.sum:.6f}")
+            lines.append(f"{metric}_count{{{labels}}} {histogram.total}")
+
+        for (kind, name), histogram in histograms:
+            write_histogram("coding_helper_span_seconds", f'kind="{kind}",name="{_escape(name)}"', histogram)
+
+        lines.append("# HELP coding_helper_llm_ttft_seconds Time to first token of streamed LLM requests")
+        lines.append("# TYPE coding_helper_llm_ttft_seconds histogram")
+        for name, histogram in ttft:
+            write_histogram("coding_helper_llm_ttft_seconds", f'name="{_escape(name)}"', histogram)
+
+        by_metric: Dict[str, List[str]] = defaultdict(list)
+        for (metric, kind, name), value in counters:
+            by_metric[metric].append(f'coding_helper_{metric}_total{{kind="{kind}",name="{_escape(name)}"}} {value:g}')
+        for metric, samples in sorted(by_metric.items()):
+            lines.append(f"# TYPE coding_helper_{metric}_total counter")
+            lines.extend(samples)
+
+        try:
+            from .scheduler import get_scheduler
+            metrics = get_scheduler().get_metrics()
+            lines.append("# TYPE coding_helper_scheduler_queue_depth gauge")
+            lines.append(f"coding_helper_scheduler_queue_depth {metrics['queue_depth']}")
+            lines.append("# TYPE coding_helper_scheduler_in_flight gauge")
+            lines.append(f"coding_helper_scheduler_in_flight {metrics['in_flight']}")
+        except Exception:
+            pass
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def _serialized_name(serialized: Optional[Dict[str, Any]], kwargs: Dict[str, Any], default: str) -> str:
+    if kwargs.get("name"):
+        return kwargs["name"]
+    serialized = serialized or {}
+    if serialized.get("name"):
+        return serialized["name"]
+    ids = serialized.get("id") or []
+    return ids[-1] if ids else default
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    """LangChain 실행 이벤트를 span으로 변환하는 콜백
+
+    Chain은 이 프로젝트의 Chain 클래스와 AgentExecutor만 기록하고, 내부 Runnable(프롬프트, 파서 등)은
+    부모 연결만 유지해 span 수를 줄인다. AgentExecutor 바로 아래에서 시작하는 실행(계획 단계)마다
+    반복(iteration) span을 새로 열어 계획 + 도구 실행 시간을 한 반복으로 묶는다.
+    """
+
+    def __init__(self, tracer: Tracer):
+        self.tracer = tracer
+        self._lock = threading.Lock()
+        self._spans: Dict[UUID, Span] = {}
+        # 기록하지 않는 실행 → 가장 가까운 기록 중인 조상 span
+        self._owners: Dict[UUID, Optional[Span]] = {}
+        self._agent_runs: Dict[UUID, Span] = {}
+        self._open_iterations: Dict[UUID, Span] = {}
+
+    # 공통 처리
+    def _parent_span(self, parent_run_id: Optional[UUID]) -> Optional[Span]:
+        if parent_run_id is None:
+            return _active_span.get()
+        return self._spans.get(parent_run_id) or self._owners.get(parent_run_id)
+
+    def _start(self, run_id: UUID, parent_run_id: Optional[UUID], kind: str, name: str) -> Span:
+        with self._lock:
+            parent = self._parent_span(parent_run_id)
+            if parent_run_id in self._agent_runs and kind != KIND_TOOL:
+                parent = self._next_iteration(parent_run_id) or parent
+            elif parent_run_id in self._agent_runs:
+                parent = self._open_iterations.get(parent_run_id) or parent
+            span = Span(
+                span_id=str(run_id),
+                trace_id=parent.trace_id if parent else str(run_id),
+                parent_id=parent.span_id if parent else None,
+                kind=kind,
+                name=name,
+                start=time.time(),
+                _started=time.perf_counter(),
+                _scheduler_start=_scheduler_snapshot(),
+                _previous_active=_active_span.get(),
+            )
+            self._spans[run_id] = span
+        _active_span.set(span)
+        return span
+
+    def _skip(self, run_id: UUID, parent_run_id: Optional[UUID]):
+        with self._lock:
+            owner = self._parent_span(parent_run_id)
+            if parent_run_id in self._agent_runs:
+                owner = self._next_iteration(parent_run_id) or owner
+            self._owners[run_id] = owner
+
+    def _next_iteration(self, agent_run_id: UUID) -> Optional[Span]:
+        """Agent 실행의 새 반복 span 시작 (이전 반복은 종료)"""
+        agent_span = self._agent_runs[agent_run_id]
+        previous = self._open_iterations.pop(agent_run_id, None)
+        if previous is not None:
+            self.tracer.finish(previous)
+        agent_span.iterations += 1
+        iteration = Span(
+            span_id=f"{agent_span.span_id}:{agent_span.iterations}",
+            trace_id=agent_span.trace_id,
+            parent_id=agent_span.span_id,
+            kind=KIND_AGENT_ITERATION,
+            name=f"{agent_span.name}#{agent_span.iterations}",
+            start=time.time(),
+            _started=time.perf_counter(),
+        )
+        self._open_iterations[agent_run_id] = iteration
+        return iteration
+
+    def _end(self, run_id: UUID, error: Optional[BaseException] = None) -> Optional[Span]:
+        with self._lock:
+            self._owners.pop(run_id, None)
+            span = self._spans.pop(run_id, None)
+            if span is None:
+                return None
+            if run_id in self._agent_runs:
+                del self._agent_runs[run_id]
+                iteration = self._open_iterations.pop(run_id, None)
+                if iteration is not None:
+                    self.tracer.finish(iteration)
+            if span.kind == KIND_LLM:
+                queue_wait, retries = _scheduler_snapshot()
+                span.queue_ms = (queue_wait - span._scheduler_start[0]) * 1000
+                span.retries = retries - span._scheduler_start[1]
+        if _active_span.get() is span:
+            _active_span.set(span._previous_active)
+        self.tracer.finish(span, error)
+        return span
+
+    # Chain / AgentExecutor
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None, **kwargs):
+        ids = (serialized or {}).get("id") or []
+        name = _serialized_name(serialized, kwargs, "chain")
+        if "AgentExecutor" in ids or name == "AgentExecutor":
+            span = self._start(run_id, parent_run_id, KIND_AGENT, name)
+            with self._lock:
+                self._agent_runs[run_id] = span
+        elif "coding_test_helper" in ids or name.endswith("Chain"):
+            # 버전에 따라 serialized 없이 이름만 전달되므로 Chain 클래스 이름 규칙으로도 판별
+            self._start(run_id, parent_run_id, KIND_CHAIN, name)
+        else:
+            self._skip(run_id, parent_run_id)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error)
+
+    # @tool
+    def on_tool_start(self, serialized, input_str, *, run_id, parent_run_id=None, **kwargs):
+        self._start(run_id, parent_run_id, KIND_TOOL, _serialized_name(serialized, kwargs, "tool"))
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error)
+
+    # LLM
+    def on_chat_model_start(self, serialized, messages, *, run_id, parent_run_id=None, **kwargs):
+        self._start(run_id, parent_run_id, KIND_LLM, _serialized_name(serialized, kwargs, "llm"))
+
+    def on_llm_start(self, serialized, prompts, *, run_id, parent_run_id=None, **kwargs):
+        self._start(run_id, parent_run_id, KIND_LLM, _serialized_name(serialized, kwargs, "llm"))
+
+    def on_llm_new_token(self, token, *, run_id, **kwargs):
+        span = self._spans.get(run_id)
+        if span is not None and span.ttft_ms is None:
+            span.ttft_ms = (time.perf_counter() - span._started) * 1000
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        span = self._spans.get(run_id)
+        if span is not None:
+            for generations in response.generations:
+                for generation in generations:
+                    message = getattr(generation, "message", None)
+                    if message is None:
+                        continue
+                    usage = extract_usage(message)
+                    span.input_tokens += usage["input_tokens"] + usage["cache_creation_input_tokens"]
+                    span.cached_tokens += usage["cache_read_input_tokens"]
+                    span.output_tokens += usage["output_tokens"]
+        self._end(run_id)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        payload = get_tracer().render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """/metrics 엔드포인트를 백그라운드 스레드에서 제공"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
+
+
+_tracer: Optional[Tracer] = None
+_handler_var: Optional[contextvars.ContextVar] = None
+_install_lock = threading.Lock()
+_installed = False
+
+
+def tracing_enabled() -> bool:
+    return os.getenv("CODING_TEST_HELPER_TRACING", "1") != "0"
+
+
+def get_tracer() -> Tracer:
+    """전역 Tracer 반환"""
+    global _tracer
+    with _install_lock:
+        if _tracer is None:
+            path = os.getenv("CODING_TEST_HELPER_TRACE_FILE")
+            _tracer = Tracer(SpanExporter(path) if path else None)
+        return _tracer
+
+
+def install():
+    """전역 콜백 훅 등록 (여러 번 호출해도 한 번만 설치)
+
+    LangChain의 configure 훅에 등록하므로 callbacks를 넘기지 않은 호출도 모두 기록된다.
+    """
+    global _installed
+    if _installed or not tracing_enabled():
+        return
+    tracer = get_tracer()
+    with _install_lock:
+        if _installed:
+            return
+        from langchain_core.tracers.context import register_configure_hook
+
+        # 기본값으로 핸들러를 지정해 새 스레드(컨텍스트)에서도 항상 보이도록 함
+        global _handler_var
+        _handler_var = contextvars.ContextVar(
+            "coding_test_helper_tracing", default=TracingCallbackHandler(tracer)
+        )
+        register_configure_hook(_handler_var, inheritable=True)
+        _installed = True
+
+        port = os.getenv("CODING_TEST_HELPER_METRICS_PORT")
+        if port:
+            try:
+                start_metrics_server(int(port))
+            except (OSError, ValueError) as e:
+                print(f"지표 엔드포인트 시작 실패: {e}")
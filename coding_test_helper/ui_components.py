@@ -6,21 +6,96 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-from typing import Dict, Any, Callable, Optional
-import threading
+from typing import Dict, Any, Callable, Optional, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+import time
+
+from .scheduler import PRIORITY_INTERACTIVE, PRIORITY_PREFETCH, PromotablePriority, request_priority
+from .session_metrics import collect_snapshot, record_action
 
 
 class ProgressiveHintDialog:
-    """단계별 힌트 제공 다이얼로그"""
+    """단계별 힌트 제공 다이얼로그
+
+    힌트 단계는 고정되어 있으므로(next_step → algorithm → debugging)
+    사용자가 현재 힌트를 읽는 동안 다음 단계 힌트를 미리 생성(prefetch)한다.
+    """
+
+    HINT_TYPES = ["next_step", "algorithm", "debugging"]
+
+    # 세션 전체 prefetch 통계 (추가 토큰 사용량 판단용)
+    # - hits: 클릭 시 이미 준비된 힌트
+    # - late_hits: 생성 중이던 힌트를 이어서 기다린 경우
+    # - misses: prefetch되지 않아 클릭 후 요청한 경우
+    # - wasted: prefetch했지만 표시되지 않고 다이얼로그가 닫힌 경우
+    prefetch_stats = {"hits": 0, "late_hits": 0, "misses": 0, "wasted": 0}
     
-    def __init__(self, parent, problem_description: str, hint_provider_func: Callable):
+    def __init__(self, parent, problem_description: str, hint_provider_func: Callable,
+                 prefetch_depth: int = 1):
+        """
+        Args:
+            parent: 부모 위젯
+            problem_description: 문제 설명
+            hint_provider_func: (문제, 진행 상황, 힌트 종류)를 받아 힌트를 반환하는 함수
+            prefetch_depth: 미리 생성할 다음 힌트 단계 수 (0이면 prefetch 안 함)
+        """
         self.parent = parent
         self.problem_description = problem_description
         self.hint_provider_func = hint_provider_func
+        self.prefetch_depth = max(0, prefetch_depth)
         self.current_hint_level = 0
         self.hints = []
+
+        self._prefetched: Dict[int, Future] = {}
+        self._prefetch_priorities: Dict[int, PromotablePriority] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.prefetch_depth),
+            thread_name_prefix="hint-prefetch"
+        )
+        self._closed = False
         
         self.setup_dialog()
+        self.dialog.bind("<Destroy>", self._on_destroy)
+        self._schedule_prefetch()
+
+    @classmethod
+    def get_prefetch_stats(cls) -> Dict[str, Any]:
+        """prefetch 적중 통계 반환"""
+        stats = dict(cls.prefetch_stats)
+        requested = stats["hits"] + stats["late_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["late_hits"]) / requested if requested else 0.0
+        return stats
+
+    def _request_hint(self, level: int, priority: Union[int, PromotablePriority] = PRIORITY_INTERACTIVE) -> str:
+        """지정한 단계의 힌트 요청 (미리 생성하는 요청은 낮은 우선순위로 스케줄링)"""
+        with request_priority(priority):
+            return self.hint_provider_func(
+                self.problem_description,
+                f"힌트 {level + 1}단계",
+                self.HINT_TYPES[level]
+            )
+
+    def _schedule_prefetch(self):
+        """현재 단계부터 prefetch_depth만큼 힌트를 미리 요청"""
+        if self._closed:
+            return
+        last_level = min(self.current_hint_level + self.prefetch_depth, len(self.HINT_TYPES))
+        for level in range(self.current_hint_level, last_level):
+            if level not in self._prefetched:
+                priority = self._prefetch_priorities[level] = PromotablePriority(PRIORITY_PREFETCH)
+                self._prefetched[level] = self._executor.submit(self._request_hint, level, priority)
+
+    def _on_destroy(self, event):
+        """다이얼로그 종료 시 대기 중인 prefetch 취소"""
+        if event.widget is not self.dialog or self._closed:
+            return
+        self._closed = True
+        for future in self._prefetched.values():
+            if not future.cancel():
+                ProgressiveHintDialog.prefetch_stats["wasted"] += 1
+        self._prefetched.clear()
+        self._prefetch_priorities.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
     
     def setup_dialog(self):
         """다이얼로그 설정"""
@@ -123,28 +198,46 @@ class ProgressiveHintDialog:
             messagebox.showinfo("완료", "모든 힌트를 제공했습니다. 이제 스스로 도전해보세요!")
             return
         
+        level = self.current_hint_level
+        future = self._prefetched.pop(level, None)
+        priority = self._prefetch_priorities.pop(level, None)
+        clicked_at = time.perf_counter()
+
+        if future is not None and future.done() and not future.cancelled():
+            ProgressiveHintDialog.prefetch_stats["hits"] += 1
+            self._show_future_result(future, clicked_at)
+            return
+
         self.next_hint_btn.config(state=tk.DISABLED)
         self.loading_label.config(text="🔄 힌트 생성 중...")
-        
-        def hint_thread():
-            try:
-                hint_types = ["next_step", "algorithm", "debugging"]
-                hint_type = hint_types[self.current_hint_level]
-                
-                current_progress = f"힌트 {self.current_hint_level + 1}단계"
-                hint = self.hint_provider_func(
-                    self.problem_description,
-                    current_progress,
-                    hint_type
-                )
-                
-                self.dialog.after(0, lambda: self.display_hint(hint))
-                
-            except Exception as e:
-                error_msg = f"힌트 생성 실패: {e}"
-                self.dialog.after(0, lambda: self.show_error(error_msg))
-        
-        threading.Thread(target=hint_thread, daemon=True).start()
+
+        if future is not None and not future.cancelled():
+            ProgressiveHintDialog.prefetch_stats["late_hits"] += 1
+            # 사용자가 기다리기 시작했으므로 아직 대기열에 있으면 대화형 요청과 같은 순서로 올림
+            if priority is not None:
+                priority.promote(PRIORITY_INTERACTIVE)
+        else:
+            ProgressiveHintDialog.prefetch_stats["misses"] += 1
+            future = self._executor.submit(self._request_hint, level)
+
+        def on_done(done_future: Future):
+            if not self._closed:
+                self.dialog.after(0, lambda: self._show_future_result(done_future, clicked_at))
+
+        future.add_done_callback(on_done)
+
+    def _show_future_result(self, future: Future, clicked_at: float):
+        """완료된 힌트 요청 결과 표시"""
+        if self._closed:
+            return
+        try:
+            hint = future.result()
+        except Exception as e:
+            self.show_error(f"힌트 생성 실패: {e}")
+            return
+        # 클릭부터 표시까지 (미리 생성된 힌트는 0에 가까움)
+        record_action("힌트", time.perf_counter() - clicked_at)
+        self.display_hint(hint)
     
     def display_hint(self, hint: str):
         """힌트 표시"""
@@ -159,6 +252,8 @@ class ProgressiveHintDialog:
         
         if self.current_hint_level >= 3:
             self.next_hint_btn.config(text="✅ 완료", state=tk.DISABLED)
+        else:
+            self._schedule_prefetch()
     
     def show_error(self, error_msg: str):
         """에러 표시"""
@@ -276,6 +371,67 @@ class ProblemInputDialog:
         self.dialog.destroy()
 
 
+class RegionSelectDialog:
+    """화면 캡처 영역 선택 오버레이
+
+    반투명 전체 화면 창 위에서 드래그하여 영역을 고른다. (Esc: 취소)
+    result는 (left, top, width, height) 화면 좌표 또는 None
+    """
+
+    MIN_SIZE = 10
+
+    def __init__(self, parent):
+        self.result = None
+        self._start = None
+        self._rect = None
+
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.attributes('-fullscreen', True)
+        self.dialog.attributes('-topmost', True)
+        self.dialog.attributes('-alpha', 0.3)
+        self.dialog.configure(cursor="crosshair")
+
+        self.canvas = tk.Canvas(self.dialog, bg="#000000", highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas.create_text(
+            self.dialog.winfo_screenwidth() // 2, 40,
+            text="캡처할 영역을 드래그하세요 (Esc: 취소)",
+            fill="#ffffff",
+            font=("Arial", 16, "bold")
+        )
+
+        self.canvas.bind('<ButtonPress-1>', self.on_press)
+        self.canvas.bind('<B1-Motion>', self.on_drag)
+        self.canvas.bind('<ButtonRelease-1>', self.on_release)
+        self.dialog.bind('<Escape>', lambda event: self.dialog.destroy())
+
+        self.dialog.focus_force()
+        self.dialog.grab_set()
+
+        # 대화상자가 닫힐 때까지 대기
+        self.dialog.wait_window()
+
+    def on_press(self, event):
+        self._start = (event.x_root, event.y_root, event.x, event.y)
+        self._rect = self.canvas.create_rectangle(event.x, event.y, event.x, event.y, outline="#e74c3c", width=2)
+
+    def on_drag(self, event):
+        if self._rect is not None:
+            _, _, x, y = self._start
+            self.canvas.coords(self._rect, x, y, event.x, event.y)
+
+    def on_release(self, event):
+        if self._start is None:
+            return
+        start_x, start_y, _, _ = self._start
+        left, top = min(start_x, event.x_root), min(start_y, event.y_root)
+        width, height = abs(event.x_root - start_x), abs(event.y_root - start_y)
+
+        if width >= self.MIN_SIZE and height >= self.MIN_SIZE:
+            self.result = (left, top, width, height)
+        self.dialog.destroy()
+
+
 class LearningProgressTracker:
     """학습 진행 상황 추적기"""
     
@@ -345,3 +501,115 @@ class LearningProgressTracker:
     def get_tracker_frame(self):
         """추적기 프레임 반환"""
         return self.tracker_frame
+
+
+class PerformanceHUD:
+    """성능 패널
+
+    동작별 응답 시간, 이번 세션 토큰/예상 비용, 캐시 적중률, 요청 대기열, Tk 이벤트 루프 지연을
+    UI 스레드에서 낮은 주기로 갱신해 표시한다.
+    이벤트 루프 지연은 after() 예약 시각과 실제 실행 시각의 차이로 측정한다.
+    """
+
+    REFRESH_INTERVAL_MS = 1000
+    MAX_ACTIONS = 4
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.loop_lag_ms = 0.0
+        self.max_loop_lag_ms = 0.0
+        self._expected_at = None
+        self._after_id = None
+
+        self.setup_hud()
+
+    def setup_hud(self):
+        """패널 UI 설정"""
+        self.hud_frame = tk.Frame(self.parent, bg="#1e272e", relief=tk.RAISED, bd=1)
+
+        tk.Label(
+            self.hud_frame,
+            text="⚡ 성능",
+            font=("Arial", 9, "bold"),
+            bg="#1e272e",
+            fg="#d2dae2"
+        ).pack(anchor=tk.W, padx=5, pady=(2, 0))
+
+        self.lines = {}
+        for key in ("actions", "tokens", "cache", "queue"):
+            label = tk.Label(
+                self.hud_frame,
+                text="",
+                font=("Consolas", 8),
+                bg="#1e272e",
+                fg="#d2dae2",
+                justify=tk.LEFT,
+                anchor=tk.W
+            )
+            label.pack(fill=tk.X, padx=5)
+            self.lines[key] = label
+
+        self.hud_frame.bind("<Destroy>", self._on_destroy)
+        self._schedule()
+
+    def _schedule(self):
+        self._expected_at = time.perf_counter() + self.REFRESH_INTERVAL_MS / 1000
+        self._after_id = self.hud_frame.after(self.REFRESH_INTERVAL_MS, self._tick)
+
+    def _tick(self):
+        lag_ms = max(0.0, (time.perf_counter() - self._expected_at) * 1000)
+        self.loop_lag_ms = lag_ms
+        self.max_loop_lag_ms = max(self.max_loop_lag_ms, lag_ms)
+        try:
+            self.refresh(collect_snapshot())
+        except Exception as e:
+            self.lines["actions"].config(text=f"지표 수집 실패: {e}")
+        self._schedule()
+
+    def _on_destroy(self, event):
+        if event.widget is self.hud_frame and self._after_id is not None:
+            self.hud_frame.after_cancel(self._after_id)
+            self._after_id = None
+
+    def refresh(self, snapshot: Dict[str, Any]):
+        """지표 표시 갱신"""
+        actions = list(snapshot["actions"].items())[:self.MAX_ACTIONS]
+        if actions:
+            action_text = "\n".join(
+                f"{name[:8]:<8} p50 {stats['p50']:.1f}s  p95 {stats['p95']:.1f}s (n={stats['count']})"
+                for name, stats in actions
+            )
+        else:
+            action_text = "아직 요청 없음"
+        self.lines["actions"].config(text=action_text)
+
+        self.lines["tokens"].config(
+            text=f"토큰 {_compact(snapshot['input_tokens'])} 입력 / {_compact(snapshot['output_tokens'])} 출력"
+                 f"  ≈ ${snapshot['cost_usd']:.3f}"
+        )
+
+        hit_rate = snapshot["response_cache_hit_rate"]
+        response_cache = "꺼짐" if hit_rate is None else f"{hit_rate:.0%}"
+        self.lines["cache"].config(
+            text=f"응답 캐시 {response_cache}  프롬프트 캐시 {snapshot['prompt_cache_ratio']:.0%}"
+        )
+
+        lag_color = "#ff5e57" if self.loop_lag_ms > 100 else "#d2dae2"
+        self.lines["queue"].config(
+            text=f"대기 {snapshot['queue_depth']} · 실행 {snapshot['in_flight']}"
+                 f"  UI 지연 {self.loop_lag_ms:.0f}ms (최대 {self.max_loop_lag_ms:.0f})",
+            fg=lag_color
+        )
+
+    def get_hud_frame(self):
+        """패널 프레임 반환"""
+        return self.hud_frame
+
+
+def _compact(value: int) -> str:
+    """1234 → 1.2k"""
+    if value >= 1_000_000:
+        return f"{value / 1_000_000:.1f}M"
+    if value >= 1000:
+        return f"{value / 1000:.1f}k"
+    return str(value)
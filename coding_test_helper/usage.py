@@ -0,0 +1,151 @@
+"""
+코딩 테스트 도우미 토큰 사용량 기록
+
+LLM 응답의 사용량 정보에서 입력/출력 토큰과 프롬프트 캐시 적중(읽기)/생성 토큰을 추출하여
+요청별로 기록
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_read_input_tokens",
+    "cache_creation_input_tokens",
+)
+
+
+def extract_usage(message: Any) -> Dict[str, int]:
+    """LLM 응답 메시지에서 사용량 추출
+
+    langchain_anthropic 버전에 따라 response_metadata["usage"] 또는 usage_metadata에 담긴다.
+    input_tokens는 캐시되지 않은 입력 토큰만 의미한다.
+    """
+    usage = {field: 0 for field in USAGE_FIELDS}
+
+    metadata = getattr(message, "response_metadata", None) or {}
+    raw = metadata.get("usage") or {}
+    if not isinstance(raw, dict):
+        raw = getattr(raw, "model_dump", getattr(raw, "dict", lambda: {}))()
+
+    if raw:
+        for field in USAGE_FIELDS:
+            usage[field] = int(raw.get(field) or 0)
+        return usage
+
+    usage_metadata = getattr(message, "usage_metadata", None) or {}
+    if usage_metadata:
+        details = usage_metadata.get("input_token_details") or {}
+        usage["cache_read_input_tokens"] = int(details.get("cache_read") or 0)
+        usage["cache_creation_input_tokens"] = int(details.get("cache_creation") or 0)
+        # usage_metadata의 input_tokens는 캐시 토큰을 포함한 전체 입력
+        usage["input_tokens"] = max(
+            0,
+            int(usage_metadata.get("input_tokens") or 0)
+            - usage["cache_read_input_tokens"]
+            - usage["cache_creation_input_tokens"]
+        )
+        usage["output_tokens"] = int(usage_metadata.get("output_tokens") or 0)
+    return usage
+
+
+class UsageTracker:
+    """요청별 토큰 사용량 기록기"""
+
+    def __init__(self, max_records: int = 500):
+        self._lock = threading.Lock()
+        self._records: deque = deque(maxlen=max_records)
+        self._totals = {field: 0 for field in USAGE_FIELDS}
+        self._totals["requests"] = 0
+
+    def record(self, label: str, usage: Dict[str, int]) -> Dict[str, Any]:
+        """사용량 기록
+
+        Args:
+            label: 호출 위치 (도구/체인 이름 등)
+            usage: extract_usage 결과
+
+        Returns:
+            기록된 항목
+        """
+        entry = {"label": label, "timestamp": time.time(), **usage}
+        with self._lock:
+            self._records.append(entry)
+            self._totals["requests"] += 1
+            for field in USAGE_FIELDS:
+                self._totals[field] += usage.get(field, 0)
+        return entry
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """최근 기록 반환"""
+        with self._lock:
+            records = list(self._records)
+        return records[-limit:] if limit else records
+
+    def totals(self) -> Dict[str, Any]:
+        """누적 사용량과 캐시 적중 비율 반환"""
+        with self._lock:
+            totals = dict(self._totals)
+        prompt_tokens = (
+            totals["input_tokens"]
+            + totals["cache_read_input_tokens"]
+            + totals["cache_creation_input_tokens"]
+        )
+        totals["cached_input_ratio"] = (
+            totals["cache_read_input_tokens"] / prompt_tokens if prompt_tokens else 0.0
+        )
+        return totals
+
+    def reset(self):
+        with self._lock:
+            self._records.clear()
+            for key in self._totals:
+                self._totals[key] = 0
+
+
+class UsageCallbackHandler(BaseCallbackHandler):
+    """AgentExecutor 등 LangChain 내부 LLM 호출의 사용량을 기록하는 콜백
+
+    도구 내부 LLM 호출은 도구 쪽(invoke_with_stream)에서 이미 기록하므로 제외한다.
+    """
+
+    def __init__(self, label: str, tracker: Optional[UsageTracker] = None):
+        self.label = label
+        self.tracker = tracker
+        self._tool_runs = set()
+
+    def on_tool_start(self, serialized, input_str, *, run_id, **kwargs):
+        self._tool_runs.add(run_id)
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self._tool_runs.discard(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._tool_runs.discard(run_id)
+
+    def on_llm_end(self, response, *, parent_run_id=None, **kwargs):
+        if parent_run_id is not None and parent_run_id in self._tool_runs:
+            return
+        tracker = self.tracker or get_usage_tracker()
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                if message is not None:
+                    tracker.record(self.label, extract_usage(message))
+
+
+# 전역 사용량 기록기
+_usage_tracker = None
+
+def get_usage_tracker() -> UsageTracker:
+    """전역 사용량 기록기 반환"""
+    global _usage_tracker
+    if _usage_tracker is None:
+        _usage_tracker = UsageTracker()
+    return _usage_tracker
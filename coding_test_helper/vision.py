@@ -0,0 +1,69 @@
+"""
+코딩 테스트 도우미 화면 분석
+
+캡처 이미지와 사용자 요청을 한 번의 멀티모달 호출로 분석한다.
+Agent를 거치지 않으므로 캡처 한 번에 모델 호출은 한 번이며,
+같은 이미지/요청은 이미지 해시 기반 응답 캐시로 재사용한다.
+"""
+
+import hashlib
+from typing import List
+
+from .image_pipeline import EncodedImage
+from .tools import invoke_llm, get_anthropic_llm
+
+
+VISION_SYSTEM_PROMPT = """당신은 코딩 테스트 학습을 돕는 멘토입니다. 사용자가 보낸 화면 캡처를 보고 요청에 답하세요.
+
+원칙:
+1. 화면에 보이는 문제, 코드, 에러 메시지를 먼저 정확히 읽고 요약하세요.
+2. 완전한 정답 코드는 제공하지 마세요. 접근 방향, 의심 지점, 확인할 질문을 제시하세요.
+3. 에러가 보이면 에러 종류와 발생 위치(줄 번호)를 짚고, 원인을 스스로 찾도록 안내하세요.
+4. 화면 일부만 전달된 경우 이전 분석 요약을 참고해 바뀐 부분에 집중하세요.
+5. 글자가 흐려 읽을 수 없는 부분은 추측하지 말고 다시 캡처해 달라고 요청하세요.
+
+응답 형식:
+## 🖥️ 화면 요약
+## 🔍 분석
+## 💡 다음 단계"""
+
+
+def image_digest(image: EncodedImage) -> str:
+    """인코딩된 이미지의 해시 (응답 캐시 키용)"""
+    return hashlib.sha256(image.data).hexdigest()[:32]
+
+
+def analyze_screen(images: List[EncodedImage], user_request: str, context: str = "") -> str:
+    """캡처 이미지 분석
+
+    Args:
+        images: 인코딩된 화면 캡처 (또는 바뀐 영역) 목록
+        user_request: 사용자 요청사항
+        context: 추가 설명 (직전 캡처 대비 변경 영역, 이전 분석 요약 등)
+
+    Returns:
+        분석 결과 텍스트
+
+    Raises:
+        RuntimeError: AI 모델을 사용할 수 없을 때
+        Exception: 모델 호출 실패 (오류 문구가 이전 분석으로 저장되지 않도록 그대로 전달)
+    """
+    llm = get_anthropic_llm()
+    if llm is None:
+        raise RuntimeError("AI 모델을 사용할 수 없습니다. API 키를 확인해주세요.")
+
+    text = f"요청사항: {user_request}"
+    if context:
+        text += f"\n\n{context}"
+    content = [image.to_content_block() for image in images]
+    content.append({"type": "text", "text": text})
+
+    return invoke_llm(
+        llm,
+        VISION_SYSTEM_PROMPT,
+        content,
+        tool="analyze_screen",
+        images=[image_digest(image) for image in images],
+        user_request=user_request,
+        context=context
+    )
@@ -0,0 +1,75 @@
+"""응답 캐시 TTL/LRU/디스크 용량 정리 테스트"""
+
+from coding_test_helper import cache as cache_module
+from coding_test_helper.cache import ResponseCache, make_cache_key, normalize_text
+
+
+def test_cache_key_ignores_line_endings_and_trailing_spaces():
+    first = make_cache_key("model", "system", code="def f():  \r\n    return 1\r\n")
+    second = make_cache_key("model", "system", code="def f():\n    return 1")
+    assert first == second
+    assert make_cache_key("model", "system", code="def f():\n  return 1") != second
+    assert normalize_text("\n\nabc  \n") == "abc"
+
+
+def test_memory_lru_evicts_least_recently_used():
+    cache = ResponseCache(max_memory_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_expired_entries_are_ignored(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = ResponseCache(ttl_seconds=10)
+    cache.set("key", "value")
+
+    now[0] += 5
+    assert cache.get("key") == "value"
+    now[0] += 6
+    assert cache.get("key") is None
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_disk_cache_survives_restart_and_expires(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    db_path = tmp_path / "responses.sqlite3"
+    ResponseCache(db_path=db_path, ttl_seconds=10).set("key", "value")
+
+    restarted = ResponseCache(db_path=db_path, ttl_seconds=10)
+    assert restarted.get("key") == "value"
+    assert restarted.stats["disk_hits"] == 1
+
+    now[0] += 20
+    assert ResponseCache(db_path=db_path, ttl_seconds=10).get("key") is None
+
+
+def test_disk_cache_evicts_oldest_access_over_size_limit(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    db_path = tmp_path / "responses.sqlite3"
+    cache = ResponseCache(db_path=db_path, max_disk_bytes=25)
+    for key in ("a", "b"):
+        now[0] += 1
+        cache.set(key, "x" * 10)
+    now[0] += 1
+    cache._memory.clear()
+    assert cache.get("a") == "x" * 10
+    now[0] += 1
+    cache.set("c", "x" * 10)
+
+    reopened = ResponseCache(db_path=db_path, max_disk_bytes=25)
+    assert reopened.get("b") is None
+    assert reopened.get("a") == "x" * 10
+    assert reopened.get("c") == "x" * 10
+
+
+def test_default_cache_dir_does_not_depend_on_working_directory():
+    assert cache_module.DEFAULT_CACHE_DIR.is_absolute()
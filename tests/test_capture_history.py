@@ -0,0 +1,130 @@
+"""화면 캡처 차이 계산 테스트 (합성 이미지 사용)"""
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from coding_test_helper.capture_history import (
+    FRAME_FIRST,
+    FRAME_FULL,
+    FRAME_PARTIAL,
+    FRAME_UNCHANGED,
+    CaptureHistory,
+    changed_block_mask,
+    group_blocks,
+    hash_distance,
+    perceptual_hash,
+)
+
+
+def screen(size=(320, 240)) -> Image.Image:
+    """가로 줄무늬가 있는 가짜 편집기 화면"""
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    for y in range(10, size[1], 20):
+        draw.line((10, y, size[0] // 2, y), fill="black", width=2)
+    return image
+
+
+def with_box(image: Image.Image, box, fill="red") -> Image.Image:
+    changed = image.copy()
+    ImageDraw.Draw(changed).rectangle(box, fill=fill)
+    return changed
+
+
+def test_perceptual_hash_is_stable_for_same_image():
+    image = screen()
+    assert perceptual_hash(image) == perceptual_hash(image.copy())
+    assert hash_distance(0b1010, 0b0110) == 2
+
+
+def test_changed_block_mask_counts_pixels_per_block():
+    previous = np.zeros((64, 96), dtype=np.uint8)
+    current = previous.copy()
+    current[40:44, 70:74] = 255  # 16픽셀 변경 → 한 블록
+    current[5, 5] = 255  # 1픽셀 노이즈 → 무시
+
+    mask = changed_block_mask(previous, current, block_size=32, min_pixels=8)
+
+    assert mask.shape == (2, 3)
+    assert mask.tolist() == [[False, False, False], [False, False, True]]
+
+
+def test_group_blocks_joins_diagonal_neighbours():
+    mask = np.zeros((4, 4), dtype=bool)
+    mask[0, 0] = mask[1, 1] = True
+    mask[3, 3] = True
+
+    assert sorted(group_blocks(mask)) == [(0, 0, 2, 2), (3, 3, 4, 4)]
+
+
+def test_first_frame_then_unchanged_reuses_previous_analysis():
+    history = CaptureHistory()
+    image = screen()
+
+    first = history.compare(image)
+    assert first.kind == FRAME_FIRST and not first.should_skip
+    history.remember(image, "이전 분석")
+
+    again = history.compare(image.copy())
+    assert again.kind == FRAME_UNCHANGED
+    assert again.should_skip
+    assert again.previous_analysis == "이전 분석"
+
+
+def test_unchanged_without_analysis_is_not_skipped():
+    history = CaptureHistory()
+    image = screen()
+    history.remember(image)
+
+    assert history.compare(image).kind == FRAME_UNCHANGED
+    assert not history.compare(image).should_skip
+
+
+def test_small_change_sends_only_changed_region():
+    history = CaptureHistory(padding=0)
+    image = screen()
+    history.remember(image, "## 분석\n결과")
+
+    diff = history.compare(with_box(image, (200, 100, 220, 110)))
+
+    assert diff.kind == FRAME_PARTIAL
+    assert diff.regions == [(192, 96, 224, 128)]
+    (crop,) = diff.crops()
+    assert crop.size == (32, 32)
+    assert "(192, 96) ~ (224, 128)" in diff.describe()
+    assert "## 분석" in diff.describe()
+
+
+def test_large_change_sends_full_frame():
+    history = CaptureHistory()
+    image = screen()
+    history.remember(image, "분석")
+
+    diff = history.compare(with_box(image, (0, 0, 320, 200), fill="blue"))
+
+    assert diff.kind == FRAME_FULL
+    assert diff.crops() == [diff.image]
+
+
+def test_many_regions_are_merged_to_limit():
+    history = CaptureHistory(max_regions=2)
+    image = Image.new("RGB", (640, 640), "white")
+    history.remember(image)
+    changed = image
+    for x in (0, 200, 400, 600):
+        changed = with_box(changed, (x, 600, x + 10, 610), fill="black")
+
+    diff = history.compare(changed)
+
+    assert diff.kind == FRAME_PARTIAL
+    assert len(diff.regions) == 2
+
+
+def test_reset_and_size_change_start_over():
+    history = CaptureHistory()
+    history.remember(screen(), "분석")
+
+    assert history.compare(screen((400, 300))).kind == FRAME_FIRST
+    history.reset()
+    assert history.compare(screen()).kind == FRAME_FIRST
+    assert history.stats["first"] == 2
@@ -0,0 +1,105 @@
+"""카세트 녹화/재생 요청 매칭 테스트"""
+
+import json
+
+import httpx
+import pytest
+
+from coding_test_helper.cassette import (
+    MODE_RECORD,
+    MODE_REPLAY,
+    Cassette,
+    CassetteMissError,
+    CassetteTransport,
+    request_key,
+)
+
+URL = "http://test/v1/messages"
+
+
+class TextStream(httpx.SyncByteStream):
+    def __init__(self, text: str):
+        self.text = text
+
+    def __iter__(self):
+        yield self.text.encode("utf-8")
+
+
+def reply_with_prompt(request: httpx.Request) -> httpx.Response:
+    """요청 내용과 호출 순서를 담은 JSON 응답"""
+    reply_with_prompt.calls += 1
+    prompt = json.loads(request.content)["messages"][0]["content"]
+    body = json.dumps({"text": f"{prompt} #{reply_with_prompt.calls}", "usage": {"input_tokens": 7, "output_tokens": 3}})
+    return httpx.Response(200, headers={"content-type": "application/json"}, stream=TextStream(body))
+
+
+def body(prompt: str, stream: bool = False) -> dict:
+    return {"model": "m", "stream": stream, "messages": [{"role": "user", "content": prompt}]}
+
+
+def post(client: httpx.Client, payload: dict) -> dict:
+    return client.post(URL, content=json.dumps(payload).encode()).json()
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    """"a", "a", "b" 순서로 녹화한 카세트 경로"""
+    reply_with_prompt.calls = 0
+    path = str(tmp_path / "session.jsonl.gz")
+    cassette = Cassette(path, mode=MODE_RECORD)
+    with httpx.Client(transport=CassetteTransport(cassette, httpx.MockTransport(reply_with_prompt))) as client:
+        for prompt in ("a", "a", "b"):
+            post(client, body(prompt))
+    return path
+
+
+def replay_client(path: str, strict: bool = False):
+    cassette = Cassette(path, mode=MODE_REPLAY, time_scale=0, strict=strict)
+    return cassette, httpx.Client(transport=CassetteTransport(cassette))
+
+
+def test_request_key_ignores_json_key_order():
+    first = httpx.Request("POST", URL, content=b'{"a": 1, "b": 2}')
+    second = httpx.Request("POST", URL, content=b'{"b":2,"a":1}')
+    assert request_key(first) == request_key(second)
+    assert request_key(first) != request_key(httpx.Request("POST", URL, content=b'{"a": 2, "b": 2}'))
+
+
+def test_same_requests_replay_in_recorded_order(recorded):
+    cassette, client = replay_client(recorded)
+    with client:
+        assert post(client, body("b"))["text"] == "b #3"
+        assert post(client, body("a"))["text"] == "a #1"
+        assert post(client, body("a"))["text"] == "a #2"
+
+    assert cassette.stats == {"requests": 3, "matched": 3, "fallback": 0, "misses": 0}
+    assert cassette.log[0]["input_tokens"] == 7
+
+
+def test_changed_request_falls_back_to_first_unused_recording(recorded):
+    cassette, client = replay_client(recorded)
+    with client:
+        assert post(client, body("a"))["text"] == "a #1"
+        assert post(client, body("바뀐 프롬프트"))["text"] == "a #2"
+
+    assert cassette.stats["fallback"] == 1
+
+
+def test_fallback_requires_same_streaming_mode(recorded):
+    cassette, client = replay_client(recorded)
+    with client, pytest.raises(CassetteMissError):
+        post(client, body("a", stream=True))
+    assert cassette.stats["misses"] == 1
+
+
+def test_strict_mode_and_exhausted_cassette_raise_miss(recorded):
+    _, client = replay_client(recorded, strict=True)
+    with client, pytest.raises(CassetteMissError):
+        post(client, body("바뀐 프롬프트"))
+
+    _, client = replay_client(recorded)
+    with client:
+        for prompt in ("a", "a", "b"):
+            post(client, body(prompt))
+        with pytest.raises(CassetteMissError):
+            post(client, body("a"))
@@ -0,0 +1,150 @@
+"""정적 복잡도 분석 테스트"""
+
+from coding_test_helper.complexity import analyze_complexity, detect_language
+
+
+def kinds(report):
+    return {finding.kind for finding in report.findings}
+
+
+def test_nested_loops_over_input_are_quadratic():
+    report = analyze_complexity(
+        "def f(arr):\n"
+        "    for i in range(len(arr)):\n"
+        "        for j in range(len(arr)):\n"
+        "            pass\n"
+    )
+    assert report.time_complexity == "O(n^2)"
+    assert report.max_loop_depth == 2
+    assert "nested_loops" in kinds(report)
+
+
+def test_constant_loops_are_not_reported_as_nested():
+    report = analyze_complexity(
+        "for i in range(3):\n"
+        "    for j in range(4):\n"
+        "        print(i, j)\n"
+    )
+    assert report.time_complexity == "O(1)"
+    assert "nested_loops" not in kinds(report)
+
+
+def test_direction_loop_inside_input_loop_is_linear():
+    report = analyze_complexity(
+        "def f(n):\n"
+        "    for i in range(n):\n"
+        "        for dx, dy in [(0, 1), (1, 0)]:\n"
+        "            pass\n"
+    )
+    assert report.time_complexity == "O(n)"
+    assert "nested_loops" not in kinds(report)
+
+
+def test_bfs_neighbor_loop_is_not_multiplied():
+    report = analyze_complexity(
+        "from collections import deque\n"
+        "def bfs(graph, start):\n"
+        "    queue = deque([start])\n"
+        "    visited = {start}\n"
+        "    while queue:\n"
+        "        node = queue.popleft()\n"
+        "        for nxt in graph[node]:\n"
+        "            if nxt not in visited:\n"
+        "                visited.add(nxt)\n"
+        "                queue.append(nxt)\n"
+    )
+    assert report.time_complexity == "O(n)"
+    assert "neighbor_loop" in kinds(report)
+    assert "nested_loops" not in kinds(report)
+
+
+def test_sliced_inner_loop_is_still_quadratic():
+    report = analyze_complexity(
+        "def f(arr):\n"
+        "    for i in range(len(arr)):\n"
+        "        for x in arr[i:]:\n"
+        "            pass\n"
+    )
+    assert report.time_complexity == "O(n^2)"
+    assert {"slice", "nested_loops"} <= kinds(report)
+
+
+def test_hidden_linear_operations_in_loop():
+    report = analyze_complexity(
+        "def f(nums):\n"
+        "    result = []\n"
+        "    s = ''\n"
+        "    for x in nums:\n"
+        "        if x not in result:\n"
+        "            result.append(x)\n"
+        "        s += str(x)\n"
+        "        nums.pop(0)\n"
+    )
+    assert report.time_complexity == "O(n^2)"
+    assert {"list_membership", "string_concat", "pop_front"} <= kinds(report)
+
+
+def test_recursion_kinds():
+    fib = analyze_complexity("def fib(n):\n    return fib(n - 1) + fib(n - 2) if n > 1 else n\n")
+    assert fib.time_complexity == "O(2^n)"
+
+    memo = analyze_complexity(
+        "from functools import lru_cache\n"
+        "@lru_cache(None)\n"
+        "def fib(n):\n    return fib(n - 1) + fib(n - 2) if n > 1 else n\n"
+    )
+    assert memo.time_complexity == "O(n)"
+
+    search = analyze_complexity(
+        "def search(arr, lo, hi):\n"
+        "    mid = (lo + hi) // 2\n"
+        "    return search(arr, lo, mid)\n"
+    )
+    assert search.time_complexity == "O(log n)"
+
+
+def test_javascript_loops():
+    quadratic = analyze_complexity(
+        "function f(arr) {\n"
+        "  for (let i = 0; i < arr.length; i++) {\n"
+        "    for (let j = 0; j < arr.length; j++) { console.log(i, j); }\n"
+        "  }\n"
+        "}\n"
+    )
+    assert quadratic.language == "javascript"
+    assert quadratic.time_complexity == "O(n^2)"
+    assert "nested_loops" in kinds(quadratic)
+
+    constant = analyze_complexity(
+        "function f() {\n"
+        "  for (let i = 0; i < 3; i++) {\n"
+        "    for (let j = 0; j < 4; j++) { console.log(i, j); }\n"
+        "  }\n"
+        "}\n"
+    )
+    assert constant.time_complexity == "O(1)"
+    assert "nested_loops" not in kinds(constant)
+
+
+def test_javascript_bfs_is_linear():
+    report = analyze_complexity(
+        "function bfs(graph, start) {\n"
+        "  const queue = [start];\n"
+        "  const visited = new Set([start]);\n"
+        "  while (queue.length) {\n"
+        "    const node = queue.pop();\n"
+        "    for (const nxt of graph[node]) {\n"
+        "      if (!visited.has(nxt)) { visited.add(nxt); queue.push(nxt); }\n"
+        "    }\n"
+        "  }\n"
+        "}\n"
+    )
+    assert report.time_complexity == "O(n)"
+    assert "nested_loops" not in kinds(report)
+
+
+def test_syntax_error_and_language_detection():
+    report = analyze_complexity("def f(:\n    pass")
+    assert report.error and "구문 오류" in report.summary()
+    assert detect_language("const x = 1;") == "javascript"
+    assert detect_language("print(1)") == "python"
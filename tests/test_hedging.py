@@ -0,0 +1,80 @@
+"""헤지 요청 꼬리 지연/추가 요청 비율 테스트 (로컬 대체 서버 사용)"""
+
+import time
+import threading
+
+from langchain_anthropic import ChatAnthropic
+
+from benchmarks.fake_anthropic_server import FakeAnthropicServer
+from coding_test_helper.hedging import HedgingPolicy, hedged_stream
+from coding_test_helper.llm_registry import DEFAULT_MODEL
+
+BASE_LATENCY = 0.02
+SLOW_LATENCY = 0.4
+MAX_HEDGE_RATIO = 0.2
+
+
+def every_tenth_slow():
+    """서버에 도착한 요청 10개 중 1개만 느리게 응답 (순차 호출이면 헤지 요청은 항상 빠름)"""
+    count = [0]
+    lock = threading.Lock()
+
+    def latency() -> float:
+        with lock:
+            count[0] += 1
+            return SLOW_LATENCY if count[0] % 10 == 0 else BASE_LATENCY
+
+    return latency
+
+
+def measure_ttfts(llm, requests: int, policy=None):
+    messages = [{"role": "user", "content": "ping"}]
+    ttfts = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        chunks = llm.stream(messages) if policy is None else hedged_stream(lambda: llm.stream(messages), policy)
+        ttft = None
+        for _chunk in chunks:
+            if ttft is None:
+                ttft = time.perf_counter() - started
+        ttfts.append(ttft)
+    return sorted(ttfts)
+
+
+def p99(values):
+    return values[min(len(values) - 1, int(round(0.99 * (len(values) - 1))))]
+
+
+def test_hedging_cuts_tail_latency_with_bounded_duplicates():
+    requests = 40
+    with FakeAnthropicServer(latency=every_tenth_slow()) as server:
+        llm = ChatAnthropic(model=DEFAULT_MODEL, api_key="fake-key", base_url=server.base_url, max_retries=0)
+        baseline = measure_ttfts(llm, requests)
+
+        policy = HedgingPolicy(enabled=True, min_delay=0.1, initial_delay=0.1, max_hedge_ratio=MAX_HEDGE_RATIO)
+        server.reset_stats()
+        hedged = measure_ttfts(llm, requests, policy)
+        duplicates = server.request_count - requests
+
+    assert p99(baseline) >= SLOW_LATENCY
+    assert p99(hedged) < p99(baseline) / 2
+    assert 0 < duplicates <= MAX_HEDGE_RATIO * requests
+    assert policy.get_stats()["hedge_wins"] >= 1
+
+
+def test_cancelled_primary_is_recorded_in_ttft_window():
+    policy = HedgingPolicy(enabled=True, initial_delay=0.05, max_hedge_ratio=1.0)
+    calls = []
+
+    def start_stream():
+        calls.append(True)
+        if len(calls) == 1:
+            time.sleep(0.5)
+        yield "chunk"
+
+    assert list(hedged_stream(start_stream, policy)) == ["chunk"]
+
+    # 이긴 헤지 요청의 TTFT와 함께 원 요청의 취소 시점 경과 시간(>= 기준 시간)도 표본에 들어감
+    assert len(policy.ttft) == 2
+    assert policy.ttft.percentile(1.0) >= 0.05
+    assert policy.get_stats()["hedge_wins"] == 1
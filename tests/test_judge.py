@@ -0,0 +1,124 @@
+"""로컬 채점기 테스트 (예제 추출과 작은 제출 코드 채점)"""
+
+import pytest
+
+from coding_test_helper.judge import (
+    VERDICT_AC,
+    VERDICT_MLE,
+    VERDICT_RE,
+    VERDICT_TLE,
+    VERDICT_WA,
+    extract_examples,
+    judge_submission,
+    parse_call_arguments,
+    parse_memory_limit,
+)
+
+
+BAEKJOON_PROBLEM = """두 정수 A와 B를 입력받은 다음, A+B를 출력하는 프로그램을 작성하시오.
+
+시간 제한 1 초 메모리 제한 64 MB
+
+입력
+첫째 줄에 A와 B가 주어진다.
+
+출력
+첫째 줄에 A+B를 출력한다.
+
+예제 입력 1 복사
+1 2
+예제 출력 1 복사
+3
+
+예제 입력 2 복사
+10 -4
+예제 출력 2 복사
+6
+"""
+
+LEETCODE_PROBLEM = """두 배열의 교집합을 반환하세요. 결과는 어떤 순서로든 반환할 수 있습니다.
+
+Example 1:
+Input: nums1 = [1,2,2,1], nums2 = [2,2]
+Output: [2]
+
+Example 2:
+Input: nums1 = [4,9,5], nums2 = [9,4,9,8,4]
+Output: [9,4]
+Explanation: [4,9] is also accepted.
+"""
+
+
+def test_extract_examples_baekjoon_format():
+    examples = extract_examples(BAEKJOON_PROBLEM)
+
+    assert [(e.index, e.input, e.expected) for e in examples] == [(1, "1 2", "3"), (2, "10 -4", "6")]
+
+
+def test_extract_examples_inline_format_stops_at_explanation():
+    examples = extract_examples(LEETCODE_PROBLEM)
+
+    assert [(e.input, e.expected) for e in examples] == [
+        ("nums1 = [1,2,2,1], nums2 = [2,2]", "[2]"),
+        ("nums1 = [4,9,5], nums2 = [9,4,9,8,4]", "[9,4]"),
+    ]
+
+
+def test_extract_examples_ignores_format_sections():
+    assert extract_examples("입력\n첫째 줄에 N이 주어진다.\n\n출력\n답을 출력한다.") == []
+
+
+def test_parse_helpers():
+    assert parse_memory_limit(BAEKJOON_PROBLEM) == 64
+    assert parse_call_arguments("nums = [1,2], target = 3") == ([], {"nums": [1, 2], "target": 3})
+
+
+@pytest.mark.parametrize("code, verdict", [
+    ("a, b = map(int, input().split())\nprint(a + b)", VERDICT_AC),
+    ("from sys import stdin\nprint(sum(map(int, stdin.readline().split())))", VERDICT_AC),
+    ("print(sum(map(int, open(0).read().split())))", VERDICT_AC),
+    ("a, b = map(int, input().split())\nprint(a - b)", VERDICT_WA),
+    ("input()\nwhile True:\n    pass", VERDICT_TLE),
+    ("input()\nblocks = [bytearray(1 << 20) for _ in range(1024)]", VERDICT_MLE),
+    ("a, b = map(int, input().split())\nprint(a // 0)", VERDICT_RE),
+])
+def test_judge_stdin_verdicts(code, verdict):
+    report = judge_submission(code, BAEKJOON_PROBLEM)
+
+    assert report.mode == "stdin"
+    assert len(report.results) == 2
+    assert report.verdict == verdict
+
+
+def test_judge_runtime_error_reports_line():
+    report = judge_submission("a, b = map(int, input().split())\nprint(a // 0)", BAEKJOON_PROBLEM)
+
+    assert "ZeroDivisionError" in report.failures[0].error
+    assert "2" in report.summary()
+
+
+def test_judge_function_any_order():
+    code = (
+        "class Solution:\n"
+        "    def intersection(self, nums1, nums2):\n"
+        "        return list(set(nums1) & set(nums2))\n"
+    )
+    report = judge_submission(code, LEETCODE_PROBLEM)
+
+    assert report.entry == "Solution.intersection"
+    assert report.verdict == VERDICT_AC
+    assert report.passed == 2
+
+
+def test_judge_function_wrong_answer():
+    code = "def intersection(nums1, nums2):\n    return nums1\n"
+    report = judge_submission(code, LEETCODE_PROBLEM)
+
+    assert report.verdict == VERDICT_WA
+
+
+def test_judge_without_examples_returns_empty_report():
+    report = judge_submission("print(1)", "예제가 없는 문제")
+
+    assert report.results == []
+    assert report.verdict is None
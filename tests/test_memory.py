@@ -0,0 +1,71 @@
+"""토큰 예산 메모리 압축 테스트 (요약 모델 없이 로컬 요약 사용)"""
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from coding_test_helper.memory import TokenBudgetMemory, estimate_message_tokens, estimate_tokens
+
+
+def long_code(lines: int = 10) -> str:
+    body = "\n".join(f"    total += {i}" for i in range(lines))
+    return f"```python\ndef solve():\n{body}\n```"
+
+
+def test_estimate_tokens_counts_utf8_bytes():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("가나다라") == 3
+
+
+def test_long_code_blocks_are_replaced_by_hash_reference():
+    memory = TokenBudgetMemory()
+    memory.save_context({"input": f"리뷰해줘\n{long_code()}"}, {"output": "좋아요"})
+
+    saved = memory.chat_memory.messages[0].content
+    assert saved.startswith("리뷰해줘\n[코드 python #")
+    assert "total += 3" not in saved
+    (code,) = memory.code_refs.values()
+    assert "total += 3" in code
+
+
+def test_short_code_blocks_are_kept():
+    memory = TokenBudgetMemory()
+    memory.save_context({"input": "```python\nprint(1)\n```"}, {"output": "ok"})
+
+    assert memory.chat_memory.messages[0].content == "```python\nprint(1)\n```"
+    assert memory.code_refs == {}
+
+
+def test_old_turns_are_folded_into_summary_by_turn_count():
+    memory = TokenBudgetMemory(max_recent_turns=2, max_token_limit=10_000)
+    for index in range(4):
+        memory.save_context({"input": f"질문 {index}"}, {"output": f"# 답변 {index}\n자세한 내용"})
+
+    assert [message.content for message in memory.chat_memory.messages] == [
+        "질문 2", "# 답변 2\n자세한 내용", "질문 3", "# 답변 3\n자세한 내용",
+    ]
+    assert memory.summary.splitlines() == [
+        "- 사용자: 질문 0", "- 도우미: 답변 0", "- 사용자: 질문 1", "- 도우미: 답변 1",
+    ]
+
+
+def test_memory_stays_within_token_budget():
+    memory = TokenBudgetMemory(max_recent_turns=50, max_token_limit=200)
+    for index in range(20):
+        memory.save_context({"input": f"질문 {index} " + "내용 " * 20}, {"output": f"답변 {index} " + "설명 " * 20})
+
+    messages = memory.load_memory_variables({})["chat_history"]
+    assert estimate_message_tokens(messages) <= 200 + 8
+    assert memory.summary
+    assert messages[0].content.startswith("[이전 대화 요약]")
+    assert memory.last_memory_tokens == estimate_message_tokens(messages)
+
+
+def test_summary_is_prepended_as_pair_when_no_recent_human_message():
+    memory = TokenBudgetMemory()
+    memory.summary = "- 사용자: 질문"
+
+    messages = memory.load_memory_variables({})["chat_history"]
+
+    assert isinstance(messages[0], HumanMessage) and isinstance(messages[1], AIMessage)
+    memory.clear()
+    assert memory.summary == "" and memory.load_memory_variables({})["chat_history"] == []
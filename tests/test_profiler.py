@@ -0,0 +1,62 @@
+"""실측 프로파일러의 복잡도 맞춤/제약 조건 파싱 테스트 (자식 프로세스 실행 없음)"""
+
+import math
+
+import pytest
+
+from coding_test_helper.profiler import find_entry, fit_complexity, parse_max_n, parse_time_limit, project
+
+NS = [16 * 2 ** i for i in range(8)]
+
+
+@pytest.mark.parametrize("name, growth", [
+    ("O(1)", lambda n: 1.0),
+    ("O(n)", lambda n: n),
+    ("O(n log n)", lambda n: n * math.log2(n)),
+    ("O(n^2)", lambda n: n ** 2),
+])
+def test_fit_recovers_growth_class(name, growth):
+    seconds = [2e-4 + 1e-7 * growth(n) for n in NS]
+    fitted, _, error = fit_complexity(NS, seconds)
+    assert fitted == name
+    assert error < 0.05
+
+
+def test_fit_tolerates_noise_and_prefers_simpler_class():
+    noise = [1.03, 0.97, 1.02, 0.98, 1.01, 0.99, 1.02, 0.98]
+    seconds = [1e-6 * n * factor for n, factor in zip(NS, noise)]
+    assert fit_complexity(NS, seconds)[0] == "O(n)"
+
+
+def test_exponential_only_for_small_n():
+    small = [4, 6, 8, 10, 12, 14]
+    assert fit_complexity(small, [1e-6 * 2 ** n for n in small])[0] == "O(2^n)"
+    assert fit_complexity(NS, [1e-9 * n ** 3 for n in NS])[0] == "O(n^3)"
+
+
+def test_project_extrapolates_fitted_curve():
+    assert project("O(n)", (1e-6, 0.0), 100_000) == pytest.approx(0.1)
+    assert project("O(1)", (0.0, 0.5), 10 ** 9) == 0.5
+    assert project("O(2^n)", (1.0, 0.0), 100_000) == math.inf
+
+
+def test_parse_max_n_ignores_value_ranges():
+    problem = "제약: 1 <= nums.length <= 10^5\n-10^9 <= nums[i] <= 10^9\nN ≤ 2 × 10^3"
+    assert parse_max_n(problem) == 100_000
+    assert parse_max_n("1 ≤ N ≤ 100,000") == 100_000
+    assert parse_max_n("제약 없음") is None
+
+
+def test_parse_time_limit():
+    assert parse_time_limit("시간 제한: 0.5초\n메모리 제한 256MB") == 0.5
+    assert parse_time_limit("시간 제한 2 초") == 2.0
+    assert parse_time_limit("") is None
+
+
+def test_find_entry():
+    assert find_entry("n = int(input())\nprint(n)") == ("stdin", None)
+    assert find_entry("print(1)") == ("stdin", None)
+    assert find_entry("class Solution:\n    def _h(self): pass\n    def twoSum(self, nums): pass") == (
+        "function", "Solution.twoSum")
+    assert find_entry("def helper(x): return x\ndef answer(nums): return helper(nums)") == ("function", "answer")
+    assert find_entry("def solve(n): pass\ndef other(): pass") == ("function", "solve")
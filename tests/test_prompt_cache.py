@@ -0,0 +1,36 @@
+"""프롬프트 캐시 표시 조건 테스트"""
+
+from langchain_core.tools import Tool
+
+from coding_test_helper.prompt_cache import (
+    MIN_CACHEABLE_TOKENS,
+    TOOL_USE_SYSTEM_TOKENS,
+    cacheable_system_message,
+    cacheable_text,
+    estimate_tool_tokens,
+)
+
+
+def test_short_text_is_not_marked():
+    assert cacheable_text("짧은 시스템 프롬프트") == "짧은 시스템 프롬프트"
+
+
+def test_long_text_is_marked():
+    text = "a" * (MIN_CACHEABLE_TOKENS * 4)
+    (block,) = cacheable_text(text)
+    assert block["text"] == text
+    assert block["cache_control"] == {"type": "ephemeral"}
+
+
+def test_tool_schemas_count_toward_prefix_length():
+    text = "a" * ((MIN_CACHEABLE_TOKENS - 100) * 4)
+    tools = [Tool(name="analyze", func=lambda x: x, description="문제 분석")]
+
+    assert estimate_tool_tokens(tools) > TOOL_USE_SYSTEM_TOKENS
+    assert isinstance(cacheable_system_message(text).content, str)
+    assert isinstance(cacheable_system_message(text, tools=tools).content, list)
+
+
+def test_disabled_caching_never_marks(monkeypatch):
+    monkeypatch.setenv("CODING_TEST_HELPER_PROMPT_CACHE", "0")
+    assert cacheable_text("a" * (MIN_CACHEABLE_TOKENS * 8)) == "a" * (MIN_CACHEABLE_TOKENS * 8)
@@ -0,0 +1,62 @@
+"""요청 라우터 의도 결정 테스트"""
+
+from coding_test_helper.router import (
+    INTENT_AGENT,
+    INTENT_ANALYZE,
+    INTENT_HINT,
+    INTENT_REVIEW,
+    detect_hint_type,
+    route_request,
+    split_code,
+)
+
+
+def test_split_code_prefers_fenced_blocks():
+    code, rest = split_code("이 코드 리뷰해줘\n```python\ndef f(x):\n    return x\n```\n시간 초과가 나요")
+
+    assert code == "def f(x):\n    return x"
+    assert rest == "이 코드 리뷰해줘\n\n시간 초과가 나요"
+
+
+def test_split_code_detects_unfenced_code_lines():
+    code, rest = split_code("리뷰 부탁해요\ndef solve(n):\n    total = 0\n    return total")
+
+    assert code.startswith("def solve(n):")
+    assert rest == "리뷰 부탁해요"
+    assert split_code("그냥 질문입니다") == ("", "그냥 질문입니다")
+
+
+def test_review_request_with_code_bypasses_agent():
+    decision = route_request("내 코드 리뷰해줘\n```\nfor i in range(n):\n    print(i)\n```")
+
+    assert decision.intent == INTENT_REVIEW
+    assert decision.bypasses_agent
+    assert decision.tool_input["code"] == "for i in range(n):\n    print(i)"
+
+
+def test_review_request_without_code_goes_to_agent():
+    assert route_request("코드 리뷰 해줄 수 있어?").intent == INTENT_AGENT
+
+
+def test_hint_request_detects_hint_type():
+    decision = route_request("힌트 주세요, 계속 런타임 에러가 나요")
+
+    assert decision.intent == INTENT_HINT
+    assert decision.tool_input["hint_type"] == "debugging"
+    assert detect_hint_type("어떤 알고리즘을 써야 할까") == "algorithm"
+    assert detect_hint_type("다음에 뭘 하죠") == "next_step"
+
+
+def test_analyze_request():
+    decision = route_request("이 문제 분석해줘: 배열에서 두 수의 합이 target인 쌍을 찾기")
+
+    assert decision.intent == INTENT_ANALYZE
+    assert decision.tool_input == {"problem_description": "이 문제 분석해줘: 배열에서 두 수의 합이 target인 쌍을 찾기"}
+
+
+def test_ambiguous_or_empty_requests_go_to_agent():
+    assert route_request("").intent == INTENT_AGENT
+    assert route_request("안녕하세요").intent == INTENT_AGENT
+    # 점수가 기준보다 낮거나 두 의도 점수가 같으면 Agent가 판단
+    assert route_request("분석 좀").intent == INTENT_AGENT
+    assert route_request("힌트 주고 분석해").intent == INTENT_AGENT
@@ -0,0 +1,234 @@
+"""RequestScheduler 슬롯 반환 테스트 (네트워크 없이 가짜 전송 계층 사용)"""
+
+import io
+import json
+import time
+import base64
+import asyncio
+import threading
+
+import httpx
+import pytest
+from PIL import Image
+
+from coding_test_helper.cassette import CassetteMissError
+from coding_test_helper.scheduler import (
+    PRIORITY_INTERACTIVE,
+    PRIORITY_PREFETCH,
+    AsyncScheduledTransport,
+    PromotablePriority,
+    RequestScheduler,
+    ScheduledTransport,
+    estimate_request_tokens,
+)
+
+
+def make_scheduler(**kwargs) -> RequestScheduler:
+    options = dict(max_concurrency=1, requests_per_minute=6000, tokens_per_minute=10 ** 9,
+                   max_retries=0, base_delay=0.0, max_delay=0.0)
+    options.update(kwargs)
+    return RequestScheduler(**options)
+
+
+def make_request(content: bytes = b"{}") -> httpx.Request:
+    return httpx.Request("POST", "http://test/v1/messages", content=content)
+
+
+class ChunkStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """실제 서버 응답처럼 아직 읽지 않은 본문 (content=로 만든 응답은 생성 시 바로 읽혀 닫힘)"""
+
+    def __iter__(self):
+        yield b"ok"
+
+    async def __aiter__(self):
+        yield b"ok"
+
+
+class RaisingTransport(httpx.BaseTransport):
+    def __init__(self, error: BaseException):
+        self.error = error
+
+    def handle_request(self, request):
+        raise self.error
+
+
+class AsyncSlowTransport(httpx.AsyncBaseTransport):
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def handle_async_request(self, request):
+        await asyncio.sleep(self.delay)
+        return httpx.Response(200, stream=ChunkStream())
+
+
+def in_flight(scheduler: RequestScheduler) -> int:
+    return scheduler.get_metrics()["in_flight"]
+
+
+@pytest.mark.parametrize("error", [
+    httpx.ConnectError("connection refused"),
+    CassetteMissError("no recording"),
+    KeyError("unexpected"),
+    KeyboardInterrupt(),
+])
+def test_sync_releases_slot_on_inner_exception(error):
+    scheduler = make_scheduler()
+    transport = ScheduledTransport(RaisingTransport(error), scheduler)
+
+    with pytest.raises(type(error)):
+        transport.handle_request(make_request())
+
+    assert in_flight(scheduler) == 0
+    assert scheduler.stats["failed"] == 1
+
+
+def test_sync_retries_release_every_attempt():
+    scheduler = make_scheduler(max_retries=2)
+    transport = ScheduledTransport(RaisingTransport(httpx.ReadTimeout("slow")), scheduler)
+
+    with pytest.raises(httpx.ReadTimeout):
+        transport.handle_request(make_request())
+
+    assert in_flight(scheduler) == 0
+    assert scheduler.stats["admitted"] == 3
+    assert scheduler.stats["retries"] == 2
+
+
+def test_sync_response_holds_slot_until_closed():
+    scheduler = make_scheduler()
+    inner = httpx.MockTransport(lambda request: httpx.Response(200, stream=ChunkStream()))
+    with httpx.Client(transport=ScheduledTransport(inner, scheduler)) as client:
+        with client.stream("POST", "http://test/v1/messages", content=b"{}") as response:
+            assert in_flight(scheduler) == 1
+            response.read()
+    assert in_flight(scheduler) == 0
+    assert scheduler.stats["completed"] == 1
+
+
+def test_async_releases_slot_on_inner_exception():
+    scheduler = make_scheduler()
+
+    class Raising(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request):
+            raise CassetteMissError("no recording")
+
+    with pytest.raises(CassetteMissError):
+        asyncio.run(AsyncScheduledTransport(Raising(), scheduler).handle_async_request(make_request()))
+    assert in_flight(scheduler) == 0
+
+
+def test_async_cancel_during_request_releases_slot():
+    scheduler = make_scheduler()
+    transport = AsyncScheduledTransport(AsyncSlowTransport(10), scheduler)
+
+    async def scenario():
+        task = asyncio.create_task(transport.handle_async_request(make_request()))
+        await asyncio.sleep(0.05)
+        assert in_flight(scheduler) == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+    assert in_flight(scheduler) == 0
+
+
+def test_async_cancel_while_queued_releases_slot_once_acquired():
+    scheduler = make_scheduler()
+    transport = AsyncScheduledTransport(AsyncSlowTransport(0.2), scheduler)
+
+    async def scenario():
+        first = asyncio.create_task(transport.handle_async_request(make_request()))
+        await asyncio.sleep(0.05)
+        queued = asyncio.create_task(transport.handle_async_request(make_request()))
+        await asyncio.sleep(0.05)
+        assert scheduler.get_metrics()["queue_depth"] == 1
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        response = await first
+        await response.aread()
+
+    asyncio.run(scenario())
+
+    # 취소된 요청의 대기 스레드가 슬롯을 받자마자 돌려주는지 확인
+    deadline = time.monotonic() + 2
+    while scheduler.stats["admitted"] < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert scheduler.stats["admitted"] == 2
+    assert in_flight(scheduler) == 0
+
+
+def test_concurrency_limit_is_respected():
+    scheduler = make_scheduler(max_concurrency=2)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return httpx.Response(200, stream=ChunkStream())
+
+    client = httpx.Client(transport=ScheduledTransport(httpx.MockTransport(handler), scheduler))
+    threads = [threading.Thread(target=client.post, args=("http://test/v1/messages",), kwargs={"content": b"{}"})
+               for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    client.close()
+
+    assert peak[0] <= 2
+    assert in_flight(scheduler) == 0
+    assert scheduler.stats["completed"] == 6
+
+
+def test_promoted_request_overtakes_later_requests():
+    scheduler = make_scheduler()
+    scheduler.acquire()
+    order = []
+
+    def wait(name, priority, promotable=None):
+        scheduler.acquire(priority, promotable=promotable)
+        order.append(name)
+        scheduler.release()
+
+    prefetch = PromotablePriority(PRIORITY_PREFETCH)
+    threads = [threading.Thread(target=wait, args=("prefetch", PRIORITY_PREFETCH, prefetch), daemon=True)]
+    threads[0].start()
+    while scheduler.get_metrics()["queue_depth"] < 1:
+        time.sleep(0.001)
+    threads.append(threading.Thread(target=wait, args=("interactive", PRIORITY_INTERACTIVE), daemon=True))
+    threads[1].start()
+    while scheduler.get_metrics()["queue_depth"] < 2:
+        time.sleep(0.001)
+
+    # 승격하면 먼저 도착한 prefetch 요청이 나중의 대화형 요청보다 앞섬
+    prefetch.promote(PRIORITY_INTERACTIVE)
+    assert scheduler.get_metrics()["queue_depth_by_priority"]["interactive"] == 2
+    scheduler.release()
+    for thread in threads:
+        thread.join(5)
+
+    assert order == ["prefetch", "interactive"]
+    assert in_flight(scheduler) == 0
+
+
+def test_estimate_request_tokens_counts_images_by_size():
+    buffer = io.BytesIO()
+    Image.effect_noise((300, 250), 64).save(buffer, format="PNG")
+    data = base64.b64encode(buffer.getvalue()).decode("ascii")
+    body = {"messages": [{"role": "user", "content": [
+        {"type": "image", "source": {"type": "base64", "media_type": "image/png", "data": data}},
+        {"type": "text", "text": "a" * 400},
+    ]}]}
+    content = json.dumps(body).encode()
+
+    tokens = estimate_request_tokens(make_request(content))
+
+    assert tokens == (len(content) - len(data)) // 4 + 100
+    assert tokens < len(content) // 4
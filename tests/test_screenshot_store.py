@@ -0,0 +1,27 @@
+"""백그라운드 스크린샷 저장 테스트"""
+
+from PIL import Image
+
+from coding_test_helper.screenshot_store import ScreenshotWriter
+
+
+def test_original_image_is_encoded_on_writer_thread(tmp_path):
+    writer = ScreenshotWriter(tmp_path)
+    original = Image.new("RGB", (1920, 1080), "white")
+
+    path = writer.save_image("screen.png", original)
+    assert writer.flush(5)
+    writer.close()
+
+    with Image.open(path) as saved:
+        assert saved.size == (1920, 1080)
+    assert writer.stats["written"] == 1
+    assert writer.stats["bytes"] == path.stat().st_size
+
+
+def test_bytes_are_written_as_is(tmp_path):
+    writer = ScreenshotWriter(tmp_path)
+    path = writer.save("raw.bin", b"abc")
+    writer.close()
+
+    assert path.read_bytes() == b"abc"
@@ -0,0 +1,118 @@
+"""SingleFlight 요청 병합/오류 전달 테스트"""
+
+import time
+import threading
+
+import pytest
+
+from coding_test_helper.singleflight import SingleFlight
+
+
+def wait_until(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 초과"
+        time.sleep(0.001)
+
+
+def run_concurrently(flight: SingleFlight, key: str, func, followers: int):
+    """leader 한 개가 func 안에서 기다리는 동안 follower들을 같은 키로 호출"""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do(key, func, timeout=5))
+        except Exception as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    threads = [threading.Thread(target=call) for _ in range(followers)]
+    for thread in threads:
+        thread.start()
+    # follower들이 모두 leader의 Future를 기다리기 시작할 때까지 대기
+    wait_until(lambda: flight.get_stats()["coalesced"] >= followers)
+    release.set()
+    for thread in [leader] + threads:
+        thread.join(5)
+    return results, errors
+
+
+started = threading.Event()
+release = threading.Event()
+
+
+@pytest.fixture(autouse=True)
+def reset_events():
+    started.clear()
+    release.clear()
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def func():
+        calls.append(True)
+        started.set()
+        release.wait(5)
+        return "answer"
+
+    results, errors = run_concurrently(flight, "key", func, followers=4)
+
+    assert calls == [True]
+    assert results == ["answer"] * 5
+    assert errors == []
+    assert flight.get_stats() == {"leaders": 1, "coalesced": 4, "shared_errors": 0, "in_flight": 0}
+
+
+def test_error_is_propagated_to_followers_and_not_cached():
+    flight = SingleFlight()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise ValueError("api error")
+
+    results, errors = run_concurrently(flight, "key", failing, followers=2)
+
+    assert results == []
+    assert len(errors) == 3 and all(isinstance(e, ValueError) for e in errors)
+    assert flight.get_stats()["shared_errors"] == 2
+    # 실패는 공유되지 않으므로 다음 호출은 새로 실행
+    assert flight.do("key", lambda: "retried") == "retried"
+
+
+def test_different_keys_run_independently():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    assert flight.get_stats()["leaders"] == 2
+    assert flight.in_flight() == 0
+
+
+def test_interrupted_leader_lets_follower_call_again():
+    flight = SingleFlight()
+    follower_result = []
+
+    def interrupted():
+        started.set()
+        release.wait(5)
+        raise KeyboardInterrupt
+
+    def leader():
+        with pytest.raises(KeyboardInterrupt):
+            flight.do("key", interrupted)
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    started.wait(5)
+    follower = threading.Thread(target=lambda: follower_result.append(flight.do("key", lambda: "own call", timeout=5)))
+    follower.start()
+    wait_until(lambda: flight.get_stats()["coalesced"] >= 1)
+    release.set()
+    thread.join(5)
+    follower.join(5)
+
+    assert follower_result == ["own call"]